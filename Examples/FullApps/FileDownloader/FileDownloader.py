@@ -13,7 +13,7 @@ from TkZero.Entry import Entry
 from TkZero.Frame import Frame
 from TkZero.Label import Label
 from TkZero.MainWindow import MainWindow
-from TkZero.Progressbar import Progressbar
+from TkZero.Progressbar import Progressbar, ProgressReporter
 
 # Create a main window
 root = MainWindow()
@@ -73,6 +73,13 @@ def download():
         show_error(root, title="File Downloader: Error!", message=f"The path:\n{path_entry.value}\ndoes not exist!")
         return
     url = url_entry.value
+    # Get the name of the file from splitting the URL
+    file_path = Path(path_entry.value) / url.split("/")[-1]
+    # Warn the user before overwriting the file if it exists
+    if file_path.exists():
+        if not ask_ok_or_cancel(root, title="File Downloader: Confirm", message=f"{file_path}\nexists! Continue? "
+                                                                                f"(Will overwrite if continue)"):
+            return
     # Make a custom dialog
     dlg = CustomDialog(root)
     dlg.title = f"File Downloader: Downloading {url}..."
@@ -82,74 +89,73 @@ def download():
     # Make a status progressbar
     dlg_progressbar = Progressbar(dlg, length=200)
     dlg_progressbar.grid(row=1, column=0, padx=1, pady=1, sticky=tk.NW + tk.E)
+    # Make a progress reporter that the download thread can feed. It redraws the progressbar at most 30 times a
+    # second, no matter how often the download thread reports.
+    reporter = ProgressReporter(dlg_progressbar, template="{percent:.0f}% ({eta} left)")
     # Make a status label that shows what we are are doing
     dlg_status = Label(dlg)
     dlg_status.grid(row=2, column=0, padx=1, pady=1, sticky=tk.NW)
     # Make sure the user can't interact with teh main window
     dlg.grab_focus()
     # Call the start_download function in a daemon thread
-    Thread(target=start_download, args=(dlg, dlg_status, dlg_progressbar, url), daemon=True).start()
+    Thread(target=start_download, args=(dlg, dlg_status, reporter, url, file_path), daemon=True).start()
     dlg.wait_till_destroyed()
+    reporter.close()
+
+
+# Create a function to set the text of a label - it will be posted to the main window from the download thread
+def set_status(status_label: Label, text: str):
+    status_label.text = text
+
+
+# Create a function to show an error and close the dialog - it will be posted to the main window from the download
+# thread
+def fail(dlg: CustomDialog, message: str, detail: str = None):
+    show_error(root, title="File Downloader: Error!", message=message, detail=detail)
+    dlg.close()
 
 
 # Create a function to actually start the download
-def start_download(dlg: CustomDialog, status_label: Label, progress_bar: Progressbar, url: str):
+# This runs in another thread, so it must never touch the widgets directly! Instead, it uses root.post to run
+# functions on the main thread.
+def start_download(dlg: CustomDialog, status_label: Label, reporter: ProgressReporter, url: str, file_path: Path):
     # Set the status text of the status label
-    status_label.text = "Connecting to server..."
+    root.post(set_status, status_label, "Connecting to server...", key="status")
     # Try to get a response
     try:
         response = requests.get(url, stream=True)
     except HTTPError as err:
         # Show error and leave
-        show_error(root, title="File Downloader: Error!", message="A HTTP(S) error occurred!",
-                   detail=f"Exception: {err}")
-        dlg.close()
+        root.post(fail, dlg, "A HTTP(S) error occurred!", f"Exception: {err}")
         return
     except Exception as err:
-        show_error(root, title="File Downloader: Error!", message="An error occurred!",
-                   detail=f"Exception: {err}")
-        dlg.close()
+        root.post(fail, dlg, "An error occurred!", f"Exception: {err}")
         return
     # Set status text
-    status_label.text = f"Connected! Status code is {response.status_code}."
+    root.post(set_status, status_label, f"Connected! Status code is {response.status_code}.", key="status")
     # Show error if status code is not 200
     if response.status_code != 200:
-        show_error(root, title="File Downloader: Error!", message="Server did not return 200!",
-                   detail=f"Status code returned: {response.status_code}")
-        dlg.close()
+        root.post(fail, dlg, "Server did not return 200!", f"Status code returned: {response.status_code}")
         return
     # The content length is how big the file is (usually)
     file_size = int(response.headers.get("content-length", 0))
-    progress_bar.maximum = file_size
-    progress_bar.value = 0
+    reporter.total = file_size
+    root.post(set_status, status_label, f"Downloading {round(file_size / 1024, 2)} KiB...", key="status")
     # In bytes
     block_size = 1024
-    # Get the name of the file from splitting the URL
-    file_name = url.split("/")[-1]
-    file_path = Path(path_entry.value) / file_name
-    # Warn the user before overwriting the file if it exists
-    if file_path.exists():
-        if not ask_ok_or_cancel(root, title="File Downloader: Confirm", message=f"{file_path}\nexists! Continue? "
-                                                                                f"(Will overwrite if continue)"):
-            dlg.close()
-            return
     # Open the file path
     with file_path.open(mode="wb") as file:
         # Iterate over all the data blocks
         for data in response.iter_content(block_size):
-            # Update the progress bar
-            progress_bar.value += len(data)
-            # Update the status text
-            status_label.text = f"Downloaded " \
-                                f"{round(progress_bar.value / 1024, 2)} / " \
-                                f"{round(file_size / 1024, 2)} KiB"
+            # Report the progress, this is cheap and safe to do from this thread
+            reporter.advance(len(data))
             # Write the data to the file
             file.write(data)
     # Show the user that it finished downloading
-    show_info(root, title="File Downloader: Info", message=f"File finished downloading! You can find it at:\n"
-                                                           f"{file_path}")
+    root.post(show_info, root, "File Downloader: Info", f"File finished downloading! You can find it at:\n"
+                                                        f"{file_path}")
     # Destroy the dialog
-    dlg.close()
+    root.post(dlg.close)
 
 
 # Create a button to start the download process
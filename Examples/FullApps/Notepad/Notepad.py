@@ -3,6 +3,8 @@
 # an option to control word wrapping, a status bar, and more. Check out https://tkdocs.com/tutorial/text.html for a
 # detailed explanation on the text widget.
 
+import locale
+
 from TkZero import Dialog
 from TkZero.MainWindow import MainWindow
 from TkZero.Menu import Menu, MenuCascade, MenuCommand, MenuSeparator
@@ -21,11 +23,25 @@ modified = False
 saved_doc = False
 # Where to save the currently opened document. None if this document has never been saved.
 save_location = None
+# The file that is still being loaded. None if nothing is loading.
+loading_file = None
+
+# The encoding to open and save files with. Use the same one both ways, otherwise saving would change the encoding of
+# the file!
+encoding = locale.getpreferredencoding(False)
 
 # Create the main menus
 menu_bar = Menu(root, is_menubar=True)
 
 
+# Create a function to close the file that is still loading, if any
+def stop_loading() -> None:
+    global loading_file
+    if loading_file is not None:
+        loading_file.close()
+        loading_file = None
+
+
 # Create a function to open a new document
 def file_new() -> None:
     # Yes, global variables aren't pretty but for the sake of simplicity we will not use a class
@@ -39,7 +55,9 @@ def file_new() -> None:
             file_save()
         elif result:
             pass
+    # Setting the text cancels a load that is still running
     text_area.text = ""
+    stop_loading()
     root.title = "Untitled - Notepad"
     modified = False
     saved_doc = False
@@ -49,7 +67,7 @@ def file_new() -> None:
 # Create a function to open a new document
 def file_open() -> None:
     # Yes, global variables aren't pretty but for the sake of simplicity we will not use a class
-    global modified, saved_doc, save_location
+    global modified, saved_doc, save_location, loading_file
     path = Dialog.open_file(title="Please select a text file")
     if path is None:
         return
@@ -62,23 +80,43 @@ def file_open() -> None:
             file_save()
         elif result:
             pass
-    modified = False
     saved_doc = True
     save_location = path
-    root.title = f"{path.name} - Notepad"
-    text_area.text = path.read_text()
+    root.title = f"Loading {path.name} - Notepad"
+    file = path.open(encoding=encoding)
+
+    # Create a function that is called when the file is loaded
+    def loaded(error) -> None:
+        global modified, loading_file
+        file.close()
+        loading_file = None
+        if error is not None:
+            Dialog.show_error(root, title="Notepad: Error", message=f"Could not open {path.name}!", detail=str(error))
+        modified = False
+        root.title = f"{path.name} - Notepad"
+
+    # Load the file a bit at a time, so big files don't freeze the window. This cancels the last load if it is still
+    # running.
+    text_area.load_stream(file, on_done=loaded)
+    stop_loading()
+    loading_file = file
 
 
 # Create a function to save the currently opened document
 def file_save() -> None:
     # Yes, global variables aren't pretty but for the sake of simplicity we will not use a class
     global modified, saved_doc, save_location
+    # Only part of the file is there while it is loading
+    if text_area.loading:
+        Dialog.show_info(root, title="Notepad: Loading", message="Please wait for the file to finish loading!")
+        return
     if save_location is None:
         path = Dialog.save_file(title="Please select a location to save")
         if path is None:
             return
         save_location = path
-    save_location.write_text(text_area.text)
+    # Write the text a bit at a time instead of copying all of it into one string first
+    text_area.save_to(save_location, encoding=encoding)
     modified = False
     saved_doc = True
     root.title = f"{save_location.name} - Notepad"
@@ -0,0 +1,84 @@
+from time import perf_counter
+
+from TkZero.Highlight import Highlighter, RegexLexer
+from TkZero.MainWindow import MainWindow
+from TkZero.Scrollbar import Scrollbar
+from TkZero.Text import Text
+
+# Make the main window and give it a title
+root = MainWindow()
+root.title = "Highlight Example"
+
+# Make a big text box with a scrollbar
+text_box = Text(root, width=80, height=25)
+text_box.grid(row=0, column=0)
+Scrollbar(root, widget=text_box).grid(row=0, column=1)
+
+# Make a lexer for a small config file language
+lexer = RegexLexer(
+    {
+        "root": [
+            (r"#.*", "comment", None),
+            (r"^\s*\[[^\]]*\]", "section", None),
+            (r"^\s*[\w.]+(?=\s*=)", "key", None),
+            (r'"', "string", "string"),
+            (r"\b\d+\b", "number", None),
+        ],
+        "string": [
+            (r'\\.|[^"\\]+', "string", None),
+            (r'"', "string", "#pop"),
+        ],
+    }
+)
+
+# Fill the text box with 100,000 lines
+lines = []
+for i in range(10_000):
+    lines.append(f"[section{i}]")
+    lines.append(f"# Settings for section {i}")
+    for j in range(8):
+        lines.append(f'key{j} = "value {j}" {i * j}')
+text_box.text = "\n".join(lines)
+
+# Highlight it and wait until every line is done so the benchmark below only
+# measures the work done per keystroke
+highlighter = Highlighter(
+    text_box,
+    lexer,
+    styles={
+        "comment": {"foreground": "gray"},
+        "section": {"foreground": "purple"},
+        "key": {"foreground": "blue"},
+        "string": {"foreground": "green"},
+        "number": {"foreground": "orange"},
+    },
+)
+start = perf_counter()
+highlighter.flush()
+print(f"Highlighted {len(lines):,} lines in {perf_counter() - start:.2f}s")
+
+
+# Type a character at the start, middle and end of the text and time how long
+# it takes to highlight again, which should be about the same for all of them
+def benchmark():
+    for line in (1, len(lines) // 2, len(lines)):
+        times = []
+        for _ in range(100):
+            start = perf_counter()
+            text_box.insert(f"{line}.end", "x")
+            highlighter.flush()
+            times.append(perf_counter() - start)
+        print(
+            f"Typing on line {line:,}: {sum(times) / len(times) * 1000:.3f}ms "
+            f"per keystroke"
+        )
+    # Typing a quote changes the state of every line after it, which is the
+    # worst case, so that is highlighted in the background instead
+    text_box.insert("1.0", '"')
+    print("Opened a string on line 1, the rest is highlighted while idle")
+
+
+root.after(100, benchmark)
+
+# Start the event loop
+root.mainloop()
@@ -0,0 +1,49 @@
+import tkinter as tk
+
+from TkZero import Dialog
+from TkZero.Button import Button
+from TkZero.Label import Label
+from TkZero.LargeFileView import LargeFileView
+from TkZero.MainWindow import MainWindow
+from TkZero.Scrollbar import Scrollbar, OrientModes
+
+# Make the main window and give it a title
+root = MainWindow()
+root.title = "Large File View Example"
+
+# Make a view for the file with scrollbars in both directions
+view = LargeFileView(root, width=100, height=30)
+view.grid(row=0, column=0, columnspan=2)
+Scrollbar(root, widget=view).grid(row=0, column=2, sticky=tk.NS)
+Scrollbar(root, widget=view, orientation=OrientModes.Horizontal).grid(row=1, column=0, columnspan=2, sticky=tk.EW)
+
+# Make a label to show how many lines there are
+status = Label(root)
+status.grid(row=2, column=1, sticky=tk.E)
+
+
+# Show how many lines have been found while the file is indexed
+def update_status():
+    if view.path is None:
+        status.text = "No file open"
+        return
+    status.text = f"{view.line_count:,} lines" + ("" if view.indexed else " (indexing...)")
+    if not view.indexed:
+        root.after(250, update_status)
+
+
+# Make a function to pick a file to open, no matter how big it is
+def open_file():
+    path = Dialog.open_file(title="Please select a file")
+    if path is None:
+        return
+    view.open(path)
+    update_status()
+
+
+# Make a button to open a file
+Button(root, text="Open file", command=open_file).grid(row=2, column=0, sticky=tk.W)
+update_status()
+
+# Start the mainloop like in Tkinter
+root.mainloop()
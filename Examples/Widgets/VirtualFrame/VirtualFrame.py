@@ -0,0 +1,54 @@
+import tkinter as tk
+
+from TkZero.Checkbutton import Checkbutton
+from TkZero.Entry import Entry
+from TkZero.Frame import Frame, VirtualFrame
+from TkZero.Label import Label
+from TkZero.MainWindow import MainWindow
+
+# Create the main window and set a title
+root = MainWindow()
+root.title = "Virtual Frame Example"
+
+# The data for 10,000 rows
+names = [f"Item {i}" for i in range(10_000)]
+checked = [False] * len(names)
+
+
+# Make a function that makes one row of widgets. Only enough rows to fill the
+# frame are made, no matter how many rows of data there are.
+def make_row(parent):
+    row = Frame(parent)
+    row.index = None
+    row.label = Label(row)
+    row.label.grid(row=0, column=0, padx=4)
+    row.entry = Entry(row)
+    row.entry.grid(row=0, column=1)
+    row.checkbutton = Checkbutton(row, text="Done")
+    row.checkbutton.grid(row=0, column=2)
+
+    # Save what was changed back into the data of the row that is shown
+    def save(_=None):
+        if row.index is not None:
+            names[row.index] = row.entry.value
+            checked[row.index] = row.checkbutton.value
+
+    row.entry.bind("<KeyRelease>", save)
+    row.checkbutton.configure(command=save)
+    return row
+
+
+# Make a function that shows a row of data in a row of widgets
+def bind_row(row, index):
+    row.index = index
+    row.label.text = f"#{index}"
+    row.entry.value = names[index]
+    row.checkbutton.value = checked[index]
+
+
+# Create the virtual frame
+virtual_frame = VirtualFrame(root, make_row=make_row, bind_row=bind_row, row_count=len(names), width=400, height=300)
+virtual_frame.grid(row=0, column=0, sticky=tk.NSEW)
+
+# Start the mainloop like in Tkinter
+root.mainloop()
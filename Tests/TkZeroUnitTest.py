@@ -27,7 +27,8 @@ class TkTestCase(unittest.TestCase):
             else:
                 break
         self.root.update()
-        self.root.after(ms=10_000, func=self.closeWindow)
+        self.root.scheduler.call_later(10_000, self.closeWindow,
+                                       pausable=False)
 
     def tearDown(self) -> None:
         """
@@ -0,0 +1,83 @@
+"""
+Test the TkZero.Batch module
+"""
+
+import unittest
+
+from TkZero import Batch
+from TkZero.Button import Button
+from TkZero.Entry import Entry
+from TkZero.Label import Label
+from TkZero.Progressbar import Progressbar
+from TkZeroUnitTest import TkTestCase
+
+
+class BatchTest(TkTestCase):
+    def test_not_batching(self):
+        l = Label(self.root, text="Foo")
+        l.grid(row=0, column=0)
+        self.assertFalse(Batch.is_batching(self.root))
+        l.text = "Bar"
+        self.assertEqual(l.cget("text"), "Bar")
+
+    def test_batch(self):
+        l = Label(self.root, text="Foo")
+        l.grid(row=0, column=0)
+        p = Progressbar(self.root, length=200)
+        p.grid(row=1, column=0)
+        with Batch.batch(self.root):
+            self.assertTrue(Batch.is_batching(self.root))
+            for i in range(10):
+                l.text = f"Text {i}"
+                p.value = i
+            self.assertEqual(l.text, "Text 9")
+            self.assertEqual(p.value, 9)
+            self.assertEqual(l.cget("text"), "Foo")
+        self.assertFalse(Batch.is_batching(self.root))
+        self.root.update()
+        self.assertEqual(l.cget("text"), "Text 9")
+        self.assertEqual(float(p["value"]), 9)
+
+    def test_global_mode(self):
+        b = Button(self.root, text="Foo")
+        b.grid(row=0, column=0)
+        e = Entry(self.root)
+        e.grid(row=1, column=0)
+        Batch.set_batching(self.root, True)
+        b.enabled = False
+        e.value = "Bar"
+        self.assertFalse(b.enabled)
+        self.assertEqual(e.value, "Bar")
+        self.assertEqual(e.get(), "")
+        Batch.flush(self.root)
+        self.assertEqual(e.get(), "Bar")
+        self.assertTrue(b.instate(["disabled"]))
+        b.text = "Baz"
+        Batch.set_batching(self.root, False)
+        self.assertEqual(b.cget("text"), "Baz")
+
+    def test_entry_state(self):
+        e = Entry(self.root)
+        e.grid(row=0, column=0)
+        with Batch.batch(self.root):
+            e.read_only = True
+            e.enabled = False
+            self.assertTrue(e.instate(["!readonly", "!disabled"]))
+        Batch.flush(self.root)
+        self.assertTrue(e.instate(["!readonly", "disabled"]))
+        with Batch.batch(self.root):
+            e.enabled = True
+            e.read_only = True
+        Batch.flush(self.root)
+        self.assertTrue(e.instate(["readonly", "!disabled"]))
+
+    def test_destroyed_before_flush(self):
+        l = Label(self.root, text="Foo")
+        with Batch.batch(self.root):
+            l.text = "Bar"
+        l.destroy()
+        self.root.update()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Test the TkZero.Diff module
+"""
+
+import random
+import unittest
+
+from TkZero.Diff import sequence_edits
+
+
+def apply_edits(old, new, edits):
+    result = list(old)
+    for _, i1, i2, j1, j2 in reversed(edits):
+        result[i1:i2] = new[j1:j2]
+    return result
+
+
+class DiffTest(unittest.TestCase):
+    def test_equal(self):
+        self.assertEqual(sequence_edits(["a", "b"], ["a", "b"]), [])
+
+    def test_append(self):
+        old = [str(i) for i in range(10_000)]
+        new = old + ["new"]
+        self.assertEqual(sequence_edits(old, new),
+                         [("insert", 10_000, 10_000, 10_000, 10_001)])
+
+    def test_delete(self):
+        self.assertEqual(sequence_edits(["a", "b", "c"], ["a", "c"]),
+                         [("delete", 1, 2, 1, 1)])
+
+    def test_random(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            old = [rng.choice("abcd") for _ in range(rng.randint(0, 12))]
+            new = [rng.choice("abcd") for _ in range(rng.randint(0, 12))]
+            self.assertEqual(apply_edits(old, new, sequence_edits(old, new)),
+                             new)
+
+
+if __name__ == "__main__":
+    unittest.main()
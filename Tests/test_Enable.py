@@ -0,0 +1,65 @@
+"""
+Test the TkZero.Enable module
+"""
+
+import unittest
+
+from TkZero.Button import Button
+from TkZero.Enable import enable_children
+from TkZero.Entry import Entry
+from TkZero.Frame import Frame, ScrollableFrame
+from TkZero.Label import Label
+from TkZero.Labelframe import Labelframe
+from TkZero.Notebook import Notebook, Tab
+from TkZero.Text import Text
+from TkZeroUnitTest import TkTestCase
+
+
+class EnableTest(TkTestCase):
+    def test_enable_children(self):
+        f = Frame(self.root)
+        f.grid(row=0, column=0)
+        inner = Labelframe(f, text="Inner")
+        inner.grid(row=0, column=0)
+        buttons = [Button(inner, text=str(i)) for i in range(100)]
+        entry = Entry(f)
+        text = Text(f)
+        self.root.update()
+        changed = enable_children(f, False)
+        self.assertEqual(len(changed), 103)
+        self.assertFalse(inner.enabled)
+        self.assertFalse(buttons[0].enabled)
+        self.assertTrue(buttons[0].instate(["disabled"]))
+        self.assertFalse(entry.enabled)
+        self.assertEqual(text.cget("state"), "disabled")
+        buttons[0].enabled = True
+        changed = enable_children(f, False)
+        self.assertEqual(changed, (str(inner), str(buttons[0])))
+        self.root.enabled = True
+        self.assertTrue(f.enabled)
+        self.assertTrue(buttons[0].enabled)
+        self.assertEqual(text.cget("state"), "normal")
+
+    def test_enabled_setters(self):
+        nb = Notebook(self.root)
+        nb.grid(row=0, column=0)
+        tab = Tab(nb)
+        nb.tabs = [tab]
+        nb.update_tabs()
+        scrollable = ScrollableFrame(self.root)
+        scrollable.grid(row=1, column=0)
+        label = Label(scrollable.frame)
+        self.root.update()
+        self.root.enabled = False
+        self.assertFalse(tab.enabled)
+        self.assertEqual(str(nb.tab(tab, "state")), "disabled")
+        self.assertFalse(scrollable.enabled)
+        self.assertFalse(label.enabled)
+        self.assertEqual(str(scrollable.canvas.cget("state")), "normal")
+        self.root.enabled = True
+        self.assertEqual(str(nb.tab(tab, "state")), "normal")
+        self.assertTrue(label.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
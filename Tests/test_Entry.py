@@ -44,6 +44,13 @@ class EntryTest(TkTestCase):
         self.root.update()
         self.assertEqual(type(e.hovering_over), bool)
 
+    def test_shared_context_menu(self):
+        first = Entry(self.root)
+        second = Entry(self.root)
+        self.assertIs(first._context_menu, second._context_menu)
+        self.assertIs(first._context_menu.target, first)
+        self.assertEqual(len(self.root.winfo_children()), 3)
+
     def test_right_click(self):
         # Also fails randomly in GitHub actions
         try:
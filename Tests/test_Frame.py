@@ -5,7 +5,7 @@ Test the TkZero.Frame module
 import unittest
 
 from TkZero import Style
-from TkZero.Frame import Frame, ScrollableFrame
+from TkZero.Frame import Frame, ScrollableFrame, VirtualFrame
 from TkZero.Label import Label
 from TkZeroUnitTest import TkTestCase
 
@@ -106,6 +106,66 @@ class ScrollableFrameTest(TkTestCase):
         self.assertEqual(f.frame.cget("style"), "Test.TFrame")
         self.root.update()
 
+    def test_scrollregion(self):
+        f = ScrollableFrame(self.root)
+        f.grid(row=0, column=0)
+        for i in range(200):
+            Label(f.frame, text=f"Label {i}").grid(row=i, column=0)
+        self.root.update()
+        self.assertEqual(
+            [int(n) for n in f.canvas.cget("scrollregion").split()],
+            [0, 0, f.frame.winfo_reqwidth(), f.frame.winfo_reqheight()])
+
+
+class VirtualFrameTest(TkTestCase):
+    def test_recycling(self):
+        bound = []
+
+        def make_row(parent):
+            return Label(parent)
+
+        def bind_row(row, index):
+            row.text = f"Row {index}"
+            bound.append(index)
+
+        f = VirtualFrame(self.root, make_row=make_row, bind_row=bind_row,
+                         row_count=10_000, row_height=20, height=200)
+        f.grid(row=0, column=0)
+        self.root.update()
+        self.assertLessEqual(len(f.rows), 12)
+        self.assertEqual(f.rows[0].text, "Row 0")
+        self.assertEqual(f.yview(), (0.0, 0.001))
+        bound.clear()
+        f.yview_scroll(1, "units")
+        self.assertEqual(bound, [12])
+        f.scroll_to(5000)
+        self.assertIn("Row 5000", [row.text for row in f.rows])
+        self.assertLessEqual(len(f.rows), 12)
+        f.row_count = 10
+        self.assertEqual(f.yview(), (0.0, 1.0))
+
+    def test_enabled(self):
+        parent = Frame(self.root)
+        parent.grid(row=0, column=0)
+        f = VirtualFrame(parent, make_row=lambda p: Label(p),
+                         bind_row=lambda row, index: None,
+                         row_count=2, row_height=20, height=200)
+        f.grid(row=0, column=0)
+        self.root.update()
+        self.assertEqual(len(f.rows), 2)
+        parent.enabled = False
+        self.assertFalse(f.enabled)
+        self.assertTrue(f._scrollbar.instate(["!disabled"]))
+        self.assertTrue(all(not row.enabled for row in f.rows))
+        f.row_count = 100
+        self.root.update()
+        self.assertGreater(len(f.rows), 2)
+        for row in f.rows:
+            self.assertFalse(row.enabled)
+            self.assertTrue(row.instate(["disabled"]))
+        f.enabled = True
+        self.assertTrue(all(row.enabled for row in f.rows))
+
 
 if __name__ == '__main__':
     unittest.main()
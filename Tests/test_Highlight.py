@@ -0,0 +1,70 @@
+"""
+Test the TkZero.Highlight module
+"""
+
+import unittest
+
+from TkZero.Highlight import Highlighter, RegexLexer
+from TkZero.Text import Text
+from TkZeroUnitTest import TkTestCase
+
+RULES = {
+    "root": [
+        (r"\b(?:if|else)\b", "keyword", None),
+        (r"/\*", "comment", "comment"),
+    ],
+    "comment": [
+        (r"\*/", "comment", "#pop"),
+        (r".+?(?=\*/)|.+", "comment", None),
+    ],
+}
+
+
+class HighlightTest(TkTestCase):
+    def test_regex_lexer(self):
+        lexer = RegexLexer(RULES)
+        self.assertEqual(lexer.tags, ("keyword", "comment"))
+        tokens, state = lexer.lex_line("if x /* y", lexer.initial_state)
+        self.assertEqual(tokens, [(0, 2, "keyword"), (5, 7, "comment"),
+                                  (7, 9, "comment")])
+        self.assertEqual(state, ("root", "comment"))
+        tokens, state = lexer.lex_line("y */ else", state)
+        self.assertEqual(tokens, [(0, 2, "comment"), (2, 4, "comment"),
+                                  (5, 9, "keyword")])
+        self.assertEqual(state, ("root",))
+
+    def test_highlighter(self):
+        t = Text(self.root)
+        t.grid(row=0, column=0)
+        t.text = "\n".join(["if x"] * 100)
+        h = Highlighter(t, RegexLexer(RULES),
+                        styles={"keyword": {"foreground": "blue"}})
+        h.flush()
+        self.assertEqual(len(t.tag_ranges("keyword")), 200)
+        t.insert("5.0", "/* ")
+        h.flush()
+        self.assertEqual(len(t.tag_ranges("keyword")), 8)
+        self.assertEqual(t.index("comment.last"), "100.4")
+        t.insert("50.end", " */")
+        h.flush()
+        self.assertEqual(len(t.tag_ranges("keyword")), 108)
+        t.delete("5.0", "50.end")
+        h.flush()
+        self.assertEqual(len(t.tag_ranges("keyword")), 108)
+        self.assertFalse(t.tag_ranges("comment"))
+        h.close()
+        self.assertFalse(t.tag_ranges("keyword"))
+
+    def test_close_keeps_other_bindings(self):
+        t = Text(self.root)
+        modified = []
+        t.bind("<<TextModified>>", lambda _: modified.append(True), True)
+        h = Highlighter(t, RegexLexer(RULES))
+        h.close()
+        t.insert("1.0", "if")
+        self.assertEqual(modified, [True])
+        self.assertFalse(t.tag_ranges("keyword"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+Test the TkZero.Hover module
+"""
+
+import unittest
+
+from TkZero.Hover import HOVER_BINDTAG
+from TkZero.Label import Label
+from TkZeroUnitTest import TkTestCase
+
+
+class HoverTest(TkTestCase):
+    def test_track_hover(self):
+        labels = [Label(self.root) for _ in range(10)]
+        for label in labels:
+            self.assertEqual(label.bindtags()[1], HOVER_BINDTAG)
+        labels[0].grid(row=0, column=0)
+        self.root.update()
+        self.assertFalse(labels[0].hovering_over)
+        labels[0].event_generate("<Enter>")
+        self.assertTrue(labels[0].hovering_over)
+        labels[0].event_generate("<Leave>")
+        self.assertFalse(labels[0].hovering_over)
+
+
+if __name__ == "__main__":
+    unittest.main()
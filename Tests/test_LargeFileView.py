@@ -0,0 +1,53 @@
+"""
+Test the TkZero.LargeFileView module
+"""
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+
+from TkZero.LargeFileView import LargeFileView
+from TkZeroUnitTest import TkTestCase
+
+
+class LargeFileViewTest(TkTestCase):
+    def test_view(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "test.log"
+            path.write_text("".join(f"Line {i}\n" for i in range(1, 100_001)))
+            v = LargeFileView(self.root, path=path, height=10)
+            v.grid(row=0, column=0)
+            self.assertTrue(v._poll_job.active)
+            while not v.indexed:
+                self.root.update()
+                sleep(0.01)
+            self.assertIsNone(v._poll_job)
+            self.assertEqual(v.line_count, 100_000)
+            self.assertEqual(v.get_line(50_000), "Line 50000")
+            self.assertLess(int(v.index("end-1c").split(".")[0]), 1000)
+            v.yview_moveto(0.5)
+            self.assertEqual(v.get("1.0", "1.end"),
+                             v.get_line(v._first + 1))
+            self.assertAlmostEqual(v.yview()[0], 0.5, places=2)
+            v.scroll_to_line(100_000)
+            self.assertEqual(v.get("end-1c linestart", "end-1c"),
+                             "Line 100000")
+            v.insert("1.0", "Foo")
+            self.assertNotEqual(v.get("1.0", "1.3"), "Foo")
+            v.destroy()
+
+    def test_close_cancels_poll(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "test.log"
+            path.write_text("Foo\n")
+            v = LargeFileView(self.root, path=path)
+            poll_job = v._poll_job
+            v.close_file()
+            self.assertFalse(poll_job.active)
+            self.assertIsNone(v._poll_job)
+            v.destroy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ Test the TkZero.Listbox module
 
 import unittest
 
-from TkZero.Listbox import Listbox
+from TkZero.Listbox import Listbox, VirtualListbox, SelectModes
 from TkZeroUnitTest import TkTestCase
 
 
@@ -35,6 +35,34 @@ class ListboxTest(TkTestCase):
         l.values = ("Bar", )
         self.assertEqual(l.values, ["Bar"])
 
+    def test_incremental_values(self):
+        l = Listbox(self.root, values=["a", "b", "c", "d"],
+                    select_mode=SelectModes.Multiple)
+        l.grid(row=0, column=0)
+        self.root.update()
+        l.selected = (2, )
+        l.values = ["a", "c", "d", "e"]
+        self.assertEqual(l.get(0, "end"), ("a", "c", "d", "e"))
+        self.assertEqual(l.selected, (1, ))
+        l.append("f", "g")
+        self.assertEqual(l.values, ["a", "c", "d", "e", "f", "g"])
+        l.insert(0, "z")
+        l.delete("end")
+        l.delete(1, 2)
+        self.assertEqual(l.values, ["z", "d", "e", "f"])
+        self.assertEqual(list(l.get(0, "end")), l.values)
+
+    def test_disabled_values(self):
+        l = Listbox(self.root, values=["a", "b"])
+        l.enabled = False
+        l.values = ["a", "c"]
+        l.append("d")
+        l.delete(0)
+        self.assertEqual(list(l.get(0, "end")), ["c", "d"])
+        self.assertEqual(l.values, ["c", "d"])
+        self.assertFalse(l.enabled)
+        self.assertEqual(str(l.cget("state")), "disabled")
+
     def test_enabled(self):
         l = Listbox(self.root)
         l.grid(row=0, column=0)
@@ -50,5 +78,78 @@ class ListboxTest(TkTestCase):
         self.assertEqual(type(l.hovering_over), bool)
 
 
+class VirtualListboxTest(TkTestCase):
+    def test_good_params(self):
+        VirtualListbox(self.root, width=20, height=10,
+                       source=[str(i) for i in range(1000)],
+                       on_select=lambda: print("Selected"),
+                       on_double_click=lambda: print("Double click"),
+                       overscan=5).grid(row=0, column=0)
+
+    def test_renders_window(self):
+        source = [f"Row {i}" for i in range(100_000)]
+        l = VirtualListbox(self.root, height=10, source=source, overscan=5)
+        l.grid(row=0, column=0)
+        self.root.update()
+        self.assertLess(l.size(), 100)
+        self.assertIs(l.values, source)
+        l.scroll_to(50_000)
+        self.root.update()
+        self.assertLess(l.size(), 100)
+        first, last = l.yview()
+        self.assertTrue(first <= 50_000 / len(source) < last)
+        with self.assertRaises(IndexError):
+            l.scroll_to(100_000)
+
+    def test_selected(self):
+        l = VirtualListbox(self.root, height=10,
+                           source=[str(i) for i in range(10_000)],
+                           select_mode=SelectModes.Multiple)
+        l.grid(row=0, column=0)
+        self.root.update()
+        self.assertEqual(l.selected, ())
+        l.selected = (1, 9_000)
+        self.assertEqual(l.selected, (1, 9_000))
+        l.scroll_to(9_000)
+        self.root.update()
+        self.assertEqual(l.selected, (1, 9_000))
+        self.assertIn(str(9_000), [l.get(i) for i in l.curselection()])
+
+    def test_refresh(self):
+        source = ["Foo"]
+        l = VirtualListbox(self.root, source=source)
+        l.grid(row=0, column=0)
+        self.root.update()
+        source.append("Bar")
+        l.refresh()
+        self.assertEqual(l.get(0, "end"), ("Foo", "Bar"))
+        l.source = ["Baz"]
+        self.assertEqual(l.get(0, "end"), ("Baz",))
+
+    def test_insert_delete(self):
+        source = ["a", "b", "c"]
+        l = VirtualListbox(self.root, source=source)
+        l.selected = (2, )
+        l.insert(0, "z")
+        l.insert("end", "d")
+        self.assertEqual(source, ["z", "a", "b", "c", "d"])
+        self.assertEqual(l.selected, (3, ))
+        l.delete(0, 1)
+        self.assertEqual(source, ["b", "c", "d"])
+        self.assertEqual(l.selected, (1, ))
+        self.assertEqual(l.get(0, "end"), ("b", "c", "d"))
+
+    def test_disabled(self):
+        source = [f"Row {i}" for i in range(10_000)]
+        l = VirtualListbox(self.root, height=10, source=source, overscan=5)
+        l.grid(row=0, column=0)
+        self.root.update()
+        l.enabled = False
+        l.scroll_to(5_000)
+        self.root.update()
+        self.assertIn("Row 5000", l.get(0, "end"))
+        self.assertEqual(str(l.cget("state")), "disabled")
+
+
 if __name__ == '__main__':
     unittest.main()
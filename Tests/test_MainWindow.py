@@ -1,13 +1,16 @@
 """
 Test the TkZero.MainWindow module
 """
+import asyncio
 import base64
 import tkinter as tk
 import unittest
+from threading import Event, Thread
 
 from PIL import ImageTk
 
 from TkZero import Vector
+from TkZero.Hover import HOVER_BINDTAG
 from TkZero.Label import Label
 from TkZeroUnitTest import TkTestCase
 
@@ -64,6 +67,18 @@ class MainWindowTest(TkTestCase):
         self.root.size = (300, 300)
         self.assertEqual(self.root.size, Vector.Size(width=300, height=300))
 
+    def test_size_in_configure(self):
+        sizes = []
+        self.root.bind_to_event(
+            "<Configure>", lambda event: sizes.append(self.root.size)
+        )
+        self.root.geometry("250x250")
+        self.root.update()
+        self.assertEqual(
+            self.root.get_size(refresh=True), Vector.Size(width=250, height=250)
+        )
+        self.assertEqual(sizes[-1], Vector.Size(width=250, height=250))
+
     def test_position(self):
         self.root.position = Vector.Position(x=0, y=0)
         self.assertEqual(self.root.position, Vector.Position(x=0, y=0))
@@ -112,6 +127,88 @@ class MainWindowTest(TkTestCase):
         self.assertTrue(len(binds) > 0)
         self.root.generate_event("<<MyOwnSpecialEvent>>")
 
+    def test_post(self):
+        results = []
+        self.root.post(results.append, "direct")
+
+        def worker():
+            for i in range(100):
+                self.root.post(results.append, i, key="progress")
+            self.root.call_soon_threadsafe(results.append, "done")
+
+        thread = Thread(target=worker, daemon=True)
+        thread.start()
+        thread.join()
+        while "done" not in results:
+            self.root.update()
+        self.assertEqual(results[0], "direct")
+        self.assertEqual(results[-2:], [99, "done"])
+        self.assertLess(len(results), 100)
+
+    def test_post_error(self):
+        self.root.report_callback_exception = lambda *args: None
+        ran = []
+        self.root.post(lambda: 1 / 0)
+        self.root.post(ran.append, True)
+        while not ran:
+            self.root.update()
+
+    def test_post_after_destroy(self):
+        self.root.mailbox_size = 1
+        self.root.post(lambda: None)
+        errors = []
+
+        def worker():
+            try:
+                self.root.post(lambda: None)
+            except RuntimeError as error:
+                errors.append(error)
+
+        thread = Thread(target=worker, daemon=True)
+        thread.start()
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+        self.root.destroy()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        with self.assertRaises(RuntimeError):
+            self.root.post(lambda: None)
+
+    def test_run_in_background(self):
+        results = []
+        errors = []
+        self.root.run_in_background(sum, [1, 2, 3], on_done=results.append)
+        self.root.run_in_background(lambda: 1 / 0, on_error=errors.append)
+        while not results or not errors:
+            self.root.update()
+        self.assertEqual(results, [6])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        started = Event()
+        self.root.run_in_background(lambda: started.wait(10))
+        self.assertTrue(all(thread.daemon
+                            for thread in self.root.executor._threads))
+        started.set()
+
+    def test_run_async(self):
+        events = []
+
+        async def on_event(event):
+            await asyncio.sleep(0)
+            events.append(event)
+
+        async def main():
+            self.root.bind_to_event("<<MyOwnSpecialEvent>>", on_event)
+            await asyncio.sleep(0.01)
+            self.root.generate_event("<<MyOwnSpecialEvent>>")
+            while not events:
+                await asyncio.sleep(0.01)
+            self.root.after(0, self.root.destroy)
+            return "done"
+
+        self.assertEqual(self.root.run_async(main()), "done")
+        self.assertEqual(len(events), 1)
+
     def test_enabled(self):
         self.assertTrue(self.root.enabled)
         Label(self.root).grid(row=0, column=0)
@@ -123,6 +220,10 @@ class MainWindowTest(TkTestCase):
     def test_hover(self):
         self.root.update()
         self.assertEqual(type(self.root.hovering_over), bool)
+        self.assertIn(HOVER_BINDTAG, self.root.bindtags())
+        self.assertEqual(self.root.bind("<Enter>"), "")
+        self.root._set_hover_state(True)
+        self.assertTrue(self.root.hovering_over)
 
     def test_on_close(self):
         on_close_func = lambda: None
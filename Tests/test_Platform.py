@@ -14,6 +14,13 @@ class PlatformTest(TkTestCase):
         Platform.on_platform(self.root, Platform.WindowingSystem.X11)
         Platform.on_platform(self.root, Platform.WindowingSystem.AQUA)
 
+    def test_info(self):
+        info = Platform.info(self.root)
+        self.assertIs(Platform.info(self.root), info)
+        self.assertIn(info.windowing_system, ("x11", "win32", "aqua"))
+        self.assertIn("default", info.themes)
+        self.assertIsNot(Platform.info(self.root, refresh=True), info)
+
     def test_on_x11(self):
         self.assertEqual(
             Platform.on_platform(self.root, Platform.WindowingSystem.X11),
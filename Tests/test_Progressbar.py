@@ -3,8 +3,14 @@ Test the TkZero.Progressbar module
 """
 
 import unittest
+from threading import Thread
 
-from TkZero.Progressbar import Progressbar, OrientModes, ProgressModes
+from TkZero.Progressbar import (
+    Progressbar,
+    OrientModes,
+    ProgressModes,
+    ProgressReporter,
+)
 from TkZeroUnitTest import TkTestCase
 
 
@@ -48,6 +54,46 @@ class ProgressbarTest(TkTestCase):
         self.root.update()
         self.assertEqual(p.text, "Foobar")
 
+    def test_style_pool(self):
+        first = Progressbar(self.root, length=200)
+        first.text = "First"
+        style_name = first.style_name
+        first.destroy()
+        second = Progressbar(self.root, length=200)
+        self.assertEqual(second.style_name, style_name)
+        self.assertEqual(second._style.lookup(style_name, "text"), "")
+        vertical = Progressbar(self.root, orientation=OrientModes.Vertical,
+                               length=200)
+        self.assertIn("Vertical", vertical.style_name)
+        vertical.text = "Vertical"
+        self.root.update()
+        for theme in vertical._style.theme_names():
+            vertical._style.theme_use(theme)
+            self.root.update()
+            self.assertEqual(
+                vertical._style.lookup(vertical.style_name, "text"), "Vertical"
+            )
+
+    def test_reporter(self):
+        p = Progressbar(self.root, length=200)
+        p.grid(row=0, column=0)
+        reporter = ProgressReporter(p, total=40_000, template="{percent:.0f}%")
+
+        def worker():
+            for _ in range(10_000):
+                reporter.advance()
+
+        threads = [Thread(target=worker, daemon=True) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        reporter.close()
+        self.root.update()
+        self.assertEqual(reporter.value, 40_000)
+        self.assertEqual(p.value, 40_000)
+        self.assertEqual(p.text, "100%")
+
     def test_disabled_text(self):
         p = Progressbar(self.root, orientation=OrientModes.Vertical,
                         mode=ProgressModes.Determinate, length=200,
@@ -0,0 +1,82 @@
+"""
+Test the TkZero.Scheduler module
+"""
+
+import unittest
+from time import sleep
+
+from TkZero.Scheduler import Scheduler
+from TkZeroUnitTest import TkTestCase
+
+
+class SchedulerTest(TkTestCase):
+    def run_for(self, ms):
+        for _ in range(ms):
+            self.root.update()
+            sleep(0.001)
+
+    def test_of(self):
+        self.assertIs(Scheduler.of(self.root), self.root.scheduler)
+
+    def test_jobs(self):
+        calls = []
+        once = self.root.scheduler.call_later(10, calls.append, "once")
+        every = self.root.scheduler.call_every(10, calls.append, "every")
+        frame = self.root.scheduler.call_each_frame(calls.append, "frame")
+        cancelled = self.root.scheduler.call_later(10, calls.append,
+                                                   "cancelled")
+        cancelled.cancel()
+        self.run_for(100)
+        self.assertEqual(calls.count("once"), 1)
+        self.assertGreater(calls.count("every"), 1)
+        self.assertGreater(calls.count("frame"), 1)
+        self.assertNotIn("cancelled", calls)
+        self.assertFalse(once.active)
+        self.assertFalse(cancelled.active)
+        every.cancel()
+        frame.cancel()
+        calls.clear()
+        self.run_for(50)
+        self.assertEqual(calls, [])
+
+    def test_pause(self):
+        calls = []
+        self.root.scheduler.call_every(10, calls.append, "pausable")
+        self.root.scheduler.call_every(10, calls.append, "always",
+                                       pausable=False)
+        self.root.withdraw()
+        self.root.update()
+        self.assertTrue(self.root.scheduler.paused)
+        calls.clear()
+        self.run_for(50)
+        self.assertNotIn("pausable", calls)
+        self.assertIn("always", calls)
+        self.root.deiconify()
+        self.root.update()
+        self.assertFalse(self.root.scheduler.paused)
+        self.run_for(50)
+        self.assertIn("pausable", calls)
+
+    def test_add_while_paused(self):
+        calls = []
+        self.root.withdraw()
+        self.root.update()
+        self.root.scheduler.call_later(10, calls.append, "later")
+        cancelled = self.root.scheduler.call_later(10, calls.append,
+                                                   "cancelled")
+        cancelled.cancel()
+        self.run_for(50)
+        self.assertEqual(calls, [])
+        self.root.deiconify()
+        self.root.update()
+        self.run_for(50)
+        self.assertEqual(calls, ["later"])
+
+    def test_close(self):
+        job = self.root.scheduler.call_every(10, print)
+        self.root.destroy()
+        self.assertFalse(job.active)
+
+
+if __name__ == "__main__":
+    unittest.main()
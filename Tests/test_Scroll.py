@@ -0,0 +1,40 @@
+"""
+Test the TkZero.Scroll module
+"""
+
+import unittest
+
+from TkZero.Frame import ScrollableFrame
+from TkZero.Label import Label
+from TkZero.Scroll import register_scrollable, unregister_scrollable
+from TkZeroUnitTest import TkTestCase
+
+
+class ScrollTest(TkTestCase):
+    def test_dispatch(self):
+        outer = ScrollableFrame(self.root)
+        outer.grid(row=0, column=0)
+        inner = ScrollableFrame(outer.frame)
+        inner.grid(row=0, column=0)
+        labels = [Label(inner.frame, text=f"Label {i}") for i in range(100)]
+        for i, label in enumerate(labels):
+            label.grid(row=i, column=0)
+        self.root.update()
+        scrolls = []
+        register_scrollable(inner, lambda amount, horizontal:
+                            scrolls.append((amount, horizontal)))
+        labels[0].event_generate("<MouseWheel>", delta=-120, x=2, y=2)
+        labels[0].event_generate("<Button-4>", x=2, y=2)
+        labels[0].event_generate("<MouseWheel>", delta=120, x=2, y=2,
+                                 state=1)
+        self.assertEqual(scrolls, [(1, False), (-1, False), (-1, True)])
+        unregister_scrollable(inner)
+        self.assertEqual(self.root._tkzero_scroll["cache"], {})
+        self.assertNotIn(str(inner), self.root._tkzero_scroll["scrollables"])
+        register_scrollable(inner, inner._on_scroll)
+        inner.destroy()
+        self.assertNotIn(str(inner), self.root._tkzero_scroll["scrollables"])
+
+
+if __name__ == "__main__":
+    unittest.main()
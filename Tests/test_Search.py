@@ -0,0 +1,73 @@
+"""
+Test the TkZero.Search module
+"""
+
+import unittest
+from time import sleep
+
+from TkZero.Search import TextSearch
+from TkZero.Text import Text
+from TkZeroUnitTest import TkTestCase
+
+
+class SearchTest(TkTestCase):
+    def test_search(self):
+        t = Text(self.root)
+        t.grid(row=0, column=0)
+        t.text = "\n".join(f"line {i} foo" for i in range(10_000))
+        found = []
+        s = TextSearch(t, lines_per_block=100, on_done=lambda: found.append(True))
+        s.search(r"foo")
+        while not s.done:
+            self.root.update()
+            sleep(0.01)
+        self.assertEqual(found, [True])
+        self.assertEqual(len(s.matches), 10_000)
+        self.assertEqual(len(t.tag_ranges("search")), 20_000)
+        t.mark_set("insert", "5.0")
+        self.assertEqual(s.next(), ("5.7", "5.10"))
+        self.assertEqual(s.next(), ("6.7", "6.10"))
+        self.assertEqual(s.previous(), ("5.7", "5.10"))
+        t.insert("1.0", "foo ")
+        self.assertEqual(len(s.matches), 10_001)
+        self.assertEqual(s.matches[:2], [(1, 0, 3), (1, 11, 14)])
+        t.delete("2.0", "3.0")
+        self.assertEqual(len(s.matches), 10_000)
+        modified = []
+        t.bind("<<TextModified>>", lambda _: modified.append(True), True)
+        s.close()
+        self.assertFalse(t.tag_ranges("search"))
+        t.insert("1.0", "foo ")
+        self.assertEqual(modified, [True])
+
+    def test_edit_during_search(self):
+        t = Text(self.root)
+        t.text = "\n".join(f"line {i} foo" for i in range(10_000))
+        s = TextSearch(t, lines_per_block=100, restart_delay=50)
+        s.search("foo")
+        t.insert("1.0", "foo ")
+        t.insert("1.0", "foo ")
+        self.assertFalse(s.done)
+        while not s.done:
+            self.root.update()
+            sleep(0.01)
+        self.assertEqual(len(s.matches), 10_002)
+
+    def test_touching_matches(self):
+        t = Text(self.root)
+        t.text = "oo\noo"
+        s = TextSearch(t)
+        s.search("o")
+        while not s.done:
+            self.root.update()
+            sleep(0.01)
+        self.assertEqual(len(s.matches), 4)
+        t.insert("1.0", "x")
+        self.assertEqual(s.matches, [(1, 1, 2), (1, 2, 3), (2, 0, 1),
+                                     (2, 1, 2)])
+        t.mark_set("insert", "1.0")
+        self.assertEqual(s.next(), ("1.1", "1.2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
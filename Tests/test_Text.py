@@ -2,9 +2,12 @@
 Test the TkZero.Text module
 """
 
+import tkinter as tk
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from TkZero.Text import Text, TextWrap
+from TkZero.Text import Text, TextChange, TextWrap
 from TkZeroUnitTest import TkTestCase
 
 
@@ -46,6 +49,148 @@ class TextTest(TkTestCase):
         self.root.update()
         self.assertTrue(t.read_only)
 
+    def test_proxy(self):
+        t = Text(self.root)
+        modified = []
+        t.bind("<<TextModified>>", lambda _: modified.append(True))
+        t.insert("1.0", "Foo")
+        t.see("1.0")
+        self.assertEqual(len(modified), 1)
+        t.read_only = True
+        t.insert("1.0", "Bar")
+        self.assertEqual(t.text, "Foo\n")
+        self.assertEqual(len(modified), 1)
+        t.read_only = False
+        t.delete(tk.SEL_FIRST, tk.SEL_LAST)
+        self.assertEqual(t.text, "Foo\n")
+
+    def test_changes(self):
+        t = Text(self.root)
+        t.text = "Foo"
+        self.assertEqual(t.changes, [TextChange("1.0", "1.0", 3, "1.3")])
+        t.coalesce_modifications = True
+        events = []
+        t.bind("<<TextModified>>", lambda _: events.append(list(t.changes)))
+        for index, char in enumerate("Bar"):
+            t.insert(f"1.{3 + index}", char)
+        t.delete("1.5")
+        t.delete("1.4")
+        t.insert("1.0", "\n")
+        self.root.update()
+        self.assertEqual(
+            events,
+            [
+                [
+                    TextChange("1.3", "1.3", 3, "1.6"),
+                    TextChange("1.4", "1.6", 0, "1.4"),
+                    TextChange("1.0", "1.0", 1, "2.0"),
+                ]
+            ],
+        )
+
+    def test_load_stream(self):
+        t = Text(self.root)
+        t.read_only = True
+        lines = [f"Line {i}\n" for i in range(10_000)]
+        progress = []
+        done = []
+        loader = t.load_stream(
+            iter(lines), chunk_size=1000, on_progress=progress.append,
+            on_done=done.append
+        )
+        while not done:
+            self.root.update()
+        self.assertTrue(loader.done)
+        self.assertEqual(done, [None])
+        self.assertEqual(progress[-1], len("".join(lines)))
+        self.assertEqual(t.text, "".join(lines) + "\n")
+        self.assertTrue(t.read_only)
+        self.assertFalse(t.can_undo())
+        loader = t.load_stream(iter(lines), chunk_size=10)
+        loader.cancel()
+        self.root.update()
+        self.assertTrue(loader.cancelled)
+        self.assertFalse(loader.done)
+
+    def test_load_cancels_load(self):
+        t = Text(self.root)
+        first = t.load_stream(iter(["old\n"] * 10_000), chunk_size=10)
+        second = t.load_stream(iter(["new\n"] * 10), chunk_size=10)
+        self.assertTrue(first.cancelled)
+        self.assertTrue(t.loading)
+        with TemporaryDirectory() as directory:
+            with self.assertRaises(RuntimeError):
+                t.save_to(Path(directory) / "text.txt")
+        while not second.done:
+            self.root.update()
+        self.assertEqual(t.text, "new\n" * 10 + "\n")
+        self.assertFalse(t.loading)
+        third = t.load_stream(iter(["old\n"] * 10_000), chunk_size=10)
+        t.text = "Replaced"
+        self.assertTrue(third.cancelled)
+        self.root.update()
+        self.assertEqual(t.text, "Replaced\n")
+
+    def test_export(self):
+        t = Text(self.root)
+        t.text = "".join(f"Line {i}\n" for i in range(2500)) + "Last"
+        self.assertEqual("".join(t.iter_chunks(chunk_size=1000)), t.text[:-1])
+        lines = list(t.iter_lines(lines_per_chunk=1000))
+        self.assertEqual(len(lines), 2501)
+        self.assertEqual(lines[0], "Line 0\n")
+        self.assertEqual(lines[-1], "Last")
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "text.txt"
+            t.save_to(path, chunk_size=1000)
+            self.assertEqual(path.read_text(encoding="utf-8"), t.text[:-1])
+            path.unlink()
+            done = []
+            original = t.text[:-1]
+            t.save_to(path, chunk_size=10, in_background=True,
+                      on_done=done.append)
+            self.root.update()
+            t.text = "Changed"
+            while not done:
+                self.root.update()
+            self.assertEqual(done, [None])
+            self.assertEqual(path.read_text(encoding="utf-8"), original)
+            self.assertEqual(t._savers, [])
+            errors = []
+            t.save_to(directory, on_done=errors.append)
+            self.assertIsInstance(errors[0], OSError)
+            with self.assertRaises(OSError):
+                t.save_to(directory)
+
+    def test_save_in_background_needs_main_window(self):
+        root = tk.Tk()
+        try:
+            t = Text(root)
+            t.text = "Foo"
+            with TemporaryDirectory() as directory:
+                with self.assertRaises(RuntimeError):
+                    t.save_to(Path(directory) / "text.txt", in_background=True)
+            self.assertEqual(t._savers, [])
+        finally:
+            root.destroy()
+
+    def test_diff_on_assign(self):
+        t = Text(self.root, diff_on_assign=True)
+        t.text = "Status: ok\nItems: 1\nDone"
+        t.edit_reset()
+        t.tag_add("bold", "1.0", "1.end")
+        changes = []
+        t.bind("<<TextModified>>", lambda e: changes.extend(t.changes))
+        t.text = "Status: ok\nItems: 2\nDone"
+        self.assertEqual(t.text, "Status: ok\nItems: 2\nDone\n")
+        self.assertEqual([str(i) for i in t.tag_ranges("bold")],
+                         ["1.0", "1.10"])
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].start, "2.0")
+        t.text = "Status: ok\nItems: 2\nDone"
+        self.assertEqual(len(changes), 1)
+        t.undo_contents()
+        self.assertEqual(t.text, "Status: ok\nItems: 1\nDone\n")
+
     def test_hover(self):
         t = Text(self.root)
         t.grid(row=0, column=0)
@@ -3,8 +3,10 @@ Test the TkZero.Window module
 """
 
 import unittest
+from threading import Event
 
 from TkZero import Vector
+from TkZero.Hover import HOVER_BINDTAG
 from TkZero.Label import Label
 from TkZero.Window import Window
 from TkZeroUnitTest import TkTestCase
@@ -97,6 +99,8 @@ class MainWindowTest(TkTestCase):
         window.lift()
         window.update()
         self.assertEqual(type(window.hovering_over), bool)
+        self.assertIn(HOVER_BINDTAG, window.bindtags())
+        self.assertEqual(window.bind("<Enter>"), "")
 
     def test_on_close(self):
         window = Window(self.root)
@@ -106,6 +110,29 @@ class MainWindowTest(TkTestCase):
         window.close()
         window.destroy()
 
+    def test_run_in_background(self):
+        window = Window(self.root)
+        results = []
+        window.run_in_background(sum, [1, 2, 3], on_done=results.append)
+        while not results:
+            self.root.update()
+        self.assertEqual(results, [6])
+        started = Event()
+        release = Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "late"
+
+        window.run_in_background(slow, on_done=results.append)
+        started.wait(5)
+        window.destroy()
+        release.set()
+        for _ in range(10):
+            self.root.update()
+        self.assertEqual(results, [6])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,164 @@
+"""
+Run an asyncio event loop together with Tk. The loop's selector waits on Tk
+instead of on the file descriptors alone: the descriptors asyncio watches are
+registered with Tk as file handlers, so one blocking call to Tk's event loop
+wakes up for a Tk event, an asyncio timeout or a ready file descriptor.
+"""
+
+import asyncio
+import math
+import selectors
+import tkinter as tk
+from time import monotonic
+from typing import List, Tuple, Any
+
+import _tkinter
+
+# How many queued Tk events to process at once before letting asyncio run
+_DRAIN_LIMIT = 100
+# How long to sleep in the selector between polls when Tk can't watch files
+_POLL_INTERVAL = 0.01
+
+
+class TkSelector(selectors.BaseSelector):
+    """
+    A selector that processes Tk events while waiting.
+    """
+
+    def __init__(self, root: tk.Tk):
+        """
+        Create a selector that processes the events of a Tk interpreter.
+
+        :param root: The main window. (a tk.Tk)
+        """
+        self._root = root
+        self._tk = root.tk
+        self._selector = selectors.DefaultSelector()
+        # Tk can only watch files on Unix, elsewhere we poll
+        self._file_handlers = hasattr(self._tk, "createfilehandler")
+
+    def _alive(self) -> bool:
+        """
+        Whether the Tk application still exists.
+
+        :return: A bool.
+        """
+        try:
+            return bool(self._tk.call("winfo", "exists", "."))
+        except tk.TclError:
+            return False
+
+    def _watch(self, key: selectors.SelectorKey) -> None:
+        """
+        Have Tk wake up when a file is ready.
+
+        :param key: The selectors.SelectorKey of the file.
+        :return: None.
+        """
+        if not self._file_handlers:
+            return
+        mask = 0
+        if key.events & selectors.EVENT_READ:
+            mask |= tk.READABLE
+        if key.events & selectors.EVENT_WRITE:
+            mask |= tk.WRITABLE
+        # Creating a handler for a file replaces the old one
+        self._tk.createfilehandler(key.fd, mask, lambda *_: None)
+
+    def _unwatch(self, key: selectors.SelectorKey) -> None:
+        """
+        Stop Tk from waking up when a file is ready.
+
+        :param key: The selectors.SelectorKey of the file.
+        :return: None.
+        """
+        if self._file_handlers:
+            self._tk.deletefilehandler(key.fd)
+
+    def register(
+        self, fileobj: Any, events: int, data: Any = None
+    ) -> selectors.SelectorKey:
+        key = self._selector.register(fileobj, events, data)
+        self._watch(key)
+        return key
+
+    def unregister(self, fileobj: Any) -> selectors.SelectorKey:
+        key = self._selector.unregister(fileobj)
+        self._unwatch(key)
+        return key
+
+    def modify(
+        self, fileobj: Any, events: int, data: Any = None
+    ) -> selectors.SelectorKey:
+        key = self._selector.modify(fileobj, events, data)
+        self._watch(key)
+        return key
+
+    def get_map(self) -> Any:
+        return self._selector.get_map()
+
+    def _drain(self) -> None:
+        """
+        Process the Tk events that are already queued, without waiting.
+
+        :return: None.
+        """
+        for _ in range(_DRAIN_LIMIT):
+            if not self._tk.dooneevent(_tkinter.DONT_WAIT):
+                break
+
+    def _wait(self, timeout: float = None) -> None:
+        """
+        Wait until a Tk event is processed, a file is ready or the timeout
+        passes.
+
+        :param timeout: The most seconds to wait for or None to wait forever.
+        :return: None.
+        """
+        if self._file_handlers:
+            timer = None
+            if timeout is not None:
+                # The timer is a Tk event too, so it wakes dooneevent up
+                timer = self._root.after(
+                    max(1, math.ceil(timeout * 1000)), lambda: None
+                )
+            self._tk.dooneevent(0)
+            if timer is not None:
+                self._root.after_cancel(timer)
+            return
+        deadline = None if timeout is None else monotonic() + timeout
+        while not self._tk.dooneevent(_tkinter.DONT_WAIT):
+            interval = _POLL_INTERVAL
+            if deadline is not None:
+                interval = min(interval, deadline - monotonic())
+            if interval <= 0 or self._selector.select(interval):
+                return
+
+    def select(self, timeout: float = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        if not self._alive():
+            return self._selector.select(timeout)
+        ready = self._selector.select(0)
+        if not ready and (timeout is None or timeout > 0):
+            # Return after one Tk event, because its handler may have given
+            # asyncio something to do
+            self._wait(timeout)
+        if self._alive():
+            self._drain()
+        return ready or self._selector.select(0)
+
+    def close(self) -> None:
+        if self._alive():
+            for key in list(self._selector.get_map().values()):
+                self._unwatch(key)
+        self._selector.close()
+
+
+def new_event_loop(root: tk.Tk) -> asyncio.AbstractEventLoop:
+    """
+    Create an asyncio event loop that also runs the events of a Tk
+    interpreter.
+
+    :param root: The main window. (a tk.Tk)
+    :return: An asyncio.AbstractEventLoop.
+    """
+    return asyncio.SelectorEventLoop(TkSelector(root))
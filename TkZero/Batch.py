@@ -0,0 +1,222 @@
+"""
+Batch property writes on widgets. While batching, writes like Label.text or
+Progressbar.value are recorded per widget and property (the last write wins)
+and flushed to Tk once, when Tk is idle.
+"""
+
+import tkinter as tk
+from contextlib import contextmanager
+from tkinter import ttk
+from typing import Any, Callable, Dict, Iterator, Tuple, Union
+
+
+class _Batcher:
+    """
+    Holds the pending writes of one Tk interpreter.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self.depth = 0
+        self.always = False
+        self.flushing = False
+        self.pending: Dict[Tuple[str, str], Tuple[tk.Misc, Callable, Any]] = {}
+        self.after_id = None
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether writes should be recorded instead of applied right away.
+
+        :return: A bool.
+        """
+        return (self.always or self.depth > 0) and not self.flushing
+
+    def record(self, widget: tk.Misc, option: str, value: Any, apply: Callable) -> None:
+        """
+        Record a write and make sure a flush is scheduled.
+
+        :param widget: The widget that is written to.
+        :param option: The name of the property.
+        :param value: The new value.
+        :param apply: The function that actually applies the value.
+        :return: None.
+        """
+        self.pending[(widget._w, option)] = (widget, apply, value)
+        if self.after_id is None:
+            self.after_id = self.root.after_idle(self._on_idle)
+
+    def _on_idle(self) -> None:
+        """
+        Flush the pending writes when Tk is idle.
+
+        :return: None.
+        """
+        self.after_id = None
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Apply all the pending writes now.
+
+        :return: None.
+        """
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        pending, self.pending = self.pending, {}
+        self.flushing = True
+        try:
+            for widget, apply, value in pending.values():
+                try:
+                    apply(value)
+                except tk.TclError:
+                    # The widget was destroyed before we got to flush
+                    pass
+        finally:
+            self.flushing = False
+
+
+def _get_batcher(
+    widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]], create: bool = False
+) -> Union[_Batcher, None]:
+    """
+    Get the batcher of the interpreter this widget lives in.
+
+    :param widget: A Tkinter thing. (Probably something like root or self)
+    :param create: Whether to create the batcher if there isn't one yet.
+    :return: A _Batcher or None if there isn't one and create is False.
+    """
+    root = widget._root()
+    batcher = getattr(root, "_tkzero_batcher", None)
+    if batcher is None and create:
+        batcher = _Batcher(root)
+        root._tkzero_batcher = batcher
+    return batcher
+
+
+@contextmanager
+def batch(widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]]) -> Iterator[None]:
+    """
+    Batch the property writes done inside this with block. They will be
+    flushed the next time Tk is idle. Can be nested.
+
+    with Batch.batch(root):
+        for label in labels:
+            label.text = "Updated"
+
+    :param widget: A Tkinter thing that we need to find the interpreter.
+     (Probably something like root or self)
+    :return: A context manager.
+    """
+    batcher = _get_batcher(widget, create=True)
+    batcher.depth += 1
+    try:
+        yield
+    finally:
+        batcher.depth -= 1
+
+
+def set_batching(
+    widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]], enabled: bool
+) -> None:
+    """
+    Turn batching on or off for the whole interpreter. When turned off, any
+    pending writes are flushed right away.
+
+    :param widget: A Tkinter thing that we need to find the interpreter.
+     (Probably something like root or self)
+    :param enabled: A bool on whether to batch every property write.
+    :return: None.
+    """
+    batcher = _get_batcher(widget, create=True)
+    batcher.always = enabled
+    if not enabled:
+        batcher.flush()
+
+
+def is_batching(widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]]) -> bool:
+    """
+    Get whether property writes are being batched right now.
+
+    :param widget: A Tkinter thing that we need to find the interpreter.
+     (Probably something like root or self)
+    :return: A bool.
+    """
+    batcher = _get_batcher(widget)
+    return batcher is not None and batcher.active
+
+
+def flush(widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]]) -> None:
+    """
+    Apply the pending writes right now instead of waiting for Tk to be idle.
+
+    :param widget: A Tkinter thing that we need to find the interpreter.
+     (Probably something like root or self)
+    :return: None.
+    """
+    batcher = _get_batcher(widget)
+    if batcher is not None:
+        batcher.flush()
+
+
+def write(
+    widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]],
+    option: str,
+    value: Any,
+    apply: Callable[[Any], None],
+) -> None:
+    """
+    Write a property, or record it if we are batching.
+
+    :param widget: The widget the property is on.
+    :param option: The name of the property, ex. "text".
+    :param value: The new value.
+    :param apply: A function that takes the value and applies it to Tk.
+    :return: None.
+    """
+    batcher = _get_batcher(widget)
+    if batcher is not None and batcher.active:
+        batcher.record(widget, option, value, apply)
+    else:
+        apply(value)
+
+
+def write_enabled(widget: ttk.Widget, enabled: bool, *flags: str) -> None:
+    """
+    Write whether a ttk widget is enabled, or record it if we are batching.
+    Other state flags set with it are recorded under the same property, so
+    they can't be flushed out of order with it.
+
+    :param widget: The ttk widget.
+    :param enabled: A bool, True for enabled and False for disabled.
+    :param flags: More ttk state flags to set, ex. "!readonly".
+    :return: None.
+    """
+    write(
+        widget,
+        "enabled",
+        ["!disabled" if enabled else "disabled", *flags],
+        widget.state,
+    )
+
+
+def read(
+    widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]],
+    option: str,
+    get: Callable[[], Any],
+) -> Any:
+    """
+    Read a property, returning the pending value if there is one.
+
+    :param widget: The widget the property is on.
+    :param option: The name of the property, ex. "text".
+    :param get: A function that reads the value from Tk.
+    :return: The pending value, or whatever get returns.
+    """
+    batcher = _get_batcher(widget)
+    if batcher is not None and batcher.pending:
+        pending = batcher.pending.get((widget._w, option))
+        if pending is not None:
+            return pending[2]
+    return get()
@@ -8,6 +8,9 @@ from typing import Union, Callable
 
 from PIL.ImageTk import PhotoImage
 
+from TkZero import Batch
+from TkZero.Hover import track_hover
+
 
 class DisplayModes:
     """
@@ -55,8 +58,7 @@ class Button(ttk.Button):
         if image is not None:
             self.image = image
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def text(self) -> str:
@@ -65,7 +67,7 @@ class Button(ttk.Button):
 
         :return: A str of the text on this button.
         """
-        return self.cget("text")
+        return Batch.read(self, "text", lambda: self.cget("text"))
 
     @text.setter
     def text(self, new_text: str) -> None:
@@ -75,7 +77,7 @@ class Button(ttk.Button):
         :param new_text: The new text.
         :return: None.
         """
-        self.configure(text=new_text)
+        Batch.write(self, "text", new_text, lambda text: self.configure(text=text))
 
     @property
     def image(self) -> Union[PhotoImage, None]:
@@ -140,7 +142,7 @@ class Button(ttk.Button):
         :return: None.
         """
         self._enabled = new_state
-        self.state(["!disabled" if self._enabled else "disabled"])
+        Batch.write_enabled(self, new_state)
 
     @property
     def hovering_over(self) -> bool:
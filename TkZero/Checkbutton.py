@@ -8,6 +8,8 @@ from typing import Union, Callable
 
 from PIL.ImageTk import PhotoImage
 
+from TkZero.Hover import track_hover
+
 
 class DisplayModes:
     """
@@ -57,8 +59,7 @@ class Checkbutton(ttk.Checkbutton):
             self.image = image
         self.value = False
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def value(self) -> Union[bool, None]:
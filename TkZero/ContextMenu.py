@@ -0,0 +1,103 @@
+"""
+The right-click menu shared by the text widgets (Entry, Combobox, Spinbox and
+Text). Every toplevel gets at most one menu per kind, built the first time it
+is needed and pointed at the widget that asks for it.
+"""
+
+import tkinter as tk
+from typing import Union
+
+from TkZero.Platform import on_aqua
+
+
+class ContextMenuKinds:
+    """
+    A bunch of variables on the kinds of context menus.
+    """
+
+    Entry = "entry"
+    Text = "text"
+
+
+class ContextMenu(tk.Menu):
+    """
+    A context menu whose commands act on whatever widget it targets.
+    """
+
+    def __init__(self, parent: Union[tk.Tk, tk.Toplevel], kind: str):
+        """
+        Build a context menu.
+
+        :param parent: The toplevel the menu belongs to.
+        :param kind: A str of "entry" or "text". Text menus also have undo and
+         redo.
+        """
+        super().__init__(parent, tearoff=0)
+        self.target = None
+        aqua = on_aqua(self)
+        if kind == ContextMenuKinds.Text:
+            self.add_command(
+                label="Undo",
+                command=lambda: self.target.undo_contents(),
+                underline=0,
+                accelerator="Command-Z" if aqua else "Control+Z",
+            )
+            self.add_command(
+                label="Redo",
+                command=lambda: self.target.redo_contents(),
+                underline=0,
+                accelerator="Command-Y" if aqua else "Control+Y",
+            )
+            self.add_separator()
+        self.add_command(
+            label="Copy",
+            command=lambda: self.target.copy_contents(),
+            underline=0,
+            accelerator="Command-C" if aqua else "Control+C",
+        )
+        self.add_command(
+            label="Cut",
+            command=lambda: self.target.cut_contents(),
+            accelerator="Command-X" if aqua else "Control+X",
+        )
+        self.add_command(
+            label="Paste",
+            command=lambda: self.target.paste_contents(),
+            underline=0,
+            accelerator="Command-V" if aqua else "Control+V",
+        )
+        self.add_separator()
+        self.add_command(
+            label="Delete",
+            command=lambda: self.target.delete_contents(),
+            accelerator="Delete",
+        )
+        self.add_separator()
+        self.add_command(
+            label="Select all",
+            command=lambda: self.target.select_all_contents(),
+            underline=7,
+            accelerator="Command-A" if aqua else "Control+A",
+        )
+
+
+def context_menu_for(widget: tk.Widget, kind: str) -> ContextMenu:
+    """
+    Get the context menu of the toplevel of a widget, pointed at that widget.
+    The menu is built the first time it is asked for.
+
+    :param widget: The widget that the menu should act on.
+    :param kind: A str of "entry" or "text".
+    :return: A ContextMenu.
+    """
+    toplevel = widget.winfo_toplevel()
+    menus = getattr(toplevel, "_tkzero_context_menus", None)
+    if menus is None:
+        menus = {}
+        toplevel._tkzero_context_menus = menus
+    menu = menus.get(kind)
+    if menu is None:
+        menu = ContextMenu(toplevel, kind)
+        menus[kind] = menu
+    menu.target = widget
+    return menu
@@ -0,0 +1,50 @@
+"""
+Compute small edits that turn one sequence into another.
+"""
+
+from difflib import SequenceMatcher
+from typing import List, Sequence, Tuple
+
+
+def sequence_edits(
+    old: Sequence, new: Sequence
+) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Compute the edits needed to turn old into new. The common prefix and
+    suffix are skipped first, so appending to or trimming the ends of a long
+    sequence is cheap.
+
+    :param old: The current sequence. (like a list of str)
+    :param new: The sequence we want to end up with.
+    :return: A list of (tag, i1, i2, j1, j2) tuples in the same format as
+     difflib.SequenceMatcher.get_opcodes(), but without the "equal" ones.
+     old[i1:i2] should be replaced by new[j1:j2]. The tag is "replace",
+     "delete" or "insert". Apply them from last to first so the indices of
+     the ones before stay valid.
+    """
+    old_length = len(old)
+    new_length = len(new)
+    prefix = 0
+    limit = min(old_length, new_length)
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while (
+        suffix < limit and old[old_length - suffix - 1] == new[new_length - suffix - 1]
+    ):
+        suffix += 1
+    old_middle = old[prefix : old_length - suffix]
+    new_middle = new[prefix : new_length - suffix]
+    if not old_middle and not new_middle:
+        return []
+    if not old_middle:
+        return [("insert", prefix, prefix, prefix, new_length - suffix)]
+    if not new_middle:
+        return [("delete", prefix, old_length - suffix, prefix, prefix)]
+    matcher = SequenceMatcher(None, old_middle, new_middle)
+    return [
+        (tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
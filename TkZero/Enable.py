@@ -0,0 +1,124 @@
+"""
+Enable or disable every widget inside a container. The whole walk runs as one
+Tcl procedure, so it costs one call from Python no matter how many widgets
+there are. Widgets registered with use_enabled_setter are not walked into,
+their enabled property is set from Python instead.
+"""
+
+import tkinter as tk
+from typing import Tuple
+
+# Walks the children of a widget and sets their state, skipping windows and
+# menus. Themed (ttk) widgets have a class that starts with T and a capital
+# letter and use the state command, classic widgets use the -state option.
+# Only the widgets whose state changed are returned, plus the frames, which
+# have no state but keep track of whether they are enabled in Python. The
+# widgets in the enableSetter array are returned in a second list instead.
+_ENABLE_PROC = """
+namespace eval ::tkzero {
+    variable enableSetter
+    array set enableSetter {}
+}
+proc ::tkzero::enableChildren {widget enable} {
+    variable enableSetter
+    set changed {}
+    set setters {}
+    set state [expr {$enable ? "normal" : "disabled"}]
+    set ttk_state [expr {$enable ? "!disabled" : "disabled"}]
+    set pending [winfo children $widget]
+    while {[llength $pending]} {
+        set children $pending
+        set pending {}
+        foreach child $children {
+            set class [winfo class $child]
+            if {$class eq "Menu" || [winfo toplevel $child] eq $child} {
+                continue
+            }
+            if {[info exists enableSetter($child)]} {
+                lappend setters $child
+                continue
+            }
+            if {$class in {Frame Labelframe TFrame TLabelframe}} {
+                lappend changed $child
+            } elseif {[regexp {^T[A-Z]} $class]} {
+                if {[$child instate disabled] == $enable} {
+                    $child state $ttk_state
+                    lappend changed $child
+                }
+            } elseif {![catch {$child cget -state} old_state]} {
+                if {$old_state ne $state} {
+                    $child configure -state $state
+                    lappend changed $child
+                }
+            }
+            lappend pending {*}[winfo children $child]
+        }
+    }
+    return [list $changed $setters]
+}
+"""
+
+
+def _install(widget: tk.Misc) -> None:
+    """
+    Define the Tcl procedure in the interpreter of a widget if it isn't yet.
+
+    :param widget: A widget.
+    :return: None.
+    """
+    if not widget.tk.call("info", "commands", "::tkzero::enableChildren"):
+        widget.tk.eval(_ENABLE_PROC)
+
+
+def use_enabled_setter(widget: tk.Misc) -> None:
+    """
+    Have enable_children set the enabled property of a widget instead of
+    walking into it. Use this for widgets whose enabled property does more
+    than set the state, or that are made of other widgets that shouldn't all
+    be changed.
+
+    :param widget: The widget, which must have an enabled property.
+    :return: None.
+    """
+    _install(widget)
+    widget.tk.call("set", f"::tkzero::enableSetter({widget._w})", 1)
+    # Forget it in Tcl when it is destroyed, so the path can be used again
+    widget.tk.call(
+        "bind",
+        widget._w,
+        "<Destroy>",
+        f"+unset -nocomplain ::tkzero::enableSetter({widget._w})",
+    )
+
+
+def enable_children(widget: tk.Misc, enable: bool) -> Tuple[str, ...]:
+    """
+    Enable or disable all the widgets inside a widget. Widgets that are
+    already in the right state are left alone, and the enabled property of
+    the widgets that changed is kept up to date.
+
+    :param widget: The widget whose children to change.
+    :param enable: Whether to enable or disable them.
+    :return: A tuple of the paths of the widgets that changed. Frames and
+     the widgets registered with use_enabled_setter are always included.
+    """
+    _install(widget)
+    changed, setters = widget.tk.splitlist(
+        widget.tk.call("::tkzero::enableChildren", widget._w, int(enable))
+    )
+    changed = widget.tk.splitlist(changed)
+    setters = widget.tk.splitlist(setters)
+    for path in changed:
+        try:
+            child = widget.nametowidget(path)
+        except KeyError:
+            continue
+        if hasattr(child, "_enabled"):
+            child._enabled = enable
+    for path in setters:
+        try:
+            child = widget.nametowidget(path)
+        except KeyError:
+            continue
+        child.enabled = enable
+    return changed + setters
@@ -6,6 +6,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union, Callable
 
+from TkZero import Batch
+from TkZero.ContextMenu import ContextMenu, ContextMenuKinds, context_menu_for
+from TkZero.Hover import track_hover
 from TkZero.Platform import on_aqua
 
 
@@ -58,10 +61,8 @@ class Entry(ttk.Entry):
             self.bind("<Control-1>", lambda event: self._popup(event=event))
         else:
             self.bind("<3>", lambda event: self._popup(event=event))
-        self._make_context_menu()
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def value(self) -> str:
@@ -70,13 +71,22 @@ class Entry(ttk.Entry):
 
         :return: A str of the text in this entry.
         """
-        return self.get()
+        return Batch.read(self, "value", self.get)
 
     @value.setter
     def value(self, new_text: str) -> None:
         """
         Set the text on this entry.
 
+        :param new_text: The new text.
+        :return: None.
+        """
+        Batch.write(self, "value", new_text, self._apply_value)
+
+    def _apply_value(self, new_text: str) -> None:
+        """
+        Put the text into Tk.
+
         :param new_text: The new text.
         :return: None.
         """
@@ -110,7 +120,7 @@ class Entry(ttk.Entry):
         """
         self._enabled = new_state
         self._readonly = False
-        self.state(["!disabled" if self._enabled else "disabled"])
+        Batch.write_enabled(self, new_state, "!readonly")
 
     @property
     def read_only(self) -> bool:
@@ -134,7 +144,7 @@ class Entry(ttk.Entry):
         """
         self._enabled = True
         self._readonly = new_state
-        self.state(["readonly" if self._readonly else "!readonly"])
+        Batch.write_enabled(self, True, "readonly" if new_state else "!readonly")
 
     @property
     def hovering_over(self) -> bool:
@@ -154,41 +164,15 @@ class Entry(ttk.Entry):
         """
         self._hovering_over = is_hovering
 
-    def _make_context_menu(self) -> None:
+    @property
+    def _context_menu(self) -> ContextMenu:
         """
-        Initiate the context menu.
+        Get the context menu of this entry. It is shared with the other
+        widgets in the same window and built the first time it is needed.
 
-        :return: None.
+        :return: A TkZero.ContextMenu.ContextMenu.
         """
-        self._context_menu = tk.Menu(self, tearoff=0)
-        self._context_menu.add_command(
-            label="Copy",
-            command=self.copy_contents,
-            underline=0,
-            accelerator="Command-C" if on_aqua(self) else "Control+C",
-        )
-        self._context_menu.add_command(
-            label="Cut",
-            command=self.cut_contents,
-            accelerator="Command-X" if on_aqua(self) else "Control+X",
-        )
-        self._context_menu.add_command(
-            label="Paste",
-            command=self.paste_contents,
-            underline=0,
-            accelerator="Command-V" if on_aqua(self) else "Control+V",
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Delete", command=self.delete_contents, accelerator="Delete"
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Select all",
-            command=self.select_all_contents,
-            underline=7,
-            accelerator="Command-A" if on_aqua(self) else "Control+A",
-        )
+        return context_menu_for(self, ContextMenuKinds.Entry)
 
     def _update_context_menu_states(self) -> None:
         """
@@ -4,9 +4,11 @@ Creates a themed frame.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Union
+from typing import Union, Callable, List, Dict, Tuple
 
-from TkZero import Platform
+from TkZero.Enable import enable_children, use_enabled_setter
+from TkZero.Hover import track_hover
+from TkZero.Scroll import register_scrollable, unregister_scrollable
 
 
 class Frame(ttk.Frame):
@@ -20,8 +22,7 @@ class Frame(ttk.Frame):
         self._style_root = "TFrame"
         self._enabled = True
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def width(self) -> int:
@@ -71,31 +72,6 @@ class Frame(ttk.Frame):
             )
         self.configure(height=new_height)
 
-    def _enable_children(
-        self, parent: Union[tk.Widget, None] = None, enable: bool = True
-    ) -> None:
-        """
-        Enable or disable the children.
-
-        :param parent: A tk.Widget that is our parent. If None then default to
-         self.
-        :param enable: Whether to enable or disable the children.
-        :return: None.
-        """
-        if parent is None:
-            parent = self
-        for child in parent.winfo_children():
-            if child.winfo_class() not in ("TFrame", "TLabelFrame"):
-                try:
-                    child.state(["!disabled" if enable else "disabled"])
-                except AttributeError:
-                    child.configure(state=tk.NORMAL if enable else tk.DISABLED)
-            else:
-                if hasattr(child, "enabled"):
-                    child.enabled = enable
-                else:
-                    self._enable_children(child, enable)
-
     @property
     def enabled(self) -> bool:
         """
@@ -117,7 +93,7 @@ class Frame(ttk.Frame):
         :return: None.
         """
         self._enabled = new_state
-        self._enable_children(enable=self._enabled)
+        enable_children(self, self._enabled)
 
     @property
     def hovering_over(self) -> bool:
@@ -180,10 +156,9 @@ class ScrollableFrame(Frame):
                 self, orient=tk.VERTICAL, command=self.canvas.yview
             )
         self.frame = Frame(self.canvas)
-        self.frame.bind(
-            "<Configure>",
-            lambda _: self.canvas.configure(scrollregion=self.canvas.bbox(tk.ALL)),
-        )
+        self._content_size = (0, 0)
+        self._scrollregion_after_id = None
+        self.frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.create_window((0, 0), window=self.frame, anchor=tk.NW)
         if x_scrolling:
             self.canvas.configure(xscrollcommand=x_scrollbar.set)
@@ -194,93 +169,62 @@ class ScrollableFrame(Frame):
             x_scrollbar.grid(row=1, column=0, sticky=tk.NSEW)
         if y_scrolling:
             y_scrollbar.grid(row=0, column=1, sticky=tk.NSEW)
-        # https://stackoverflow.com/a/37858368/10291933
-        self.frame.bind("<Enter>", self._bind_to_mousewheel)
-        self.frame.bind("<Leave>", self._unbind_to_mousewheel)
-        self._shift_pressed = False
-        # https://stackoverflow.com/a/8089241/10291933
-        # http://www.tcl.tk/man/tcl8.4/TkCmd/keysyms.htm
-        self.frame.bind_all("<Shift_L>", lambda _: self._set_shift_pressed(True))
-        self.frame.bind_all("<Shift_R>", lambda _: self._set_shift_pressed(True))
-        self.frame.bind_all(
-            "<KeyRelease-Shift_L>", lambda _: self._set_shift_pressed(False)
-        )
-        self.frame.bind_all(
-            "<KeyRelease-Shift_R>", lambda _: self._set_shift_pressed(False)
-        )
-        self._hovering_over = False
-        self.frame.bind("<Enter>", lambda _: self._set_hover_state(True), add=True)
-        self.frame.bind("<Leave>", lambda _: self._set_hover_state(False), add=True)
+        register_scrollable(self, self._on_scroll)
+        # Only the widgets in the inner frame should be enabled or disabled,
+        # not the canvas and the scrollbars
+        use_enabled_setter(self)
 
-    def _set_shift_pressed(self, is_pressed: bool) -> None:
+    def _on_frame_configure(self, event) -> None:
         """
-        Set whether shift is pressed or not.
+        Remember the size of the inner frame and update the scroll region
+        once Tk is idle, so adding a lot of widgets only updates it once.
 
-        :param is_pressed: A bool.
+        :param event: An event that Tkinter passes in.
         :return: None.
         """
-        self._shift_pressed = is_pressed
+        size = (event.width, event.height)
+        if size == self._content_size:
+            return
+        self._content_size = size
+        if self._scrollregion_after_id is None:
+            self._scrollregion_after_id = self.after_idle(self._update_scrollregion)
 
-    def _bind_to_mousewheel(self, event) -> None:
+    def _update_scrollregion(self) -> None:
         """
-        Bind to the mousewheel.
+        Make the scroll region the size of the inner frame.
 
-        :param event: An event that Tkinter passes in.
-        :return: None
+        :return: None.
         """
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self._scrollregion_after_id = None
+        width, height = self._content_size
+        self.canvas.configure(scrollregion=(0, 0, width, height))
 
-    def _unbind_to_mousewheel(self, event) -> None:
+    def destroy(self) -> None:
         """
-        Unbind to the mousewheel.
+        Destroy this frame.
 
-        :param event: An event that Tkinter passes in.
-        :return: None
+        :return: None.
         """
-        self.canvas.unbind_all("<MouseWheel>")
+        if self._scrollregion_after_id is not None:
+            self.after_cancel(self._scrollregion_after_id)
+            self._scrollregion_after_id = None
+        unregister_scrollable(self)
+        super().destroy()
 
-    def _on_mousewheel(self, event) -> None:
+    def _on_scroll(self, amount: int, horizontal: bool) -> None:
         """
-        A callback for the mousewheel to scroll.
+        Scroll with the mousewheel.
 
-        :param event: An event that Tkinter passes in.
+        :param amount: How many units to scroll.
+        :param horizontal: Whether to scroll horizontally. (shift is held)
         :return: None.
         """
-        if Platform.on_aqua(self):
-            scroll = str(int(-1 * event.delta))
-        else:
-            scroll = str(int(-1 * (event.delta / 120)))
-        if self._shift_pressed:
+        if horizontal:
             if self.x_scrolling:
-                self.canvas.xview_scroll(scroll, tk.UNITS)
+                self.canvas.xview_scroll(amount, tk.UNITS)
         else:
             if self.y_scrolling:
-                self.canvas.yview_scroll(scroll, tk.UNITS)
-
-    def _enable_children(
-        self, parent: Union[tk.Widget, None] = None, enable: bool = True
-    ) -> None:
-        """
-        Enable or disable the children.
-
-        :param parent: A tk.Widget that is our parent. If None then default to
-         self.
-        :param enable: Whether to enable or disable the children.
-        :return: None.
-        """
-        if parent is None:
-            parent = self.frame
-        for child in parent.winfo_children():
-            if child.winfo_class() not in ("TFrame", "TLabelFrame"):
-                try:
-                    child.state(["!disabled" if enable else "disabled"])
-                except AttributeError:
-                    child.configure(state=tk.NORMAL if enable else tk.DISABLED)
-            else:
-                if hasattr(child, "enabled"):
-                    child.enabled = enable
-                else:
-                    self._enable_children(child, enable)
+                self.canvas.yview_scroll(amount, tk.UNITS)
 
     @property
     def width(self) -> int:
@@ -339,16 +283,30 @@ class ScrollableFrame(Frame):
 
         :return: A bool.
         """
-        return self._hovering_over
+        return self.frame.hovering_over
 
-    def _set_hover_state(self, is_hovering: bool) -> None:
+    @property
+    def enabled(self) -> bool:
         """
-        Set whether we are hovering over this widget or not.
+        Get whether the widgets in this frame are in normal mode or disabled
+        mode. (grayed out and cannot interact with)
 
-        :param is_hovering: A bool.
+        :return: A bool, True if normal otherwise False.
+        """
+        return self.frame.enabled
+
+    @enabled.setter
+    def enabled(self, new_state: bool) -> None:
+        """
+        Set whether the widgets in this frame are in normal mode or disabled
+        mode. (grayed out and cannot interact with)
+
+        :param new_state: The new state (a bool) True for enabled and False
+        for disabled.
         :return: None.
         """
-        self._hovering_over = is_hovering
+        self._enabled = new_state
+        self.frame.enabled = new_state
 
     def _warn(self, method: str):
         """
@@ -383,3 +341,298 @@ class ScrollableFrame(Frame):
         :return: None.
         """
         self.frame.configure(style=f"{style_name}.{self._style_root}")
+
+
+class VirtualFrame(Frame):
+    def __init__(
+        self,
+        parent: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]],
+        make_row: Callable[[Frame], tk.Widget],
+        bind_row: Callable[[tk.Widget, int], None],
+        row_count: int = 0,
+        row_height: int = None,
+        width: int = 300,
+        height: int = 300,
+    ):
+        """
+        Create a scrollable frame that shows rows of widgets without making a
+        widget for every row. Only enough rows to fill the view are made, and
+        they are bound to other rows of data as the view scrolls.
+
+        :param parent: The parent of this frame.
+        :param make_row: A function that is called with the frame to put the
+         row in and returns a new row widget (like a Frame with a Label and
+         an Entry in it)
+        :param bind_row: A function that is called with a row widget and the
+         index of the row it should show now. It should fill the row widget
+         with the data of that row.
+        :param row_count: How many rows there are. Defaults to 0.
+        :param row_height: The height of every row in pixels. Defaults to None,
+         which measures the first row.
+        :param width: The width of the frame in pixels. Defaults to 300.
+        :param height: The height of the frame in pixels. Defaults to 300.
+        """
+        super().__init__(parent)
+        self.make_row = make_row
+        self.bind_row = bind_row
+        self._row_count = row_count
+        self._row_height = row_height
+        # How many pixels of rows are above the view
+        self._offset = 0
+        self._rows: List[tk.Widget] = []
+        # The index of the row each row widget shows, or None
+        self._bound: Dict[tk.Widget, Union[int, None]] = {}
+        self.body = Frame(self)
+        self.body.configure(width=width, height=height, takefocus=True)
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.body.grid(row=0, column=0, sticky=tk.NSEW)
+        self._scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.body.bind("<Configure>", lambda _: self._layout())
+        self.body.bind("<1>", lambda _: self.body.focus_set())
+        for key, amount, what in (
+            ("<Up>", -1, tk.UNITS),
+            ("<Down>", 1, tk.UNITS),
+            ("<Prior>", -1, tk.PAGES),
+            ("<Next>", 1, tk.PAGES),
+        ):
+            self.body.bind(key, lambda _, a=amount, w=what: self.yview(tk.SCROLL, a, w))
+        self.body.bind("<Home>", lambda _: self.yview_moveto(0))
+        self.body.bind("<End>", lambda _: self.yview_moveto(1))
+        register_scrollable(self, lambda amount, _: self.yview_scroll(amount, tk.UNITS))
+        # Only the rows should be enabled or disabled, not the scrollbar
+        use_enabled_setter(self)
+        self._layout()
+
+    @property
+    def row_count(self) -> int:
+        """
+        Get how many rows there are.
+
+        :return: An int.
+        """
+        return self._row_count
+
+    @row_count.setter
+    def row_count(self, new_count: int) -> None:
+        """
+        Set how many rows there are. The rows that are shown are bound again.
+
+        :param new_count: An int.
+        :return: None.
+        """
+        self._row_count = new_count
+        self.refresh()
+
+    @property
+    def row_height(self) -> int:
+        """
+        Get the height of every row in pixels.
+
+        :return: An int.
+        """
+        if self._row_height is None:
+            row = self._make_row()
+            self.update_idletasks()
+            self._row_height = max(1, row.winfo_reqheight())
+        return self._row_height
+
+    @property
+    def rows(self) -> List[tk.Widget]:
+        """
+        Get the row widgets that were made so far.
+
+        :return: A list of row widgets.
+        """
+        return list(self._rows)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Get whether the rows in this frame are in normal mode or disabled
+        mode. (grayed out and cannot interact with)
+
+        :return: A bool, True if normal otherwise False.
+        """
+        return self.body.enabled
+
+    @enabled.setter
+    def enabled(self, new_state: bool) -> None:
+        """
+        Set whether the rows in this frame are in normal mode or disabled
+        mode. (grayed out and cannot interact with) Rows made later get the
+        same state.
+
+        :param new_state: The new state (a bool) True for enabled and False
+        for disabled.
+        :return: None.
+        """
+        self._enabled = new_state
+        self.body.enabled = new_state
+
+    def refresh(self) -> None:
+        """
+        Bind every row widget that is shown again. Call this after the data
+        changed.
+
+        :return: None.
+        """
+        for row in self._rows:
+            self._bound[row] = None
+        self._layout()
+
+    def scroll_to(self, index: int) -> None:
+        """
+        Scroll so that we can see a row.
+
+        :param index: The index of the row. Raises IndexError if it is not
+         less than row_count.
+        :return: None.
+        """
+        if not 0 <= index < self._row_count:
+            raise IndexError(
+                f"index is out of range! "
+                f"(index passed in: {index} "
+                f"row count: {self._row_count})"
+            )
+        top = index * self.row_height
+        bottom = top + self.row_height - self._view_height()
+        if top < self._offset:
+            self._offset = top
+        elif bottom > self._offset:
+            self._offset = bottom
+        self._layout()
+
+    def yview(self, *args) -> Union[Tuple[float, float], None]:
+        """
+        Query or change the vertical position of the view. This is what the
+        scrollbar calls.
+
+        :param args: Nothing to query, ("moveto", fraction) or
+         ("scroll", number, "units" or "pages")
+        :return: A tuple of the first and last visible fractions when
+         querying, otherwise None.
+        """
+        if not args:
+            return self._fractions()
+        if args[0] == tk.MOVETO:
+            self._offset = int(float(args[1]) * self._row_count * self.row_height)
+        elif args[0] == tk.SCROLL:
+            amount = int(args[1]) * self.row_height
+            if args[2] == tk.PAGES:
+                visible = max(1, self._view_height() // self.row_height - 1)
+                amount *= visible
+            self._offset += amount
+        self._layout()
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        """
+        Scroll so that the fraction of the rows is at the top.
+
+        :param fraction: A float between 0 and 1.
+        :return: None.
+        """
+        self.yview(tk.MOVETO, fraction)
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        """
+        Scroll by a number of rows or pages.
+
+        :param number: How many rows or pages to scroll, an int.
+        :param what: Either "units" or "pages".
+        :return: None.
+        """
+        self.yview(tk.SCROLL, number, what)
+
+    def _fractions(self) -> Tuple[float, float]:
+        """
+        Get the first and last visible fractions of the rows.
+
+        :return: A tuple of two floats.
+        """
+        total = self._row_count * self.row_height
+        if total == 0:
+            return 0.0, 1.0
+        return (
+            self._offset / total,
+            min(1.0, (self._offset + self._view_height()) / total),
+        )
+
+    def _view_height(self) -> int:
+        """
+        Get the height of the view in pixels.
+
+        :return: An int.
+        """
+        if self.body.winfo_ismapped():
+            return self.body.winfo_height()
+        return int(self.body.cget("height"))
+
+    def _make_row(self) -> tk.Widget:
+        """
+        Make a new row widget and add it to the pool.
+
+        :return: The row widget.
+        """
+        row = self.make_row(self.body)
+        if not self.body.enabled:
+            if hasattr(row, "enabled"):
+                row.enabled = False
+            else:
+                enable_children(row, False)
+        self._rows.append(row)
+        self._bound[row] = None
+        return row
+
+    def _layout(self) -> None:
+        """
+        Place the row widgets for the current view, making more if the view
+        got bigger and binding the ones that show a different row now.
+
+        :return: None.
+        """
+        row_height = self.row_height
+        view_height = self._view_height()
+        total = self._row_count * row_height
+        self._offset = max(0, min(self._offset, total - view_height))
+        first = self._offset // row_height
+        needed = min(view_height // row_height + 2, self._row_count - first)
+        while len(self._rows) < needed:
+            self._make_row()
+        wanted = set(range(first, first + needed))
+        # Keep the row widgets that already show a row that is still shown
+        free = []
+        placed: Dict[int, tk.Widget] = {}
+        for row in self._rows:
+            index = self._bound[row]
+            if index in wanted and index not in placed:
+                placed[index] = row
+            else:
+                free.append(row)
+        for index in range(first, first + needed):
+            row = placed.get(index)
+            if row is None:
+                row = free.pop()
+                self.bind_row(row, index)
+                self._bound[row] = index
+            row.place(
+                x=0,
+                y=index * row_height - self._offset,
+                relwidth=1,
+                height=row_height,
+            )
+        for row in free:
+            self._bound[row] = None
+            row.place_forget()
+        self._scrollbar.set(*self._fractions())
+
+    def destroy(self) -> None:
+        """
+        Destroy this frame.
+
+        :return: None.
+        """
+        unregister_scrollable(self)
+        super().destroy()
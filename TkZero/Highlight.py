@@ -0,0 +1,283 @@
+"""
+Highlight the syntax of a Text as it is edited. A lexer turns one line at a
+time into tokens, starting from the state the previous line ended in. The
+highlighter remembers the state at the start of every line, so after an edit
+only the changed lines are lexed again, and the lines after them only until
+their start state is the same as before.
+"""
+
+import re
+import tkinter as tk
+from time import perf_counter
+from typing import Dict, Hashable, Iterable, List, Set, Tuple, Union
+
+from TkZero.Text import Text
+
+# A token is the start and end column of a part of a line and the tag for it
+Token = Tuple[int, int, str]
+
+
+class Lexer:
+    """
+    The base class for lexers. Subclasses must set initial_state and tags and
+    implement lex_line.
+    """
+
+    # The state at the start of the text, should be hashable
+    initial_state: Hashable = None
+    # The names of all the tags that lex_line can return
+    tags: Tuple[str, ...] = ()
+
+    def lex_line(self, line: str, state: Hashable) -> Tuple[List[Token], Hashable]:
+        """
+        Lex one line.
+
+        :param line: A str of the line, without the newline.
+        :param state: The state at the start of the line.
+        :return: A tuple of a list of tokens, which are (start, end, tag)
+         tuples, and the state at the end of the line.
+        """
+        raise NotImplementedError
+
+
+class RegexLexer(Lexer):
+    """
+    A lexer made of regular expression rules per state. The state is a stack
+    of state names, so rules can enter a state and pop back out of it.
+    """
+
+    def __init__(
+        self,
+        rules: Dict[str, Iterable[Tuple[str, Union[str, None], Union[str, None]]]],
+        initial_state: str = "root",
+        flags: int = 0,
+    ):
+        """
+        Create a lexer from rules.
+
+        :param rules: A dict of state names to lists of (pattern, tag,
+         next_state) tuples. The first rule that matches earliest in the line
+         wins. tag can be None to not highlight the match. next_state can be
+         None to stay in the same state, a state name to enter it, or "#pop"
+         to go back to the state before.
+        :param initial_state: The name of the state at the start of the text.
+         Defaults to "root".
+        :param flags: The flags for re.compile. Defaults to 0.
+        """
+        self.initial_state = (initial_state,)
+        self._rules: Dict[str, Tuple[re.Pattern, List[Tuple[str, str]]]] = {}
+        tags = []
+        for state, state_rules in rules.items():
+            patterns = []
+            actions = []
+            for index, (pattern, tag, next_state) in enumerate(state_rules):
+                patterns.append(f"(?P<_{index}>{pattern})")
+                actions.append((tag, next_state))
+                if tag is not None and tag not in tags:
+                    tags.append(tag)
+            self._rules[state] = (re.compile("|".join(patterns), flags), actions)
+        self.tags = tuple(tags)
+
+    def lex_line(
+        self, line: str, state: Tuple[str, ...]
+    ) -> Tuple[List[Token], Tuple[str, ...]]:
+        tokens = []
+        position = 0
+        while position <= len(line):
+            regex, actions = self._rules[state[-1]]
+            match = regex.search(line, position)
+            if match is None:
+                break
+            tag, next_state = actions[int(match.lastgroup[1:])]
+            start, end = match.span()
+            if tag is not None and end > start:
+                tokens.append((start, end, tag))
+            old_state = state
+            if next_state == "#pop":
+                state = state[:-1] or state
+            elif next_state is not None:
+                state = state + (next_state,)
+            if end == start and state == old_state:
+                # An empty match that doesn't change the state would match
+                # again forever
+                end += 1
+            position = end
+        return tokens, state
+
+
+class Highlighter:
+    """
+    Highlights a TkZero.Text.Text with a lexer, keeping up with its edits.
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        lexer: Lexer,
+        styles: Dict[str, Dict[str, str]] = None,
+        budget: int = 10,
+        lines_per_block: int = 200,
+        off_screen_delay: int = 20,
+    ):
+        """
+        Start highlighting a text.
+
+        :param text: The TkZero.Text.Text to highlight.
+        :param lexer: The TkZero.Highlight.Lexer to use.
+        :param styles: A dict of tag names to dicts of options for
+         tag_configure, like {"keyword": {"foreground": "blue"}}. Defaults to
+         None.
+        :param budget: How many milliseconds to spend highlighting before
+         letting Tk handle other events. Defaults to 10.
+        :param lines_per_block: How many lines to get from Tk at once.
+         Defaults to 200.
+        :param off_screen_delay: How many milliseconds to wait before
+         highlighting more lines when the next ones are below the visible
+         part of the text. Defaults to 20.
+        """
+        self.text = text
+        self.lexer = lexer
+        self.budget = budget
+        self.lines_per_block = lines_per_block
+        self.off_screen_delay = off_screen_delay
+        for tag, options in (styles or {}).items():
+            self.text.tag_configure(tag, **options)
+        # The state at the start of every line (index 0 is line 1) and after
+        # the last line. None means it isn't known yet.
+        self._states: List[Hashable] = [self.lexer.initial_state] + [None] * (
+            self._line_count()
+        )
+        self._dirty: Set[int] = {1}
+        self._after_id = None
+        self._bind_id = self.text.bind("<<TextModified>>", self._on_modified, True)
+        self._schedule()
+
+    def _line_count(self) -> int:
+        """
+        Get the number of lines in the text.
+
+        :return: An int.
+        """
+        return int(self.text.index("end-1c").split(".")[0])
+
+    def _last_visible_line(self) -> int:
+        """
+        Get the number of the last line that can be seen.
+
+        :return: An int.
+        """
+        return int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+
+    def _on_modified(self, event) -> None:
+        """
+        Mark the lines that changed as dirty.
+
+        :param event: An event that Tkinter passes in.
+        :return: None.
+        """
+        for change in self.text.changes:
+            start = int(change.start.split(".")[0])
+            end = int(change.end.split(".")[0])
+            new_end = int(change.new_end.split(".")[0])
+            # The start states of the lines after start up to end are gone
+            # and the lines up to new_end are new
+            self._states[start:end] = [None] * (new_end - start)
+            delta = new_end - end
+            dirty = set(range(start, new_end + 1))
+            for line in self._dirty:
+                if line <= start:
+                    dirty.add(line)
+                elif line > end:
+                    dirty.add(line + delta)
+            self._dirty = dirty
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """
+        Schedule highlighting the dirty lines, soon if they are visible.
+
+        :return: None.
+        """
+        if self._after_id is not None or not self._dirty:
+            return
+        if min(self._dirty) <= self._last_visible_line():
+            self._after_id = self.text.after_idle(self._work)
+        else:
+            self._after_id = self.text.after(self.off_screen_delay, self._work)
+
+    def _highlight_block(self) -> None:
+        """
+        Lex the first dirty line and the lines after it until the states
+        converge or the block ends, then tag them.
+
+        :return: None.
+        """
+        line_count = self._line_count()
+        first = min(self._dirty)
+        if first > line_count:
+            self._dirty = {line for line in self._dirty if line <= line_count}
+            return
+        last = min(first + self.lines_per_block - 1, line_count)
+        lines = self.text.get(f"{first}.0", f"{last}.end").split("\n")
+        ranges: Dict[str, List[str]] = {tag: [] for tag in self.lexer.tags}
+        number = first - 1
+        for line in lines:
+            number += 1
+            self._dirty.discard(number)
+            state = self._states[number - 1]
+            if state is None:
+                state = self.lexer.initial_state
+            tokens, end_state = self.lexer.lex_line(line, state)
+            for start, end, tag in tokens:
+                ranges.setdefault(tag, []).extend(
+                    (f"{number}.{start}", f"{number}.{end}")
+                )
+            if self._states[number] != end_state:
+                self._states[number] = end_state
+                if number < line_count:
+                    self._dirty.add(number + 1)
+            if number + 1 not in self._dirty:
+                break
+        for tag, indices in ranges.items():
+            self.text.tag_remove(tag, f"{first}.0", f"{number}.end")
+            if indices:
+                self.text.tag_add(tag, *indices)
+
+    def _work(self) -> None:
+        """
+        Highlight dirty lines until the budget runs out.
+
+        :return: None.
+        """
+        self._after_id = None
+        if not self.text.winfo_exists():
+            return
+        deadline = perf_counter() + self.budget / 1000
+        while self._dirty and perf_counter() < deadline:
+            self._highlight_block()
+        self._schedule()
+
+    def flush(self) -> None:
+        """
+        Highlight all the dirty lines right now.
+
+        :return: None.
+        """
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+        while self._dirty:
+            self._highlight_block()
+
+    def close(self) -> None:
+        """
+        Stop highlighting and remove the tags.
+
+        :return: None.
+        """
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+        self.text.unbind("<<TextModified>>", self._bind_id)
+        for tag in self.lexer.tags:
+            self.text.tag_remove(tag, "1.0", tk.END)
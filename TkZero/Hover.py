@@ -0,0 +1,38 @@
+"""
+Track whether the mouse is over a widget. Widgets get a bindtag that is bound
+once per interpreter, instead of binding <Enter> and <Leave> on every widget.
+"""
+
+import tkinter as tk
+
+HOVER_BINDTAG = "TkZeroHover"
+
+
+def _on_hover(event, is_hovering: bool) -> None:
+    """
+    Tell the widget in the event whether the mouse is over it.
+
+    :param event: An event that Tkinter passes in.
+    :param is_hovering: A bool.
+    :return: None.
+    """
+    set_hover_state = getattr(event.widget, "_set_hover_state", None)
+    if set_hover_state is not None:
+        set_hover_state(is_hovering)
+
+
+def track_hover(widget: tk.Misc) -> None:
+    """
+    Keep the hovering_over property of a widget up to date. The widget must
+    have a _set_hover_state(is_hovering) method.
+
+    :param widget: The widget to track.
+    :return: None.
+    """
+    root = widget._root()
+    if not getattr(root, "_tkzero_hover_bound", False):
+        widget.bind_class(HOVER_BINDTAG, "<Enter>", lambda e: _on_hover(e, True))
+        widget.bind_class(HOVER_BINDTAG, "<Leave>", lambda e: _on_hover(e, False))
+        root._tkzero_hover_bound = True
+    tags = widget.bindtags()
+    widget.bindtags(tags[:1] + (HOVER_BINDTAG,) + tags[1:])
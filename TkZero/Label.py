@@ -8,6 +8,9 @@ from typing import Union
 
 from PIL.ImageTk import PhotoImage
 
+from TkZero import Batch
+from TkZero.Hover import track_hover
+
 
 class DisplayModes:
     """
@@ -52,8 +55,7 @@ class Label(ttk.Label):
         if image is not None:
             self.image = image
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def text(self) -> str:
@@ -62,7 +64,7 @@ class Label(ttk.Label):
 
         :return: A str of the text on this label.
         """
-        return self.cget("text")
+        return Batch.read(self, "text", lambda: self.cget("text"))
 
     @text.setter
     def text(self, new_text: str) -> None:
@@ -72,7 +74,7 @@ class Label(ttk.Label):
         :param new_text: The new text.
         :return: None.
         """
-        self.configure(text=new_text)
+        Batch.write(self, "text", new_text, lambda text: self.configure(text=text))
 
     @property
     def image(self) -> Union[PhotoImage, None]:
@@ -137,7 +139,7 @@ class Label(ttk.Label):
         :return: None.
         """
         self._enabled = new_state
-        self.state(["!disabled" if self._enabled else "disabled"])
+        Batch.write_enabled(self, new_state)
 
     @property
     def hovering_over(self) -> bool:
@@ -6,6 +6,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union
 
+from TkZero.Enable import enable_children
+from TkZero.Hover import track_hover
+
 
 class Labelframe(ttk.Labelframe):
     def __init__(
@@ -22,8 +25,7 @@ class Labelframe(ttk.Labelframe):
         self._style_root = "TLabelframe"
         self._enabled = True
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def width(self) -> int:
@@ -73,28 +75,6 @@ class Labelframe(ttk.Labelframe):
             )
         self.configure(height=new_height)
 
-    def _enable_children(
-        self, parent: Union[tk.Widget, None] = None, enable: bool = True
-    ) -> None:
-        """
-        Enable or disable the children.
-
-        :param parent: A tk.Widget that is our parent. If None then default to
-         self.
-        :param enable: Whether to enable or disable the children.
-        :return: None.
-        """
-        if parent is None:
-            parent = self
-        for child in parent.winfo_children():
-            if child.winfo_class() not in ("Frame", "LabelFrame"):
-                try:
-                    child.state(["!disabled" if enable else "disabled"])
-                except AttributeError:
-                    child.configure(state=tk.NORMAL if enable else tk.DISABLED)
-            else:
-                self._enable_children(parent, enable)
-
     @property
     def enabled(self) -> bool:
         """
@@ -116,7 +96,7 @@ class Labelframe(ttk.Labelframe):
         :return: None.
         """
         self._enabled = new_state
-        self._enable_children(enable=self._enabled)
+        enable_children(self, self._enabled)
 
     @property
     def hovering_over(self) -> bool:
@@ -0,0 +1,403 @@
+"""
+Creates a read only text that shows a file of any size. The file is memory
+mapped and only the lines around the view are put in Tk.
+"""
+
+import mmap
+import tkinter as tk
+from array import array
+from threading import Thread, Event
+from typing import Union, Callable, Tuple
+
+from TkZero.Scheduler import Job, Scheduler
+from TkZero.Text import Text, TextWrap
+
+# How many bytes the index thread scans before checking if it should stop
+_INDEX_CHUNK = 1 << 20
+
+
+class LargeFileView(Text):
+    def __init__(
+        self,
+        parent: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]],
+        path: str = None,
+        width: int = None,
+        height: int = None,
+        wrapping: str = TextWrap.NoWrapping,
+        encoding: str = "utf-8",
+        overscan: int = 200,
+        on_indexed: Callable[[], None] = None,
+    ):
+        """
+        Initiate a large file view. The file is memory mapped and a thread
+        finds where every line starts, so the view can be scrolled while the
+        file is still being indexed. Only the visible lines (plus a few lines
+        of overscan on each side) are in Tk, so memory depends on the size of
+        the view and not the size of the file, except for 8 bytes per line
+        for the index.
+
+        :param parent: The parent of the view.
+        :param path: The path of the file to show. Defaults to None.
+        :param width: The width of the view. Defaults to None.
+        :param height: The height of the view. Defaults to None.
+        :param wrapping: How to wrap words in the view. Defaults to
+         TextWrap.NoWrapping, because wrapped lines make the scrollbar less
+         accurate.
+        :param encoding: The encoding of the file. Bytes that can't be decoded
+         are replaced. Defaults to "utf-8".
+        :param overscan: How many lines to keep in Tk above and below the
+         visible lines. Should be an int and defaults to 200.
+        :param on_indexed: A function that is called when the whole file is
+         indexed. Defaults to None.
+        """
+        super().__init__(parent=parent, width=width, height=height, wrapping=wrapping)
+        self.configure(undo=False)
+        self._readonly = True
+        self.encoding = encoding
+        self.on_indexed = on_indexed
+        self._overscan = max(1, overscan)
+        self._path = None
+        self._file = None
+        self._map: Union[mmap.mmap, bytes] = b""
+        # Where every line starts in the file, filled in by the index thread
+        self._offsets = array("q", [0])
+        self._indexed = True
+        self._stop = Event()
+        self._thread = None
+        self._poll_job: Union[Job, None] = None
+        # Logical index of the first line in Tk and how many lines are in Tk
+        self._first = 0
+        self._rendered = 0
+        # Logical index of the line at the top of the view
+        self._top = 0
+        self._visible = int(self.cget("height")) or 24
+        self._rendering = False
+        self._yscrollcommand = None
+        tk.Text.configure(self, yscrollcommand=self._on_tk_scroll)
+        if path is not None:
+            self.open(path)
+
+    @property
+    def path(self) -> Union[str, None]:
+        """
+        Get the path of the file that is shown.
+
+        :return: A str or None if no file is open.
+        """
+        return self._path
+
+    @property
+    def indexed(self) -> bool:
+        """
+        Get whether the whole file has been indexed.
+
+        :return: A bool.
+        """
+        return self._indexed
+
+    @property
+    def line_count(self) -> int:
+        """
+        Get how many lines are known. This grows while the file is indexed.
+
+        :return: An int.
+        """
+        count = len(self._offsets)
+        if not self._indexed or self._offsets[-1] == len(self._map):
+            # The last line isn't known to be complete, or it is the empty
+            # line after a newline at the end of the file
+            count -= 1
+        return count
+
+    def open(self, path: str) -> None:
+        """
+        Show a file, closing the one that was shown.
+
+        :param path: The path of the file.
+        :return: None.
+        """
+        self.close_file()
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            self._map = b""
+        self._path = str(path)
+        self._offsets = array("q", [0])
+        self._indexed = False
+        self._stop = Event()
+        self._thread = Thread(
+            target=self._index, args=(self._map, self._offsets, self._stop), daemon=True
+        )
+        self._thread.start()
+        self._render(0, force=True)
+        self._poll_job = Scheduler.of(self).call_later(
+            50, self._poll_index, pausable=False
+        )
+
+    def close_file(self) -> None:
+        """
+        Stop showing the file and close it.
+
+        :return: None.
+        """
+        if self._poll_job is not None:
+            self._poll_job.cancel()
+            self._poll_job = None
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._path = None
+        self._offsets = array("q", [0])
+        self._indexed = True
+        if self.winfo_exists():
+            self._render(0, force=True)
+
+    def destroy(self) -> None:
+        """
+        Close the file and destroy this view.
+
+        :return: None.
+        """
+        self.close_file()
+        super().destroy()
+
+    @staticmethod
+    def _index(data: Union[mmap.mmap, bytes], offsets: array, stop: Event) -> None:
+        """
+        Find where every line starts. This runs in its own thread.
+
+        :param data: The mapped file.
+        :param offsets: The array to add the offsets to.
+        :param stop: An Event that is set when the thread should stop.
+        :return: None.
+        """
+        size = len(data)
+        start = 0
+        while start < size and not stop.is_set():
+            end = min(size, start + _INDEX_CHUNK)
+            position = data.find(b"\n", start, end)
+            while position != -1:
+                offsets.append(position + 1)
+                position = data.find(b"\n", position + 1, end)
+            start = end
+
+    def _poll_index(self) -> None:
+        """
+        Show the lines that were indexed since the last time and check if the
+        index thread is done.
+
+        :return: None.
+        """
+        self._poll_job = None
+        if not self._thread.is_alive():
+            self._indexed = True
+        if self._first + self._rendered < min(
+            self.line_count, self._top + self._visible + self._overscan
+        ):
+            self._render(self._top, force=True)
+        else:
+            self._notify_scroll()
+        if self._indexed:
+            if self.on_indexed is not None:
+                self.on_indexed()
+        else:
+            self._poll_job = Scheduler.of(self).call_later(
+                100, self._poll_index, pausable=False
+            )
+
+    def get_line(self, line: int) -> str:
+        """
+        Get a line of the file.
+
+        :param line: The number of the line, starting at 1.
+        :return: A str, without the newline.
+        """
+        return self._read_lines(line - 1, line)
+
+    def _read_lines(self, first: int, last: int) -> str:
+        """
+        Read and decode lines from the file.
+
+        :param first: The logical index of the first line.
+        :param last: The logical index after the last line.
+        :return: A str of the lines, without a newline at the end.
+        """
+        if last <= first:
+            return ""
+        start = self._offsets[first]
+        if last < len(self._offsets):
+            end = self._offsets[last] - 1
+        else:
+            end = len(self._map)
+        if end > start and self._map[end - 1 : end] == b"\r":
+            end -= 1
+        data = self._map[start:end].decode(self.encoding, errors="replace")
+        return data.replace("\r\n", "\n")
+
+    def scroll_to_line(self, line: int) -> None:
+        """
+        Scroll so that we can see a line.
+
+        :param line: The number of the line, starting at 1.
+        :return: None.
+        """
+        index = line - 1
+        if index < self._top:
+            self._render(index)
+        elif index >= self._top + self._visible:
+            self._render(index - self._visible + 1)
+
+    def yview(self, *args) -> Union[Tuple[float, float], None]:
+        """
+        Query or change the vertical position of the view, in terms of the
+        whole file instead of the lines in Tk. This is what scrollbars call.
+
+        :param args: Nothing to query, ("moveto", fraction) or
+         ("scroll", number, "units" or "pages")
+        :return: A tuple of the first and last visible fractions when
+         querying, otherwise None.
+        """
+        if not args:
+            return self._fractions()
+        if args[0] == tk.MOVETO:
+            self._render(int(float(args[1]) * self.line_count))
+        elif args[0] == tk.SCROLL:
+            amount = int(args[1])
+            if args[2] == tk.PAGES:
+                amount *= self._visible
+            self._render(self._top + amount)
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        """
+        Scroll so that the fraction of the file is at the top.
+
+        :param fraction: A float between 0 and 1.
+        :return: None.
+        """
+        self.yview(tk.MOVETO, fraction)
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        """
+        Scroll by a number of units or pages.
+
+        :param number: How many units or pages to scroll, an int.
+        :param what: Either "units" or "pages".
+        :return: None.
+        """
+        self.yview(tk.SCROLL, number, what)
+
+    def configure(self, cnf=None, **kwargs):
+        """
+        Configure the view. The yscrollcommand option is kept on the Python
+        side so that it gets fractions of the whole file.
+        """
+        if cnf is not None and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            kwargs["yscrollcommand"] = cnf.pop("yscrollcommand")
+        if "yscrollcommand" in kwargs:
+            self._yscrollcommand = kwargs.pop("yscrollcommand")
+            self._notify_scroll()
+            if not kwargs and not cnf:
+                return None
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    def _fractions(self) -> Tuple[float, float]:
+        """
+        Get the first and last visible fractions of the file.
+
+        :return: A tuple of two floats.
+        """
+        count = self.line_count
+        if count == 0:
+            return 0.0, 1.0
+        return self._top / count, min(count, self._top + self._visible) / count
+
+    def _notify_scroll(self) -> None:
+        """
+        Tell whatever is attached with yscrollcommand where we are.
+
+        :return: None.
+        """
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+
+    def _render(self, top: int, force: bool = False) -> None:
+        """
+        Make sure that the lines starting from the logical index top are in
+        Tk and are at the top of the view.
+
+        :param top: The logical index that should be at the top of the view.
+        :param force: Whether to read the lines again even if top is already
+         inside them.
+        :return: None.
+        """
+        count = self.line_count
+        top = max(0, min(top, count - self._visible))
+        first = max(0, top - self._overscan)
+        last = min(count, top + self._visible + self._overscan)
+        margin = self._overscan // 2
+        inside = (
+            self._first <= top
+            and top + self._visible <= self._first + self._rendered
+            and (top - self._first >= margin or self._first == 0)
+            and (
+                self._first + self._rendered - (top + self._visible) >= margin
+                or self._first + self._rendered == count
+            )
+        )
+        self._rendering = True
+        try:
+            if force or not inside:
+                # Go around the proxy, this isn't an edit of the file
+                state = self.tk.call(self._orig, "cget", "-state")
+                self.tk.call(self._orig, "configure", "-state", tk.NORMAL)
+                self.tk.call(self._orig, "delete", "1.0", tk.END)
+                self.tk.call(self._orig, "insert", "1.0", self._read_lines(first, last))
+                self.tk.call(self._orig, "configure", "-state", state)
+                self._first = first
+                self._rendered = last - first
+            self._top = top
+            self.tk.call(self._orig, "yview", f"{top - self._first + 1}.0")
+        finally:
+            self._rendering = False
+        self._notify_scroll()
+
+    def _on_tk_scroll(self, first: str, last: str) -> None:
+        """
+        Called by Tk whenever the view of the lines in Tk changes, like when
+        scrolling with the mousewheel or the keyboard. Keeps our logical
+        position in sync and slides the lines in Tk if we got close to their
+        edges.
+
+        :param first: The first visible fraction of the lines in Tk.
+        :param last: The last visible fraction of the lines in Tk.
+        :return: None.
+        """
+        if self._rendering or self._rendered == 0:
+            return
+        first, last = float(first), float(last)
+        self._visible = max(1, round((last - first) * self._rendered))
+        self._render(self._first + round(first * self._rendered))
+
+    def _update_context_menu_states(self) -> None:
+        """
+        Update the context menu states. The file can't be edited, so only
+        copying and selecting are allowed.
+
+        :return: None.
+        """
+        super()._update_context_menu_states()
+        for label in ("Undo", "Redo", "Cut", "Paste", "Delete"):
+            self._context_menu.entryconfigure(label, state=tk.DISABLED)
@@ -3,7 +3,11 @@ Creates a "classic" Listbox
 """
 
 import tkinter as tk
-from typing import Union, Callable, Tuple, List
+from typing import Union, Callable, Tuple, List, Sequence, Set
+
+from TkZero import Diff
+from TkZero import Platform
+from TkZero.Hover import track_hover
 
 
 class SelectModes:
@@ -59,8 +63,7 @@ class Listbox(tk.Listbox):
             self.bind("<<Double-1>>", lambda event: on_double_click())
         self._enabled = True
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def selected(self) -> Tuple[int]:
@@ -96,13 +99,94 @@ class Listbox(tk.Listbox):
     @values.setter
     def values(self, new_values: Union[List[str], Tuple[str, ...]]) -> None:
         """
-        Set the items on this combobox.
+        Set the items on this listbox. Only the rows that actually changed
+        are inserted or deleted in Tk, so the selection and the scroll
+        position of the rows that stayed the same are kept.
 
         :param new_values: The new items, as a list or tuple of str.
         :return: None.
         """
-        self._values = [str(item) for item in new_values]
-        self._variable.set(self._values)
+        new_values = [str(item) for item in new_values]
+        edits = Diff.sequence_edits(self._values, new_values)
+
+        def apply() -> None:
+            for _, i1, i2, j1, j2 in reversed(edits):
+                if i2 > i1:
+                    tk.Listbox.delete(self, i1, i2 - 1)
+                if j2 > j1:
+                    tk.Listbox.insert(self, i1, *new_values[j1:j2])
+
+        if edits:
+            self._edit_anyway(apply)
+        self._values = new_values
+
+    def _edit_anyway(self, edit: Callable[[], None]) -> None:
+        """
+        Make an edit even if this listbox is disabled, because Tk ignores
+        inserts and deletes then.
+
+        :param edit: A function that edits the items.
+        :return: None.
+        """
+        disabled = str(self.cget("state")) == tk.DISABLED
+        if disabled:
+            tk.Listbox.configure(self, state=tk.NORMAL)
+        try:
+            edit()
+        finally:
+            if disabled:
+                tk.Listbox.configure(self, state=tk.DISABLED)
+
+    def insert(self, index: Union[int, str], *elements: str) -> None:
+        """
+        Insert items before the index. This keeps the values property in
+        sync.
+
+        :param index: The index to insert before, as an int or a str like
+         "end".
+        :param elements: The items to insert, as str.
+        :return: None.
+        """
+        position = min(self.index(index), len(self._values))
+        self._edit_anyway(lambda: tk.Listbox.insert(self, index, *elements))
+        self._values[position:position] = [str(item) for item in elements]
+
+    def delete(self, first: Union[int, str], last: Union[int, str] = None) -> None:
+        """
+        Delete the items from first to last. (inclusive) This keeps the values
+        property in sync.
+
+        :param first: The index of the first item to delete, as an int or a
+         str like "end".
+        :param last: The index of the last item to delete. Defaults to None,
+         which only deletes the first item.
+        :return: None.
+        """
+        start = max(0, self._delete_index(first))
+        stop = self._delete_index(last) if last is not None else start
+        self._edit_anyway(lambda: tk.Listbox.delete(self, first, last))
+        del self._values[start : stop + 1]
+
+    def _delete_index(self, index: Union[int, str]) -> int:
+        """
+        Resolve an index the same way Tk does when deleting, where "end" means
+        the last item instead of one past it.
+
+        :param index: The index as an int or a str like "end".
+        :return: An int.
+        """
+        if index == tk.END:
+            return len(self._values) - 1
+        return self.index(index)
+
+    def append(self, *items: str) -> None:
+        """
+        Add items to the end of this listbox without touching the other rows.
+
+        :param items: The items to add, as str.
+        :return: None.
+        """
+        self.insert(tk.END, *items)
 
     def scroll_to(self, index: int) -> None:
         """
@@ -160,3 +244,437 @@ class Listbox(tk.Listbox):
         :return: None.
         """
         self._hovering_over = is_hovering
+
+
+class VirtualListbox(Listbox):
+    def __init__(
+        self,
+        parent: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]],
+        source: Sequence = None,
+        select_mode: str = SelectModes.Single,
+        height: int = None,
+        width: int = None,
+        on_select: Callable = None,
+        on_double_click: Callable = None,
+        overscan: int = 20,
+    ):
+        """
+        Initiate a virtual listbox. Instead of copying every item into Tk,
+        only the rows in the visible window (plus a few rows of overscan on
+        each side) are handed to Tk, so the source can be huge.
+
+        :param parent: The parent of the listbox.
+        :param source: The items to show. Can be anything with a length and
+         that can be indexed with an int, like a list or an object that
+         implements __len__ and __getitem__. Items are converted with str()
+         when they are shown. Defaults to [].
+        :param select_mode: The select mode to use. (allows you to select one
+         or more items or not) Should be a str and defaults to
+         SelectModes.Single
+        :param height: The height of the listbox. Defaults to None.
+        :param width: The width of the listbox. Defaults to None.
+        :param on_select: The function to call when the selection changes.
+        :param on_double_click: The function to call when an item is double
+         clicked.
+        :param overscan: How many rows to keep rendered above and below the
+         visible rows. Should be an int and defaults to 20.
+        """
+        super().__init__(
+            parent=parent,
+            select_mode=select_mode,
+            height=height,
+            width=width,
+            on_double_click=on_double_click,
+        )
+        self._source = source if source is not None else []
+        self._overscan = max(1, overscan)
+        self._on_select = on_select
+        # Logical index of the first row in Tk and how many rows are in Tk
+        self._first = 0
+        self._rendered = 0
+        # Logical index of the row at the top of the view
+        self._top = 0
+        self._visible = int(self.cget("height")) or 10
+        self._selected: Set[int] = set()
+        self._extend_selection = False
+        self._rendering = False
+        self._yscrollcommand = None
+        tk.Listbox.configure(self, yscrollcommand=self._on_tk_scroll)
+        self.bind("<<ListboxSelect>>", self._sync_selection)
+        self.bind("<ButtonPress-1>", self._remember_modifiers, add=True)
+        self.bind("<KeyPress>", self._remember_modifiers, add=True)
+        self._render(0)
+
+    @property
+    def source(self) -> Sequence:
+        """
+        Get the items that back this listbox.
+
+        :return: The sequence that was passed in. (no copy is made)
+        """
+        return self._source
+
+    @source.setter
+    def source(self, new_source: Sequence) -> None:
+        """
+        Set the items that back this listbox. The selection is cleared and
+        the view is scrolled back to the top.
+
+        :param new_source: Anything with a length and that can be indexed
+         with an int.
+        :return: None.
+        """
+        self._source = new_source
+        self._selected = set()
+        self._render(0, force=True)
+
+    @property
+    def values(self) -> Sequence:
+        """
+        Get the items that back this listbox. Same as the source property.
+
+        :return: The sequence that backs this listbox.
+        """
+        return self._source
+
+    @values.setter
+    def values(self, new_values: Sequence) -> None:
+        """
+        Set the items that back this listbox. Same as the source property.
+
+        :param new_values: Anything with a length and that can be indexed
+         with an int.
+        :return: None.
+        """
+        self.source = new_values
+
+    def refresh(self) -> None:
+        """
+        Re-read the rendered rows from the source. Call this after the source
+        was modified in place, like after appending to it.
+
+        :return: None.
+        """
+        length = len(self._source)
+        self._selected = {index for index in self._selected if index < length}
+        self._render(self._top, force=True)
+
+    def append(self, *items) -> None:
+        """
+        Add items to the end of the source, which must be mutable (like a
+        list) and show them if they are close to the view.
+
+        :param items: The items to add.
+        :return: None.
+        """
+        rendered_to_end = self._first + self._rendered >= len(self._source)
+        self._source.extend(items)
+        if rendered_to_end:
+            self._render(self._top, force=True)
+        else:
+            self._notify_scroll()
+
+    def _source_index(self, index: Union[int, str], end: int) -> int:
+        """
+        Resolve an index into the source. Str indices other than "end" are
+        resolved by Tk against the rendered rows.
+
+        :param index: The index as an int or a str.
+        :param end: What "end" means.
+        :return: An int.
+        """
+        if index == tk.END:
+            return end
+        if isinstance(index, int):
+            return index
+        return self._first + tk.Listbox.index(self, index)
+
+    def insert(self, index: Union[int, str], *elements) -> None:
+        """
+        Insert items into the source, which must be mutable (like a list),
+        before the index.
+
+        :param index: The index into the source to insert before, as an int
+         or "end".
+        :param elements: The items to insert.
+        :return: None.
+        """
+        length = len(self._source)
+        position = max(0, min(self._source_index(index, length), length))
+        self._source[position:position] = list(elements)
+        self._selected = {
+            selected + len(elements) if selected >= position else selected
+            for selected in self._selected
+        }
+        self._render(self._top, force=True)
+
+    def delete(self, first: Union[int, str], last: Union[int, str] = None) -> None:
+        """
+        Delete the items from first to last (inclusive) from the source, which
+        must be mutable (like a list).
+
+        :param first: The index into the source of the first item to delete,
+         as an int or "end".
+        :param last: The index of the last item to delete. Defaults to None,
+         which only deletes the first item.
+        :return: None.
+        """
+        start = max(0, self._source_index(first, len(self._source) - 1))
+        stop = start
+        if last is not None:
+            stop = self._source_index(last, len(self._source) - 1)
+        if stop < start:
+            return
+        del self._source[start : stop + 1]
+        count = stop + 1 - start
+        self._selected = {
+            selected - count if selected > stop else selected
+            for selected in self._selected
+            if not start <= selected <= stop
+        }
+        self._render(self._top, force=True)
+
+    @property
+    def selected(self) -> Tuple[int, ...]:
+        """
+        Get the selected items in this listbox.
+
+        :return: A tuple of ints to represent the selected items. These are
+         indices into the source, not into the rendered rows.
+        """
+        return tuple(sorted(self._selected))
+
+    @selected.setter
+    def selected(self, new_selection: Tuple[int, ...]) -> None:
+        """
+        Set the selected items in this listbox.
+
+        :param new_selection: The new selections. Should be a tuple of ints
+         that index into the source (ex. (0, 1, 3))
+        :return: None.
+        """
+        self._selected = set(new_selection)
+        self._apply_selection()
+
+    def scroll_to(self, index: int) -> None:
+        """
+        Scroll to the index, so that we can see it.
+
+        :param index: The index to scroll to. Raises IndexError if not in the
+         source.
+        :return: None.
+        """
+        length = len(self._source)
+        if index >= length:
+            raise IndexError(
+                f"index is out of range! "
+                f"(index passed in: {index} "
+                f"length of items: {length})"
+            )
+        if index < self._top:
+            self._render(index)
+        elif index >= self._top + self._visible:
+            self._render(index - self._visible + 1)
+
+    def yview(self, *args) -> Union[Tuple[float, float], None]:
+        """
+        Query or change the vertical position of the view, in terms of the
+        whole source instead of the rendered rows. This is what scrollbars
+        call.
+
+        :param args: Nothing to query, ("moveto", fraction) or
+         ("scroll", number, "units" or "pages")
+        :return: A tuple of the first and last visible fractions when
+         querying, otherwise None.
+        """
+        if not args:
+            return self._fractions()
+        if args[0] == tk.MOVETO:
+            self._render(int(float(args[1]) * len(self._source)))
+        elif args[0] == tk.SCROLL:
+            amount = int(args[1])
+            if args[2] == tk.PAGES:
+                amount *= self._visible
+            self._render(self._top + amount)
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        """
+        Scroll so that the fraction of the source is at the top.
+
+        :param fraction: A float between 0 and 1.
+        :return: None.
+        """
+        self.yview(tk.MOVETO, fraction)
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        """
+        Scroll by a number of units or pages.
+
+        :param number: How many units or pages to scroll, an int.
+        :param what: Either "units" or "pages".
+        :return: None.
+        """
+        self.yview(tk.SCROLL, number, what)
+
+    def configure(self, cnf=None, **kwargs):
+        """
+        Configure the listbox. The yscrollcommand option is kept on the Python
+        side so that it gets fractions of the whole source.
+        """
+        if cnf is not None and "yscrollcommand" in cnf:
+            cnf = dict(cnf)
+            kwargs["yscrollcommand"] = cnf.pop("yscrollcommand")
+        if "yscrollcommand" in kwargs:
+            self._yscrollcommand = kwargs.pop("yscrollcommand")
+            self._notify_scroll()
+            if not kwargs and not cnf:
+                return None
+        return super().configure(cnf, **kwargs)
+
+    config = configure
+
+    def _fractions(self) -> Tuple[float, float]:
+        """
+        Get the first and last visible fractions of the source.
+
+        :return: A tuple of two floats.
+        """
+        length = len(self._source)
+        if length == 0:
+            return 0.0, 1.0
+        return self._top / length, min(length, self._top + self._visible) / length
+
+    def _notify_scroll(self) -> None:
+        """
+        Tell whatever is attached with yscrollcommand where we are.
+
+        :return: None.
+        """
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+
+    def _render(self, top: int, force: bool = False) -> None:
+        """
+        Make sure that the rows starting from the logical index top are
+        rendered in Tk and are at the top of the view.
+
+        :param top: The logical index that should be at the top of the view.
+        :param force: Whether to rebuild the rendered rows even if top is
+         already inside them.
+        :return: None.
+        """
+        length = len(self._source)
+        top = max(0, min(top, length - self._visible))
+        first = max(0, top - self._overscan)
+        last = min(length, top + self._visible + self._overscan)
+        margin = self._overscan // 2
+        inside = (
+            self._first <= top
+            and top + self._visible <= self._first + self._rendered
+            and (top - self._first >= margin or self._first == 0)
+            and (
+                self._first + self._rendered - (top + self._visible) >= margin
+                or self._first + self._rendered == length
+            )
+        )
+        self._rendering = True
+        try:
+            if force or not inside:
+                self._edit_anyway(lambda: self._replace_rows(first, last))
+            self._top = top
+            tk.Listbox.yview(self, top - self._first)
+        finally:
+            self._rendering = False
+        self._notify_scroll()
+
+    def _replace_rows(self, first: int, last: int) -> None:
+        """
+        Replace the rows in Tk with the items from first to last. (exclusive)
+
+        :param first: The logical index of the first item.
+        :param last: The logical index after the last item.
+        :return: None.
+        """
+        active = self._first + self.index(tk.ACTIVE)
+        tk.Listbox.delete(self, 0, tk.END)
+        if last > first:
+            tk.Listbox.insert(
+                self, 0, *[str(self._source[i]) for i in range(first, last)]
+            )
+        self._first = first
+        self._rendered = last - first
+        self._apply_selection()
+        if first <= active < last:
+            self.activate(active - first)
+
+    def _apply_selection(self) -> None:
+        """
+        Show the logical selection on the rendered rows.
+
+        :return: None.
+        """
+        was_rendering = self._rendering
+        self._rendering = True
+        try:
+            self.selection_clear(0, tk.END)
+            for offset in range(self._rendered):
+                if self._first + offset in self._selected:
+                    self.selection_set(offset)
+        finally:
+            self._rendering = was_rendering
+
+    def _on_tk_scroll(self, first: str, last: str) -> None:
+        """
+        Called by Tk whenever the view of the rendered rows changes, like when
+        scrolling with the mousewheel or the keyboard. Keeps our logical
+        position in sync and slides the rendered rows if we got close to
+        their edges.
+
+        :param first: The first visible fraction of the rendered rows.
+        :param last: The last visible fraction of the rendered rows.
+        :return: None.
+        """
+        if self._rendering or self._rendered == 0:
+            return
+        first, last = float(first), float(last)
+        self._visible = max(1, round((last - first) * self._rendered))
+        self._render(self._first + round(first * self._rendered))
+
+    def _remember_modifiers(self, event) -> None:
+        """
+        Remember whether the selection is being extended (shift, control or
+        command held) so that rows outside the rendered window keep their
+        selection.
+
+        :param event: An event that Tkinter passes in.
+        :return: None.
+        """
+        mask = 0x0001 | 0x0004
+        if Platform.on_aqua(self):
+            mask |= 0x0008
+        self._extend_selection = bool(event.state & mask)
+
+    def _sync_selection(self, event) -> None:
+        """
+        Copy the selection of the rendered rows into the logical selection.
+
+        :param event: An event that Tkinter passes in.
+        :return: None.
+        """
+        if self._rendering:
+            return
+        rendered = {self._first + index for index in self.curselection()}
+        if self.cget("selectmode") in (tk.BROWSE, tk.SINGLE) or not (
+            self._extend_selection
+        ):
+            self._selected = rendered
+        else:
+            outside = {
+                index
+                for index in self._selected
+                if not self._first <= index < self._first + self._rendered
+            }
+            self._selected = outside | rendered
+        if self._on_select is not None:
+            self._on_select()
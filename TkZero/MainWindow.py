@@ -3,15 +3,120 @@ Create the main window. Note that this should only be called once in your
 program!
 """
 
+import asyncio
+import os
+import sys
 import tkinter as tk
-from threading import Thread
-from typing import Union, Callable, List, Tuple
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from queue import Empty, Full, SimpleQueue
+from threading import Event, Lock, Semaphore, Thread, get_ident
+from time import perf_counter
+from typing import Union, Callable, List, Tuple, Any, Hashable, Dict, Set, Coroutine
 
 from PIL import ImageTk
 
+from TkZero import AsyncLoop
 from TkZero import Platform
 from TkZero import Vector
+from TkZero.Enable import enable_children
+from TkZero.Hover import track_hover
 from TkZero.Menu import Menu
+from TkZero.Scheduler import Scheduler
+
+
+class _DaemonThreadPool(Executor):
+    """
+    A thread pool whose workers are daemon threads, so tasks that are still
+    running don't keep Python from exiting after the main window is closed.
+    (concurrent.futures.ThreadPoolExecutor waits for its workers at exit)
+    """
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self._max_workers = max_workers
+        # (future, func, args, kwargs) tuples and a None per worker to stop
+        self._queue = SimpleQueue()
+        self._threads: List[Thread] = []
+        self._idle = Semaphore(0)
+        self._lock = Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Run a function in a worker.
+
+        :param fn: The function to run.
+        :param args: The arguments to pass to the function.
+        :param kwargs: The keyword arguments to pass to the function.
+        :return: A concurrent.futures.Future.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = Future()
+            self._queue.put((future, fn, args, kwargs))
+            # Only start a worker if none is waiting for work
+            if not self._idle.acquire(blocking=False) and (
+                len(self._threads) < self._max_workers
+            ):
+                thread = Thread(
+                    target=self._work,
+                    name=f"TkZero_{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _work(self) -> None:
+        """
+        Run tasks until shut down. This runs in the workers.
+
+        :return: None.
+        """
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            future, fn, args, kwargs = task
+            del task
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            del future, fn, args, kwargs
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stop the workers once they are done with the tasks that are queued.
+
+        :param wait: Whether to wait for the workers to stop. Defaults to
+         True.
+        :param cancel_futures: Whether to cancel the tasks that haven't
+         started instead of running them. Defaults to False.
+        :return: None.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        task = self._queue.get_nowait()
+                    except Empty:
+                        break
+                    if task is not None:
+                        task[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
 
 
 class MainWindow(tk.Tk):
@@ -19,8 +124,62 @@ class MainWindow(tk.Tk):
     The main window class.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        mailbox_size: int = 10_000,
+        mailbox_budget: int = 10,
+        mailbox_interval: int = 16,
+        max_workers: int = None,
+        use_processes: bool = False,
+    ):
+        """
+        Create the main window. (tk.Tk)
+
+        :param mailbox_size: How many un-keyed callbacks can be waiting in the
+         mailbox (see post) before posting from another thread blocks. Should
+         be an int and defaults to 10,000.
+        :param mailbox_budget: How many milliseconds each tick of the mailbox
+         pump may spend running callbacks before letting Tk process events
+         again. Should be an int and defaults to 10.
+        :param mailbox_interval: How many milliseconds to wait between ticks
+         of the mailbox pump when the mailbox is empty. Should be an int and
+         defaults to 16.
+        :param max_workers: How many workers the pool used by
+         run_in_background can have. Should be an int and defaults to None,
+         which lets concurrent.futures pick.
+        :param use_processes: Whether run_in_background should use a process
+         pool instead of a thread pool. The functions and their arguments and
+         results must then be picklable. Defaults to False.
+        """
         super().__init__()
+        self.mailbox_size = mailbox_size
+        self.mailbox_budget = mailbox_budget
+        self.mailbox_interval = mailbox_interval
+        self._tk_thread = get_ident()
+        # The mailbox holds (key, func, args) tuples. Keyed posts only store
+        # the key in here, the latest callback for the key lives in
+        # _mailbox_latest and _mailbox_queued remembers which keys are
+        # waiting in the deque so that they are only added once.
+        self._mailbox = deque()
+        self._mailbox_latest = {}
+        self._mailbox_queued = {}
+        self._mailbox_not_full = Event()
+        self._mailbox_not_full.set()
+        # Set when the window is destroyed, so nothing waits on the mailbox
+        self._mailbox_closed = False
+        # The mailbox has to keep draining while the window is hidden, or
+        # the threads posting to it would block
+        self.scheduler.call_later(
+            self.mailbox_interval, self._pump_mailbox, pausable=False
+        )
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._executor = None
+        # Futures from run_in_background, by the path of the window that owns
+        # them, so they can be cancelled when that window closes
+        self._background_tasks: Dict[str, Set[Future]] = {}
+        self._loop = None
+        self._loop_closed = None
         self.title = "Main Window"
         self._icon = None
         self._on_close = None
@@ -28,9 +187,19 @@ class MainWindow(tk.Tk):
         self._enabled = True
         if Platform.on_aqua(self):
             Menu(self, is_menubar=True)
+        # The size and position from the last <Configure> event as
+        # (width, height, x, y). The bindtag goes before the instance tag so
+        # that it is up to date in the handlers bound to the window.
+        self._geometry = None
+        if not self.bind_class("TkZeroGeometry", "<Configure>"):
+            self.bind_class(
+                "TkZeroGeometry",
+                "<Configure>",
+                lambda event: event.widget._remember_geometry(),
+            )
+        self.bindtags(("TkZeroGeometry",) + self.bindtags())
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def title(self) -> str:
@@ -72,15 +241,43 @@ class MainWindow(tk.Tk):
         self._icon = new_icon
         self.tk.call("wm", "iconphoto", self, new_icon)
 
+    def _remember_geometry(self) -> None:
+        """
+        Read the size and position of the window from Tk.
+
+        :return: None.
+        """
+        self._geometry = (
+            self.winfo_width(),
+            self.winfo_height(),
+            self.winfo_x(),
+            self.winfo_y(),
+        )
+
+    def get_size(self, refresh: bool = False) -> Vector.Size:
+        """
+        Return the size of the window. This is remembered from the last time
+        the window was configured, so reading it doesn't process any events.
+
+        :param refresh: Whether to let Tk finish pending geometry changes
+         (with update_idletasks, which doesn't run event handlers) and read
+         the size again. Defaults to False.
+        :return: A TkZero.Vector.Size with the width and height attributes.
+        """
+        if refresh or self._geometry is None:
+            self.update_idletasks()
+            self._remember_geometry()
+        return Vector.Size(width=self._geometry[0], height=self._geometry[1])
+
     @property
     def size(self) -> Vector.Size:
         """
-        Return the size of the window.
+        Return the size of the window. Use get_size(refresh=True) if you need
+        to read it from Tk again.
 
         :return: A TkZero.Vector.Size with the width and height attributes.
         """
-        self.update()
-        return Vector.Size(width=self.winfo_width(), height=self.winfo_height())
+        return self.get_size()
 
     @size.setter
     def size(self, new_size: Union[Vector.Size, Tuple[int, int]]) -> None:
@@ -91,21 +288,37 @@ class MainWindow(tk.Tk):
         height attributes set to the size you want.
         :return: None.
         """
-        if isinstance(new_size, tuple):
-            self.geometry(f"{new_size[0]}x{new_size[1]}")
-        else:
-            self.geometry(f"{new_size.width}x{new_size.height}")
-        self.update()
+        width, height = new_size
+        self.geometry(f"{width}x{height}")
+        if self._geometry is None:
+            self._remember_geometry()
+        self._geometry = (width, height) + self._geometry[2:]
+
+    def get_position(self, refresh: bool = False) -> Vector.Position:
+        """
+        Return the position of the window. This is remembered from the last
+        time the window was configured, so reading it doesn't process any
+        events.
+
+        :param refresh: Whether to let Tk finish pending geometry changes
+         (with update_idletasks, which doesn't run event handlers) and read
+         the position again. Defaults to False.
+        :return: A TkZero.Vector.Position with the x and y attributes.
+        """
+        if refresh or self._geometry is None:
+            self.update_idletasks()
+            self._remember_geometry()
+        return Vector.Position(x=self._geometry[2], y=self._geometry[3])
 
     @property
     def position(self) -> Vector.Position:
         """
-        Return the position of the window.
+        Return the position of the window. Use get_position(refresh=True) if
+        you need to read it from Tk again.
 
         :return: A TkZero.Vector.Position with the x and y attributes.
         """
-        self.update()
-        return Vector.Position(x=self.winfo_x(), y=self.winfo_y())
+        return self.get_position()
 
     @position.setter
     def position(self, new_position: Union[Vector.Position, Tuple[int, int]]) -> None:
@@ -116,16 +329,11 @@ class MainWindow(tk.Tk):
          x and y attributes.
         :return: None.
         """
-        if isinstance(new_position, tuple):
-            self.geometry(
-                f"{self.size.width}x{self.size.height}+"
-                f"{new_position[0]}+{new_position[1]}"
-            )
-        else:
-            self.geometry(
-                f"{self.size.width}x{self.size.height}+"
-                f"{new_position.x}+{new_position.y}"
-            )
+        x, y = new_position
+        self.geometry(f"+{x}+{y}")
+        if self._geometry is None:
+            self._remember_geometry()
+        self._geometry = self._geometry[:2] + (x, y)
 
     @property
     def minimized(self) -> bool:
@@ -230,10 +438,11 @@ class MainWindow(tk.Tk):
 
         :param event: A str of the event.
         :param func: A function to call when the even happens. If none is
-         passed in then a list of binds will be returned.
-        :param run_in_thread: Whether to run the function in a thread when
-         called. No arguments will be passed in. It will also be made as a
-         daemon thread. (will be terminated if main thread terminates)
+         passed in then a list of binds will be returned. This can also be an
+         async function, which will be run as a task on the loop started by
+         run_async.
+        :param run_in_thread: Whether to run the function in the background
+         with run_in_background when called. No arguments will be passed in.
         :param add: Whether to add the function to a list of functions to be
          called or replace the function that was previously bound to this
          sequence if any.
@@ -241,45 +450,306 @@ class MainWindow(tk.Tk):
          when this event is triggered or None when binding one.
         """
         if run_in_thread:
-            func = Thread(target=func, args=(), daemon=True).start
+            target = func
+            func = lambda _: self.run_in_background(target)
+        elif asyncio.iscoroutinefunction(func):
+            target = func
+            func = lambda event: self.create_task(target(event))
         binds = self.bind(event, func, add)
         if binds is not None and type(binds) is not list:
             binds = [binds]
         return binds
 
-    def generate_event(self, event: str) -> None:
+    def post(
+        self,
+        func: Callable,
+        *args: Any,
+        key: Hashable = None,
+        block: bool = True,
+        timeout: float = None,
+    ) -> None:
         """
-        Generate an event.
+        Run a function on the Tk thread soon. This is safe to call from any
+        thread, so worker threads should use this instead of touching
+        widgets directly. The functions are run in the order they were
+        posted. Raises RuntimeError once this window is destroyed, also in
+        threads that were waiting for room in the mailbox.
+
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :param key: Anything hashable. If a callback with the same key is
+         still waiting, it is replaced by this one so only the latest one
+         runs. (but in the position of the first one) Useful for things like
+         progress updates. Defaults to None, which never replaces anything.
+        :param block: Whether to wait for room when the mailbox is full (see
+         mailbox_size) or to raise queue.Full right away. Only un-keyed posts
+         from other threads can ever wait. Defaults to True.
+        :param timeout: How many seconds to wait for room before raising
+         queue.Full. Defaults to None, which waits forever.
+        :return: None.
+        """
+        if self._mailbox_closed:
+            raise RuntimeError("The main window was destroyed!")
+        if key is not None:
+            self._mailbox_latest[key] = (func, args)
+            token = object()
+            if self._mailbox_queued.setdefault(key, token) is token:
+                self._mailbox.append((key, None, None))
+            return
+        while (
+            len(self._mailbox) >= self.mailbox_size and get_ident() != self._tk_thread
+        ):
+            if not block:
+                raise Full("The mailbox is full!")
+            self._mailbox_not_full.clear()
+            if len(self._mailbox) < self.mailbox_size:
+                break
+            if not self._mailbox_not_full.wait(timeout):
+                raise Full("The mailbox is still full!")
+            if self._mailbox_closed:
+                raise RuntimeError("The main window was destroyed!")
+        self._mailbox.append((None, func, args))
+
+    def call_soon_threadsafe(self, func: Callable, *args: Any) -> None:
+        """
+        Run a function on the Tk thread soon. Same as post without a key.
+
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :return: None.
+        """
+        self.post(func, *args)
+
+    def _pump_mailbox(self) -> None:
+        """
+        Run the callbacks in the mailbox until it is empty or the budget for
+        this tick is used up, then schedule the next tick.
 
-        :param event: The event to generate ("<<MyOwnEvent>>")
         :return: None.
         """
-        self.event_generate(event)
+        deadline = perf_counter() + self.mailbox_budget / 1000
+        mailbox = self._mailbox
+        while mailbox:
+            key, func, args = mailbox.popleft()
+            if key is not None:
+                # Must forget that the key is queued before taking the
+                # callback, otherwise a post in between could get lost
+                self._mailbox_queued.pop(key, None)
+                latest = self._mailbox_latest.pop(key, None)
+                if latest is None:
+                    continue
+                func, args = latest
+            try:
+                func(*args)
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+            if perf_counter() >= deadline:
+                break
+        self._mailbox_not_full.set()
+        self.scheduler.call_later(
+            1 if mailbox else self.mailbox_interval, self._pump_mailbox, pausable=False
+        )
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """
+        Get the scheduler that runs the timers of this window and its widgets
+        off a single after.
+
+        :return: A TkZero.Scheduler.Scheduler.
+        """
+        return Scheduler.of(self)
 
-    def _enable_children(
-        self, parent: Union[tk.Widget, tk.Tk] = None, enable: bool = True
+    @property
+    def executor(self) -> Executor:
+        """
+        Get the pool that run_in_background uses. It is created the first time
+        it is needed, using max_workers and use_processes. The threads of the
+        thread pool are daemon threads, so they don't keep Python from exiting
+        once the main window is closed.
+
+        :return: A concurrent.futures.Executor, which is a
+         concurrent.futures.ProcessPoolExecutor if use_processes is True.
+        """
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = _DaemonThreadPool(max_workers=self.max_workers)
+        return self._executor
+
+    def run_in_background(
+        self,
+        func: Callable,
+        *args: Any,
+        on_done: Callable[[Any], None] = None,
+        on_error: Callable[[BaseException], None] = None,
+        owner: Union[tk.Tk, tk.Toplevel] = None,
+    ) -> Future:
+        """
+        Run a function in the pool (see executor) and call back on the Tk
+        thread when it finishes.
+
+        :param func: The function to run in the background.
+        :param args: The arguments to pass to the function.
+        :param on_done: A function that will be called on the Tk thread with
+         the result of func. Defaults to None.
+        :param on_error: A function that will be called on the Tk thread with
+         the exception if func raised one. Defaults to None, which reports the
+         exception like any other Tk callback.
+        :param owner: The window that this task belongs to. When it is closed,
+         the task is cancelled if it hasn't started yet and the callbacks
+         will not be called. Defaults to None, which is this main window.
+        :return: A concurrent.futures.Future.
+        """
+        owner_path = str(owner if owner is not None else self)
+        future = self.executor.submit(func, *args)
+        self._background_tasks.setdefault(owner_path, set()).add(future)
+        future.add_done_callback(
+            lambda done: self._post_background_task(done, owner_path, on_done, on_error)
+        )
+        return future
+
+    def _post_background_task(
+        self,
+        future: Future,
+        owner_path: str,
+        on_done: Union[Callable[[Any], None], None],
+        on_error: Union[Callable[[BaseException], None], None],
     ) -> None:
         """
-        Enable or disable the children.
+        Hand a background task that finished to the Tk thread. This is called
+        in the thread that finished it.
 
-        :param parent: A tk.Widget that is our parent. If None then default to
-         self.
-        :param enable: Whether to enable or disable the children.
+        :param future: The concurrent.futures.Future of the task.
+        :param owner_path: The path of the window that owns the task.
+        :param on_done: The function to call with the result or None.
+        :param on_error: The function to call with the exception or None.
         :return: None.
         """
-        if parent is None:
-            parent = self
-        for child in parent.winfo_children():
-            if child.winfo_class() not in ("TFrame", "TLabelFrame"):
-                try:
-                    child.state(["!disabled" if enable else "disabled"])
-                except AttributeError:
-                    child.configure(state=tk.NORMAL if enable else tk.DISABLED)
+        try:
+            self.post(
+                self._finish_background_task, future, owner_path, on_done, on_error
+            )
+        except RuntimeError:
+            # The main window was destroyed, so there is nothing to call back
+            pass
+
+    def _finish_background_task(
+        self,
+        future: Future,
+        owner_path: str,
+        on_done: Union[Callable[[Any], None], None],
+        on_error: Union[Callable[[BaseException], None], None],
+    ) -> None:
+        """
+        Called on the Tk thread when a background task finishes.
+
+        :param future: The concurrent.futures.Future of the task.
+        :param owner_path: The path of the window that owns the task.
+        :param on_done: The function to call with the result or None.
+        :param on_error: The function to call with the exception or None.
+        :return: None.
+        """
+        tasks = self._background_tasks.get(owner_path)
+        if tasks is None or future not in tasks:
+            # The owner was closed
+            return
+        tasks.discard(future)
+        if not tasks:
+            del self._background_tasks[owner_path]
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
             else:
-                if hasattr(child, "enabled"):
-                    child.enabled = enable
-                else:
-                    self._enable_children(child, enable)
+                self.report_callback_exception(type(error), error, error.__traceback__)
+        elif on_done is not None:
+            on_done(future.result())
+
+    def cancel_background_tasks(self, owner: Union[tk.Tk, tk.Toplevel] = None) -> None:
+        """
+        Cancel the background tasks of a window. Tasks that already started
+        will keep running, but their callbacks will not be called.
+
+        :param owner: The window whose tasks to cancel. Defaults to None,
+         which is this main window.
+        :return: None.
+        """
+        owner_path = str(owner if owner is not None else self)
+        for future in self._background_tasks.pop(owner_path, ()):
+            future.cancel()
+
+    @property
+    def loop(self) -> Union[asyncio.AbstractEventLoop, None]:
+        """
+        Get the asyncio event loop started by run_async.
+
+        :return: An asyncio.AbstractEventLoop or None if run_async isn't
+         running.
+        """
+        return self._loop
+
+    def create_task(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Run a coroutine as a task on the loop started by run_async.
+
+        :param coro: The coroutine to run.
+        :return: An asyncio.Task.
+        """
+        if self._loop is None:
+            coro.close()
+            raise RuntimeError("The asyncio loop is not running, use run_async")
+        return self._loop.create_task(coro)
+
+    def run_async(self, main: Coroutine = None) -> Any:
+        """
+        Run Tk and an asyncio event loop together until this window is
+        destroyed. Use this instead of mainloop.
+
+        :param main: A coroutine to run as a task when the loop starts.
+         Defaults to None. If it raises an exception the window is destroyed
+         and the exception is raised from here.
+        :return: The result of main if it finished, otherwise None.
+        """
+        loop = AsyncLoop.new_event_loop(self)
+        self._loop = loop
+        self._loop_closed = loop.create_future()
+        main_task = None
+        try:
+            if main is not None:
+                main_task = loop.create_task(main)
+
+                def main_done(task: asyncio.Task) -> None:
+                    if not task.cancelled() and task.exception() is not None:
+                        self.destroy()
+
+                main_task.add_done_callback(main_done)
+            loop.run_until_complete(self._loop_closed)
+            # Cancel what is left like asyncio.run does
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            self._loop = None
+            self._loop_closed = None
+            loop.close()
+        if main_task is not None and main_task.done() and not main_task.cancelled():
+            return main_task.result()
+        return None
+
+    def generate_event(self, event: str) -> None:
+        """
+        Generate an event.
+
+        :param event: The event to generate ("<<MyOwnEvent>>")
+        :return: None.
+        """
+        self.event_generate(event)
 
     @property
     def enabled(self) -> bool:
@@ -302,7 +772,7 @@ class MainWindow(tk.Tk):
         :return: None.
         """
         self._enabled = new_state
-        self._enable_children(enable=self._enabled)
+        enable_children(self, self._enabled)
 
     @property
     def hovering_over(self) -> bool:
@@ -343,6 +813,35 @@ class MainWindow(tk.Tk):
         """
         self._on_close = new_func
 
+    def destroy(self) -> None:
+        """
+        Destroy the window and all of its children. This also cancels all the
+        background tasks that haven't started yet and the scheduled jobs, and
+        shuts down the pool. Tasks that already started keep running, but
+        don't keep Python from exiting unless use_processes is True.
+
+        :return: None.
+        """
+        for owner_path in list(self._background_tasks.keys()):
+            for future in self._background_tasks.pop(owner_path):
+                future.cancel()
+        if self._executor is not None:
+            if isinstance(self._executor, _DaemonThreadPool):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+        self.scheduler.close()
+        # Wake up the threads that wait for room in the mailbox
+        self._mailbox_closed = True
+        self._mailbox_not_full.set()
+        self._mailbox.clear()
+        self._mailbox_latest.clear()
+        self._mailbox_queued.clear()
+        super().destroy()
+        if self._loop_closed is not None and not self._loop_closed.done():
+            self._loop_closed.set_result(None)
+
     def close(self) -> None:
         """
         Close the window - this usually stops the whole program.
@@ -6,7 +6,9 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union, List
 
+from TkZero.Enable import enable_children, use_enabled_setter
 from TkZero.Frame import Frame
+from TkZero.Hover import track_hover
 
 
 class Tab(Frame):
@@ -20,8 +22,9 @@ class Tab(Frame):
         self._title = title
         self._parent = parent
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
+        # The enabled property also changes the state of the tab
+        use_enabled_setter(self)
 
     @property
     def title(self) -> str:
@@ -67,7 +70,7 @@ class Tab(Frame):
         :return: None.
         """
         self._enabled = new_state
-        self._enable_children(enable=self._enabled)
+        enable_children(self, self._enabled)
         try:
             self._parent.tab(self, state=tk.NORMAL if self._enabled else tk.DISABLED)
         except tk.TclError:
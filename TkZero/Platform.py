@@ -3,8 +3,13 @@ Get the windowing system.
 """
 
 import tkinter as tk
+from collections import namedtuple
 from typing import Union
 
+PlatformInfo = namedtuple(
+    "PlatformInfo", ["windowing_system", "patchlevel", "scaling", "themes"]
+)
+
 
 class WindowingSystem:
     """
@@ -16,6 +21,35 @@ class WindowingSystem:
     AQUA = "aqua"
 
 
+def info(
+    widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]], refresh: bool = False
+) -> PlatformInfo:
+    """
+    Return facts about the Tk we are running on. They are only asked from Tk
+    the first time and then remembered per interpreter.
+
+    :param widget: A Tkinter thing that we need to use so we can call into Tk.
+     (Probably something like root or self)
+    :param refresh: Whether to ask Tk again, like after changing the scaling
+     or sourcing a theme. Defaults to False.
+    :return: A PlatformInfo with the windowing_system (a str of "x11",
+     "win32", or "aqua"), patchlevel (a str like "8.6.12"), scaling (a float
+     of pixels per point) and themes (a tuple of str of the ttk theme names)
+     attributes.
+    """
+    root = widget._root()
+    platform_info = getattr(root, "_tkzero_platform", None)
+    if platform_info is None or refresh:
+        platform_info = PlatformInfo(
+            windowing_system=str(root.tk.call("tk", "windowingsystem")),
+            patchlevel=str(root.tk.call("info", "patchlevel")),
+            scaling=float(root.tk.call("tk", "scaling")),
+            themes=tuple(root.tk.splitlist(root.tk.call("ttk::themes"))),
+        )
+        root._tkzero_platform = platform_info
+    return platform_info
+
+
 def on_platform(
     widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]], system: str
 ) -> bool:
@@ -27,7 +61,7 @@ def on_platform(
     :param system: A str of "x11", "win32", or "aqua".
     :return: A bool on whether we are on the system passed in.
     """
-    return widget.tk.call("tk", "windowingsystem") == system
+    return info(widget).windowing_system == system
 
 
 def on_x11(widget: Union[tk.Widget, Union[tk.Tk, tk.Toplevel]]) -> bool:
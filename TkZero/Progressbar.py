@@ -3,8 +3,14 @@ Creates a themed scale. (Slider)
 """
 
 import tkinter as tk
+from threading import Lock
+from time import monotonic
 from tkinter import ttk
-from typing import Union
+from typing import Union, Dict, List
+
+from TkZero import Batch
+from TkZero.Hover import track_hover
+from TkZero.Scheduler import Scheduler
 
 
 class OrientModes:
@@ -30,8 +36,133 @@ class ProgressModes:
     Indeterminate = "indeterminate"
 
 
-# Used for differentiating between the different styles
-_pbar_id = 0
+# The bindtag on the root that tells the style pool about theme changes
+_THEME_BINDTAG = "TkZeroLabeledProgressbars"
+
+
+class _LabeledStyles:
+    """
+    The styles of the labeled progress bars of one Tk interpreter. Each
+    labeled progress bar needs its own style for its text, so styles are
+    handed out from a pool and given back when the progress bar is destroyed.
+    """
+
+    def __init__(self, root: tk.Tk):
+        self.root = root
+        self.style = ttk.Style(master=root)
+        self.count = 0
+        self.orientations: Dict[str, str] = {}
+        self.free: Dict[str, List[str]] = {
+            OrientModes.Horizontal: [],
+            OrientModes.Vertical: [],
+        }
+        self.live: Dict[str, "Progressbar"] = {}
+        root.bind_class(_THEME_BINDTAG, "<<ThemeChanged>>", lambda _: self.relayout())
+        root.bindtags((_THEME_BINDTAG,) + root.bindtags())
+
+    @classmethod
+    def of(cls, widget: tk.Misc) -> "_LabeledStyles":
+        """
+        Get the style pool of the interpreter a widget belongs to.
+
+        :param widget: Any widget.
+        :return: A _LabeledStyles.
+        """
+        root = widget._root()
+        pool = getattr(root, "_tkzero_labeled_progressbars", None)
+        if pool is None:
+            pool = cls(root)
+            root._tkzero_labeled_progressbars = pool
+        return pool
+
+    def layout(self, style_name: str) -> None:
+        """
+        Define the layout of a style in the current theme.
+
+        :param style_name: The name of the style.
+        :return: None.
+        """
+        if self.orientations[style_name] == OrientModes.Horizontal:
+            prefix, side, sticky = "Horizontal", "left", "ns"
+        else:
+            prefix, side, sticky = "Vertical", "bottom", "we"
+        self.style.layout(
+            style_name,
+            [
+                (
+                    f"{prefix}.Progressbar.trough",
+                    {
+                        "sticky": "nswe",
+                        "children": [
+                            (
+                                f"{prefix}.Progressbar.pbar",
+                                {"side": side, "sticky": sticky},
+                            ),
+                            (f"{style_name}.label", {"sticky": ""}),
+                        ],
+                    },
+                )
+            ],
+        )
+
+    def acquire(self, progressbar: "Progressbar", orientation: str) -> str:
+        """
+        Get a style for a progress bar.
+
+        :param progressbar: The progress bar that will use the style.
+        :param orientation: The orientation of the progress bar.
+        :return: A str of the name of the style.
+        """
+        free = self.free[orientation]
+        if free:
+            style_name = free.pop()
+        else:
+            prefix = (
+                "Horizontal" if orientation == OrientModes.Horizontal else "Vertical"
+            )
+            style_name = f"LabeledProgressbar{self.count}.{prefix}.TProgressbar"
+            self.count += 1
+            self.orientations[style_name] = orientation
+        # Layouts belong to a theme, so a recycled style may need it again
+        self.layout(style_name)
+        self.live[style_name] = progressbar
+        return style_name
+
+    def owns(self, progressbar: "Progressbar") -> bool:
+        """
+        Whether a progress bar still has its style.
+
+        :param progressbar: The progress bar.
+        :return: A bool.
+        """
+        return self.live.get(progressbar.style_name) is progressbar
+
+    def release(self, progressbar: "Progressbar") -> None:
+        """
+        Give the style of a progress bar back to the pool.
+
+        :param progressbar: The progress bar.
+        :return: None.
+        """
+        if not self.owns(progressbar):
+            return
+        style_name = progressbar.style_name
+        del self.live[style_name]
+        try:
+            self.style.configure(style_name, text="")
+        except tk.TclError:
+            pass
+        self.free[self.orientations[style_name]].append(style_name)
+
+    def relayout(self) -> None:
+        """
+        Define the layouts of the styles in use again after the theme changed.
+
+        :return: None.
+        """
+        for style_name, progressbar in self.live.items():
+            self.layout(style_name)
+            self.style.configure(style_name, text=progressbar._text)
 
 
 class Progressbar(ttk.Progressbar):
@@ -58,52 +189,10 @@ class Progressbar(ttk.Progressbar):
         """
         self._allow_text = allow_text
         if self._allow_text:
-            self._style = ttk.Style()
-            global _pbar_id
-            if mode == OrientModes.Horizontal:
-                self.style_name = (
-                    f"LabeledProgressbar{_pbar_id}.Horizontal.TProgressbar"
-                )
-                self._style.layout(
-                    self.style_name,
-                    [
-                        (
-                            "Horizontal.Progressbar.trough",
-                            {
-                                "sticky": "nswe",
-                                "children": [
-                                    (
-                                        "Horizontal.Progressbar.pbar",
-                                        {"side": "left", "sticky": "ns"},
-                                    ),
-                                    (f"{self.style_name}.label", {"sticky": ""}),
-                                ],
-                            },
-                        )
-                    ],
-                )
-            else:
-                self.style_name = f"LabeledProgressbar{_pbar_id}.Vertical.TProgressbar"
-                self._style.layout(
-                    self.style_name,
-                    [
-                        (
-                            "Vertical.Progressbar.trough",
-                            {
-                                "sticky": "nswe",
-                                "children": [
-                                    (
-                                        "Vertical.Progressbar.pbar",
-                                        {"side": "left", "sticky": "ns"},
-                                    ),
-                                    (f"{self.style_name}.label", {"sticky": ""}),
-                                ],
-                            },
-                        )
-                    ],
-                )
-            _pbar_id += 1
             # https://stackoverflow.com/a/40348163/10291933
+            self._styles = _LabeledStyles.of(parent)
+            self._style = self._styles.style
+            self.style_name = self._styles.acquire(self, orientation)
             self._text = ""
             super().__init__(
                 master=parent,
@@ -120,8 +209,7 @@ class Progressbar(ttk.Progressbar):
         self._enabled = True
         self._orientation = orientation
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def value(self) -> float:
@@ -130,7 +218,7 @@ class Progressbar(ttk.Progressbar):
 
         :return: A float.
         """
-        return float(self["value"])
+        return Batch.read(self, "value", lambda: float(self["value"]))
 
     @value.setter
     def value(self, new_value: Union[int, float]) -> None:
@@ -140,7 +228,16 @@ class Progressbar(ttk.Progressbar):
         :param new_value: A float or an int.
         :return: None.
         """
-        self["value"] = float(new_value)
+        Batch.write(self, "value", float(new_value), self._apply_value)
+
+    def _apply_value(self, new_value: float) -> None:
+        """
+        Apply the value to Tk.
+
+        :param new_value: A float.
+        :return: None.
+        """
+        self["value"] = new_value
 
     @property
     def maximum(self) -> float:
@@ -149,7 +246,7 @@ class Progressbar(ttk.Progressbar):
 
         :return: A float.
         """
-        return self["maximum"]
+        return Batch.read(self, "maximum", lambda: self["maximum"])
 
     @maximum.setter
     def maximum(self, new_value: Union[int, float]) -> None:
@@ -159,7 +256,16 @@ class Progressbar(ttk.Progressbar):
         :param new_value: A float or an int.
         :return: None.
         """
-        self["maximum"] = float(new_value)
+        Batch.write(self, "maximum", float(new_value), self._apply_maximum)
+
+    def _apply_maximum(self, new_value: float) -> None:
+        """
+        Apply the maximum to Tk.
+
+        :param new_value: A float.
+        :return: None.
+        """
+        self["maximum"] = new_value
 
     @property
     def text(self) -> str:
@@ -189,7 +295,18 @@ class Progressbar(ttk.Progressbar):
                 "(Enable it at creation with allow_text = True)"
             )
         self._text = new_text
-        self._style.configure(self.style_name, text=self._text)
+        Batch.write(self, "text", new_text, self._apply_text)
+
+    def _apply_text(self, new_text: str) -> None:
+        """
+        Apply the text to Tk.
+
+        :param new_text: A str.
+        :return: None.
+        """
+        # The style may already belong to another progress bar
+        if self._styles.owns(self):
+            self._style.configure(self.style_name, text=new_text)
 
     @property
     def enabled(self) -> bool:
@@ -212,7 +329,7 @@ class Progressbar(ttk.Progressbar):
         :return: None.
         """
         self._enabled = new_state
-        self.state(["!disabled" if self._enabled else "disabled"])
+        Batch.write_enabled(self, new_state)
 
     @property
     def hovering_over(self) -> bool:
@@ -231,3 +348,241 @@ class Progressbar(ttk.Progressbar):
         :return: None.
         """
         self._hovering_over = is_hovering
+
+    def destroy(self) -> None:
+        """
+        Destroy this progress bar and give its style back so another labeled
+        progress bar can use it.
+
+        :return: None.
+        """
+        if self._allow_text:
+            self._styles.release(self)
+        super().destroy()
+
+
+def _format_duration(seconds: Union[float, None]) -> str:
+    """
+    Format a duration like 1:05 or 1:02:05.
+
+    :param seconds: The duration in seconds, or None if it is unknown.
+    :return: A str, which is "?" if the duration is unknown.
+    """
+    if seconds is None:
+        return "?"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02}:{seconds:02}"
+    return f"{minutes}:{seconds:02}"
+
+
+class ProgressReporter:
+    """
+    Report progress to a progress bar from any thread. Reports are only added
+    up when they come in, the progress bar is redrawn at most fps times a
+    second on the Tk thread.
+    """
+
+    def __init__(
+        self,
+        progressbar: Progressbar,
+        total: Union[int, float] = None,
+        template: str = "{percent:.0f}%",
+        fps: int = 30,
+        smoothing: float = 0.3,
+    ):
+        """
+        Create a progress reporter. This must be created on the Tk thread.
+
+        :param progressbar: The TkZero.Progressbar.Progressbar to draw on.
+        :param total: How much there is to do. Defaults to None, which means
+         unknown until it is set with the total property.
+        :param template: The text to show on the progress bar, which is
+         formatted with value, total, percent, rate (per second), elapsed and
+         eta (like "1:05" or "?"). Can be None to leave the text alone, and is
+         ignored if the progress bar doesn't allow text. Defaults to
+         "{percent:.0f}%".
+        :param fps: How many times a second the progress bar can be redrawn.
+         Defaults to 30.
+        :param smoothing: How much a new sample of the rate counts, from 0
+         to 1. Lower is smoother. Defaults to 0.3.
+        """
+        self.progressbar = progressbar
+        self.template = template if progressbar._allow_text else None
+        self.fps = fps
+        self.smoothing = smoothing
+        self._lock = Lock()
+        self._value = 0
+        self._total = total
+        self._changed = True
+        self._closed = False
+        self._start = monotonic()
+        self._sample_time = self._start
+        self._sample_value = 0
+        self._rate = None
+        self._scheduler = Scheduler.of(self.progressbar)
+        # Not pausable, the progress bar may be in a window other than the
+        # main one
+        self._job = self._scheduler.call_later(
+            self._interval, self._tick, pausable=False
+        )
+
+    @property
+    def _interval(self) -> int:
+        """
+        Get the time between redraws.
+
+        :return: An int of milliseconds.
+        """
+        return max(1, round(1000 / self.fps))
+
+    @property
+    def value(self) -> Union[int, float]:
+        """
+        Get how much is done.
+
+        :return: An int or a float.
+        """
+        return self._value
+
+    @property
+    def total(self) -> Union[int, float, None]:
+        """
+        Get how much there is to do.
+
+        :return: An int, a float or None if it is unknown.
+        """
+        return self._total
+
+    @total.setter
+    def total(self, new_total: Union[int, float, None]) -> None:
+        """
+        Set how much there is to do. Safe to call from any thread.
+
+        :param new_total: An int, a float or None if it is unknown.
+        :return: None.
+        """
+        with self._lock:
+            self._total = new_total
+            self._changed = True
+
+    @property
+    def rate(self) -> Union[float, None]:
+        """
+        Get the smoothed rate.
+
+        :return: A float of how much is done per second, or None if it is not
+         known yet.
+        """
+        return self._rate
+
+    @property
+    def eta(self) -> Union[float, None]:
+        """
+        Get the estimated time left.
+
+        :return: A float of seconds, or None if it is not known.
+        """
+        if not self._total or not self._rate:
+            return None
+        return max(0.0, (self._total - self._value) / self._rate)
+
+    def advance(self, amount: Union[int, float] = 1) -> None:
+        """
+        Add to how much is done. Safe to call from any thread.
+
+        :param amount: An int or a float. Defaults to 1.
+        :return: None.
+        """
+        with self._lock:
+            self._value += amount
+            self._changed = True
+
+    def set(self, value: Union[int, float]) -> None:
+        """
+        Set how much is done. Safe to call from any thread.
+
+        :param value: An int or a float.
+        :return: None.
+        """
+        with self._lock:
+            self._value = value
+            self._changed = True
+
+    def _sample_rate(self, now: float) -> None:
+        """
+        Add a sample to the smoothed rate.
+
+        :param now: The time from time.monotonic().
+        :return: None.
+        """
+        elapsed = now - self._sample_time
+        if elapsed <= 0:
+            return
+        rate = (self._value - self._sample_value) / elapsed
+        if self._rate is None:
+            self._rate = rate
+        else:
+            self._rate = self.smoothing * rate + (1 - self.smoothing) * self._rate
+        self._sample_time = now
+        self._sample_value = self._value
+
+    def _draw(self) -> None:
+        """
+        Draw the progress on the progress bar.
+
+        :return: None.
+        """
+        with self._lock:
+            value, total, changed = self._value, self._total, self._changed
+            self._changed = False
+        if changed:
+            if total:
+                self.progressbar.maximum = total
+            self.progressbar.value = min(value, total) if total else value
+        if self.template is None:
+            return
+        text = self.template.format(
+            value=value,
+            total=total,
+            percent=value / total * 100 if total else 0,
+            rate=self._rate or 0,
+            elapsed=_format_duration(monotonic() - self._start),
+            eta=_format_duration(self.eta),
+        )
+        # The time in the text changes even when nothing is reported
+        if text != self.progressbar.text:
+            self.progressbar.text = text
+
+    def _tick(self) -> None:
+        """
+        Redraw the progress bar if anything changed and schedule the next
+        redraw.
+
+        :return: None.
+        """
+        self._job = None
+        if self._closed or not self.progressbar.winfo_exists():
+            return
+        self._sample_rate(monotonic())
+        self._draw()
+        self._job = self._scheduler.call_later(
+            self._interval, self._tick, pausable=False
+        )
+
+    def close(self) -> None:
+        """
+        Stop redrawing, after drawing the last progress. This must be called
+        on the Tk thread.
+
+        :return: None.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        if self.progressbar.winfo_exists():
+            self._draw()
@@ -8,6 +8,8 @@ from typing import Union, Callable
 
 from PIL.ImageTk import PhotoImage
 
+from TkZero.Hover import track_hover
+
 
 class DisplayModes:
     """
@@ -61,8 +63,7 @@ class Radiobutton(ttk.Radiobutton):
             self.image = image
         self.value = False
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def text(self) -> str:
@@ -0,0 +1,414 @@
+"""
+Run timers and animations off one Tk timer. Every job is kept in a heap by
+its deadline and only the earliest deadline has an after scheduled, so there
+is one Tcl timer per interpreter no matter how many jobs there are. Jobs can
+be paused while the main window is withdrawn or minimized. Those are kept in
+their own heap, which is just left alone while paused.
+"""
+
+import heapq
+import sys
+import tkinter as tk
+from math import ceil
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+# Only the main window has this bindtag, so its Map and Unmap bindings don't
+# see the events of the widgets inside it
+_MAP_BINDTAG = "TkZeroScheduler"
+
+
+class Job:
+    """
+    A callback scheduled with a Scheduler. Cancel it with cancel.
+    """
+
+    __slots__ = (
+        "scheduler",
+        "func",
+        "args",
+        "interval",
+        "deadline",
+        "pausable",
+        "cancelled",
+        "queued",
+        "seq",
+    )
+
+    def __init__(
+        self,
+        scheduler: "Scheduler",
+        func: Callable,
+        args: Tuple[Any, ...],
+        interval: Union[float, None],
+        deadline: float,
+        pausable: bool,
+        seq: int,
+    ):
+        self.scheduler = scheduler
+        self.func = func
+        self.args = args
+        # Seconds between runs or None if this only runs once
+        self.interval = interval
+        self.deadline = deadline
+        self.pausable = pausable
+        self.cancelled = False
+        # Whether this job is in its heap
+        self.queued = False
+        self.seq = seq
+
+    def __lt__(self, other: "Job") -> bool:
+        return (self.deadline, self.seq) < (other.deadline, other.seq)
+
+    @property
+    def active(self) -> bool:
+        """
+        Get whether this job will still run.
+
+        :return: A bool.
+        """
+        return not self.cancelled
+
+    def cancel(self) -> None:
+        """
+        Stop this job from running again. Does nothing if it's already
+        cancelled or was a one-shot job that already ran.
+
+        :return: None.
+        """
+        if not self.cancelled:
+            self.scheduler._cancel(self)
+
+
+class Scheduler:
+    """
+    Runs the timers of one Tk interpreter off a single after.
+    """
+
+    def __init__(self, root: tk.Tk, fps: int = 60):
+        """
+        Create a scheduler. Use Scheduler.of to get the one of a widget
+        instead.
+
+        :param root: The main window.
+        :param fps: How many times a second the frame jobs are run. Defaults
+         to 60.
+        """
+        self.root = root
+        self.fps = fps
+        # The heaps of the pausable jobs (True) and the other jobs (False)
+        self._heaps: Dict[bool, List[Job]] = {True: [], False: []}
+        # How many cancelled jobs are still in each heap
+        self._cancelled = {True: 0, False: 0}
+        self._frames: Dict[int, Job] = {}
+        self._frame_job: Union[Job, None] = None
+        self._seq = 0
+        self._after_id = None
+        self._after_deadline = None
+        self._closed = False
+        self._paused = root.wm_state() in ("withdrawn", "iconic")
+        root.bind_class(_MAP_BINDTAG, "<Map>", lambda _: self._on_map())
+        root.bind_class(_MAP_BINDTAG, "<Unmap>", lambda _: self._on_map())
+        root.bindtags((_MAP_BINDTAG,) + root.bindtags())
+
+    @classmethod
+    def of(cls, widget: tk.Misc) -> "Scheduler":
+        """
+        Get the scheduler of the interpreter a widget belongs to.
+
+        :param widget: Any widget.
+        :return: A Scheduler.
+        """
+        root = widget._root()
+        scheduler = getattr(root, "_tkzero_scheduler", None)
+        if scheduler is None:
+            scheduler = cls(root)
+            root._tkzero_scheduler = scheduler
+        return scheduler
+
+    @property
+    def paused(self) -> bool:
+        """
+        Get whether the pausable jobs are paused because the main window is
+        withdrawn or minimized.
+
+        :return: A bool.
+        """
+        return self._paused
+
+    def __len__(self) -> int:
+        """
+        Get how many jobs are waiting to run.
+
+        :return: An int.
+        """
+        return (
+            sum(len(heap) for heap in self._heaps.values())
+            - sum(self._cancelled.values())
+            + len(self._frames)
+            - (self._frame_job is not None)
+        )
+
+    def call_later(
+        self, ms: int, func: Callable, *args: Any, pausable: bool = True
+    ) -> Job:
+        """
+        Run a function once after some time.
+
+        :param ms: How many milliseconds to wait.
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :param pausable: Whether to wait while the main window is hidden.
+         Defaults to True.
+        :return: A Job that can be cancelled.
+        """
+        return self._add(func, args, None, perf_counter() + ms / 1000, pausable)
+
+    def call_every(
+        self, ms: int, func: Callable, *args: Any, pausable: bool = True
+    ) -> Job:
+        """
+        Run a function over and over. Runs that were missed, because Tk was
+        busy or the jobs were paused, are skipped instead of being made up.
+
+        :param ms: How many milliseconds to wait between runs.
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :param pausable: Whether to wait while the main window is hidden.
+         Defaults to True.
+        :return: A Job that can be cancelled.
+        """
+        interval = max(ms, 1) / 1000
+        return self._add(func, args, interval, perf_counter() + interval, pausable)
+
+    def call_each_frame(self, func: Callable, *args: Any) -> Job:
+        """
+        Run a function every frame, fps times a second. All the frame jobs run
+        together in the same tick, so animations stay in step. They are paused
+        while the main window is hidden.
+
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :return: A Job that can be cancelled.
+        """
+        self._seq += 1
+        job = Job(self, func, args, None, 0, True, self._seq)
+        self._frames[job.seq] = job
+        if self._frame_job is None:
+            self._frame_job = self.call_every(round(1000 / self.fps), self._run_frame)
+        return job
+
+    def close(self) -> None:
+        """
+        Cancel every job and the Tk timer.
+
+        :return: None.
+        """
+        self._closed = True
+        for heap in self._heaps.values():
+            for job in heap:
+                job.cancelled = True
+        for job in self._frames.values():
+            job.cancelled = True
+        self._heaps = {True: [], False: []}
+        self._cancelled = {True: 0, False: 0}
+        self._frames = {}
+        self._frame_job = None
+        self._cancel_after()
+
+    def _add(
+        self,
+        func: Callable,
+        args: Tuple[Any, ...],
+        interval: Union[float, None],
+        deadline: float,
+        pausable: bool,
+    ) -> Job:
+        """
+        Add a job to the heap and make sure the timer fires in time for it.
+
+        :param func: The function to call.
+        :param args: The arguments to pass to the function.
+        :param interval: Seconds between runs or None to run once.
+        :param deadline: When to run first, in perf_counter seconds.
+        :param pausable: Whether to wait while the main window is hidden.
+        :return: The Job.
+        """
+        self._seq += 1
+        job = Job(self, func, args, interval, deadline, pausable, self._seq)
+        if self._closed:
+            job.cancelled = True
+            return job
+        self._push(job)
+        if not (pausable and self._paused):
+            self._reschedule()
+        return job
+
+    def _cancel(self, job: Job) -> None:
+        """
+        Cancel a job. Jobs in a heap are only marked, and the heap is rebuilt
+        once most of it is cancelled.
+
+        :param job: The Job.
+        :return: None.
+        """
+        job.cancelled = True
+        if self._frames.pop(job.seq, None) is not None:
+            if not self._frames and self._frame_job is not None:
+                self._frame_job.cancel()
+                self._frame_job = None
+        elif job.queued:
+            pausable = job.pausable
+            heap = self._heaps[pausable]
+            cancelled = self._cancelled[pausable] + 1
+            if cancelled > 32 and cancelled * 2 > len(heap):
+                heap = [job for job in heap if not job.cancelled]
+                heapq.heapify(heap)
+                self._heaps[pausable] = heap
+                cancelled = 0
+            self._cancelled[pausable] = cancelled
+
+    def _push(self, job: Job) -> None:
+        """
+        Add a job to its heap.
+
+        :param job: The Job.
+        :return: None.
+        """
+        job.queued = True
+        heapq.heappush(self._heaps[job.pausable], job)
+
+    def _pop(self, pausable: bool) -> Job:
+        """
+        Take the job with the earliest deadline out of a heap.
+
+        :param pausable: Whether to take it from the heap of pausable jobs.
+        :return: The Job.
+        """
+        job = heapq.heappop(self._heaps[pausable])
+        job.queued = False
+        if job.cancelled:
+            self._cancelled[pausable] -= 1
+        return job
+
+    def _run_frame(self) -> None:
+        """
+        Run every frame job.
+
+        :return: None.
+        """
+        for job in list(self._frames.values()):
+            if not job.cancelled:
+                self._run(job)
+
+    def _run(self, job: Job) -> None:
+        """
+        Run the function of a job, reporting any error to Tk.
+
+        :param job: The Job.
+        :return: None.
+        """
+        try:
+            job.func(*job.args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def _tick(self) -> None:
+        """
+        Run the jobs that are due and schedule the next tick. Jobs added while
+        running wait for the next tick, even if they are already due.
+
+        :return: None.
+        """
+        self._after_id = None
+        self._after_deadline = None
+        now = perf_counter()
+        due = []
+        for pausable in (False,) if self._paused else (False, True):
+            heap = self._heaps[pausable]
+            while heap and heap[0].deadline <= now:
+                job = self._pop(pausable)
+                if not job.cancelled:
+                    due.append(job)
+        due.sort()
+        for job in due:
+            if job.cancelled:
+                continue
+            if job.interval is None:
+                job.cancelled = True
+            self._run(job)
+            if not job.cancelled and not self._closed:
+                job.deadline += job.interval
+                if job.deadline <= now:
+                    job.deadline = now + job.interval
+                self._push(job)
+        self._reschedule()
+
+    def _next_deadline(self) -> Union[float, None]:
+        """
+        Get the earliest deadline of a job that may run now.
+
+        :return: A float of perf_counter seconds or None if there is nothing
+         to run.
+        """
+        deadline = None
+        for pausable in (False,) if self._paused else (False, True):
+            heap = self._heaps[pausable]
+            while heap and heap[0].cancelled:
+                self._pop(pausable)
+            if heap and (deadline is None or heap[0].deadline < deadline):
+                deadline = heap[0].deadline
+        return deadline
+
+    def _reschedule(self) -> None:
+        """
+        Make the Tk timer fire at the next deadline. A timer that fires too
+        early is left alone, it just finds nothing to do and schedules again.
+
+        :return: None.
+        """
+        if self._closed:
+            return
+        deadline = self._next_deadline()
+        if deadline is None:
+            self._cancel_after()
+            return
+        if self._after_id is not None and self._after_deadline <= deadline:
+            return
+        self._cancel_after()
+        delay = max(0, ceil((deadline - perf_counter()) * 1000))
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+        except tk.TclError:
+            # The interpreter is gone
+            self._closed = True
+            return
+        self._after_deadline = deadline
+
+    def _cancel_after(self) -> None:
+        """
+        Cancel the Tk timer if there is one.
+
+        :return: None.
+        """
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+            self._after_deadline = None
+
+    def _on_map(self) -> None:
+        """
+        Pause or resume the pausable jobs when the main window is hidden or
+        shown again.
+
+        :return: None.
+        """
+        paused = self.root.wm_state() in ("withdrawn", "iconic")
+        if paused == self._paused:
+            return
+        # Jobs that came due while paused run once when resumed
+        self._paused = paused
+        self._reschedule()
@@ -0,0 +1,138 @@
+"""
+Scroll the scrollable frames with the mousewheel. The mousewheel is bound
+once per interpreter and every event is sent to the innermost registered
+scrollable under the pointer, instead of every frame binding it globally when
+the pointer enters it.
+"""
+
+import tkinter as tk
+from typing import Callable, Dict, Union
+
+from TkZero.Platform import on_aqua
+
+# The state bit of the shift key in events
+_SHIFT_MASK = 0x1
+
+
+def _state(widget: tk.Misc) -> dict:
+    """
+    Get the scroll state of the interpreter of a widget, binding the
+    mousewheel the first time.
+
+    :param widget: A widget.
+    :return: A dict with the scrollables and the cache.
+    """
+    root = widget._root()
+    state = getattr(root, "_tkzero_scroll", None)
+    if state is None:
+        state = {
+            # Paths of the scrollables to their callbacks
+            "scrollables": {},
+            # Paths of widgets to the path of the scrollable they are in
+            "cache": {},
+            # Classes of widgets to whether they scroll themselves
+            "native": {},
+        }
+        root._tkzero_scroll = state
+        for sequence, amount in (
+            ("MouseWheel", None),
+            ("Button-4", -1),
+            ("Button-5", 1),
+        ):
+            for modifier in ("", "Shift-"):
+                root.bind_all(
+                    f"<{modifier}{sequence}>",
+                    lambda e, a=amount: _dispatch(root, e, a),
+                    add=True,
+                )
+    return state
+
+
+def register_scrollable(
+    widget: tk.Misc, on_scroll: Callable[[int, bool], None]
+) -> None:
+    """
+    Have the mousewheel scroll a widget when the pointer is over it or a
+    widget inside it, unless a scrollable inside it is closer.
+
+    :param widget: The widget.
+    :param on_scroll: A function that is called with how many units to
+     scroll and whether to scroll horizontally (shift is held).
+    :return: None.
+    """
+    state = _state(widget)
+    state["scrollables"][str(widget)] = on_scroll
+    state["cache"].clear()
+
+
+def unregister_scrollable(widget: tk.Misc) -> None:
+    """
+    Stop scrolling a widget with the mousewheel.
+
+    :param widget: The widget.
+    :return: None.
+    """
+    state = _state(widget)
+    if state["scrollables"].pop(str(widget), None) is not None:
+        state["cache"].clear()
+
+
+def _find_scrollable(state: dict, path: str) -> Union[str, None]:
+    """
+    Find the innermost scrollable that a widget is in.
+
+    :param state: The scroll state of the interpreter.
+    :param path: The path of the widget.
+    :return: The path of the scrollable or None.
+    """
+    cache: Dict[str, Union[str, None]] = state["cache"]
+    if path in cache:
+        return cache[path]
+    scrollables = state["scrollables"]
+    found = None
+    ancestor = path
+    while ancestor:
+        if ancestor in scrollables:
+            found = ancestor
+            break
+        ancestor = ancestor.rpartition(".")[0]
+    cache[path] = found
+    return found
+
+
+def _dispatch(root: tk.Tk, event, amount: Union[int, None]) -> None:
+    """
+    Send a mousewheel event to the scrollable under the pointer.
+
+    :param root: The main window.
+    :param event: An event that Tkinter passes in.
+    :param amount: How many units to scroll for X11 buttons 4 and 5, or None
+     to get it from the delta of the event.
+    :return: None.
+    """
+    if amount is None and not event.delta:
+        return
+    state = root._tkzero_scroll
+    path = root.tk.call("winfo", "containing", event.x_root, event.y_root)
+    if not path:
+        return
+    path = str(path)
+    native = state["native"]
+    widget_class = str(root.tk.call("winfo", "class", path))
+    if widget_class not in native:
+        native[widget_class] = bool(root.bind_class(widget_class, "<MouseWheel>"))
+    if native[widget_class]:
+        # Let text boxes, listboxes and such scroll themselves
+        return
+    scrollable = _find_scrollable(state, path)
+    if scrollable is None:
+        return
+    if amount is None:
+        if on_aqua(root):
+            amount = -event.delta
+        else:
+            amount = -int(event.delta / 120)
+        if amount == 0:
+            amount = -1 if event.delta > 0 else 1
+    shift = isinstance(event.state, int) and bool(event.state & _SHIFT_MASK)
+    state["scrollables"][scrollable](amount, shift)
@@ -6,6 +6,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union
 
+from TkZero.Hover import track_hover
+
 
 class OrientModes:
     """
@@ -42,8 +44,7 @@ class Scrollbar(ttk.Scrollbar):
         if widget is not None:
             self.attach_to(widget=widget)
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     def attach_to(self, widget: tk.Widget) -> None:
         """
@@ -0,0 +1,451 @@
+"""
+Search a Text for a regular expression without freezing it. The text is
+copied a block of lines at a time and searched in a thread. The matches come
+back in batches and are tagged as they arrive. After the search is done,
+edits only search the lines they changed again. Edits during a search start
+it over once they stop coming.
+"""
+
+import re
+import tkinter as tk
+from bisect import bisect_left
+from collections import deque
+from queue import Queue
+from threading import Thread, Event
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple, Union
+
+from TkZero.Scheduler import Job, Scheduler
+from TkZero.Text import Text, TextChange
+
+# A match is the line it is on and its start and end column
+Match = Tuple[int, int, int]
+
+
+def _find_matches(block: str, first_line: int, regex: re.Pattern) -> List[Match]:
+    """
+    Find the matches in a block of lines. Empty matches and matches that
+    span lines are left out.
+
+    :param block: A str of lines, without a newline at the end.
+    :param first_line: The number of the first line in the block.
+    :param regex: The compiled regular expression.
+    :return: A list of (line, start column, end column) tuples.
+    """
+    matches = []
+    line = first_line
+    line_start = 0
+    for match in regex.finditer(block):
+        start, end = match.span()
+        if start == end or block.find("\n", start, end) != -1:
+            continue
+        newlines = block.count("\n", line_start, start)
+        if newlines:
+            line += newlines
+            line_start = block.rfind("\n", line_start, start) + 1
+        matches.append((line, start - line_start, end - line_start))
+    return matches
+
+
+class TextSearch:
+    """
+    Searches a TkZero.Text.Text for a regular expression and tags the
+    matches.
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        tag: str = "search",
+        current_tag: str = "search_current",
+        styles: Dict[str, Dict[str, str]] = None,
+        lines_per_block: int = 2000,
+        budget: int = 10,
+        restart_delay: int = 300,
+        on_progress: Callable[[int], None] = None,
+        on_done: Callable[[], None] = None,
+    ):
+        """
+        Create a search for a text. Nothing is searched until search is
+        called.
+
+        :param text: The TkZero.Text.Text to search.
+        :param tag: The tag to put on the matches. Defaults to "search".
+        :param current_tag: The tag to put on the match that was moved to
+         with next or previous. Defaults to "search_current".
+        :param styles: A dict of tag names to dicts of options for
+         tag_configure. Defaults to a yellow background for the matches and
+         an orange one for the current match.
+        :param lines_per_block: How many lines to copy from Tk and search at
+         once. Defaults to 2000.
+        :param budget: How many milliseconds to spend tagging matches before
+         letting Tk handle other events. Defaults to 10.
+        :param restart_delay: How many milliseconds to wait after an edit made
+         during a search before starting it over. Defaults to 300.
+        :param on_progress: A function that is called with the number of
+         matches found so far. Defaults to None.
+        :param on_done: A function that is called when the search is done.
+         Defaults to None.
+        """
+        self.text = text
+        self.tag = tag
+        self.current_tag = current_tag
+        self.lines_per_block = lines_per_block
+        self.budget = budget
+        self.restart_delay = restart_delay
+        self.on_progress = on_progress
+        self.on_done = on_done
+        if styles is None:
+            styles = {
+                tag: {"background": "yellow"},
+                current_tag: {"background": "orange"},
+            }
+        self.text.tag_configure(self.tag)
+        self.text.tag_configure(self.current_tag)
+        for name, options in styles.items():
+            self.text.tag_configure(name, **options)
+        self.text.tag_raise(self.current_tag, self.tag)
+        self.regex: Union[re.Pattern, None] = None
+        self.done = True
+        # Kept here instead of read from the tag, because Tk merges the ranges
+        # of matches that touch
+        self._matches: List[Match] = []
+        self._current: Union[Match, None] = None
+        self._cancelled = Event()
+        self._blocks = Queue()
+        self._results = deque()
+        # How many blocks the thread has that haven't come back yet
+        self._in_flight = 0
+        self._next_line = 1
+        self._last_line = 0
+        self._after_id = None
+        # The job that waits for the thread when there is nothing to tag
+        self._poll_job: Union[Job, None] = None
+        self._restart_id = None
+        self._bind_id = self.text.bind("<<TextModified>>", self._on_modified, True)
+
+    @property
+    def matches(self) -> List[Match]:
+        """
+        Get the matches found so far, sorted by where they are.
+
+        :return: A list of (line, start column, end column) tuples.
+        """
+        return self._matches
+
+    def search(self, pattern: Union[str, re.Pattern], flags: int = 0) -> None:
+        """
+        Start searching, stopping the last search. Matches can't span lines.
+        The text is copied from Tk a block at a time while searching.
+
+        :param pattern: The regular expression as a str or compiled.
+        :param flags: The flags for re.compile, re.MULTILINE is always on.
+         Defaults to 0.
+        :return: None.
+        """
+        self.cancel()
+        if isinstance(pattern, re.Pattern):
+            flags |= pattern.flags
+            pattern = pattern.pattern
+        self.regex = re.compile(pattern, flags | re.MULTILINE)
+        self._clear_tags("1.0", tk.END)
+        self._matches = []
+        self._current = None
+        self.done = False
+        self._next_line = 1
+        self._last_line = int(self.text.index("end-1c").split(".")[0])
+        self._in_flight = 0
+        self._cancelled = Event()
+        self._blocks = Queue()
+        self._results = deque()
+        Thread(
+            target=self._search,
+            args=(self._blocks, self.regex, self._cancelled, self._results),
+            daemon=True,
+        ).start()
+        self._after_id = self.text.after_idle(self._tag_results)
+
+    @staticmethod
+    def _search(
+        blocks: Queue,
+        regex: re.Pattern,
+        cancelled: Event,
+        results: deque,
+    ) -> None:
+        """
+        Search the blocks of lines. This runs in its own thread.
+
+        :param blocks: A Queue of (first line, block) tuples, ending with
+         None.
+        :param regex: The compiled regular expression.
+        :param cancelled: An Event that is set when the search is cancelled.
+        :param results: A deque to add a list of matches to for every block.
+        :return: None.
+        """
+        while True:
+            block = blocks.get()
+            if block is None or cancelled.is_set():
+                return
+            first_line, lines = block
+            results.append(_find_matches(lines, first_line, regex))
+
+    def _tag_results(self) -> None:
+        """
+        Tag the matches that the thread found and copy the next blocks for it
+        until the budget runs out.
+
+        :return: None.
+        """
+        self._after_id = None
+        self._poll_job = None
+        if not self.text.winfo_exists():
+            self.cancel()
+            return
+        deadline = perf_counter() + self.budget / 1000
+        count = len(self._matches)
+        while self._results and perf_counter() < deadline:
+            self._in_flight -= 1
+            matches = self._results.popleft()
+            if matches:
+                self._add_matches(matches)
+        while self._next_line <= self._last_line and perf_counter() < deadline:
+            last = min(self._next_line + self.lines_per_block - 1, self._last_line)
+            lines = self.text.get(f"{self._next_line}.0", f"{last}.end")
+            self._blocks.put((self._next_line, lines))
+            self._in_flight += 1
+            self._next_line = last + 1
+        if self.on_progress is not None and len(self._matches) != count:
+            self.on_progress(len(self._matches))
+        if not self._in_flight and self._next_line > self._last_line:
+            self._blocks.put(None)
+            self.done = True
+            if self.on_done is not None:
+                self.on_done()
+        elif self._results or self._next_line <= self._last_line:
+            self._after_id = self.text.after_idle(self._tag_results)
+        else:
+            # Wait for the thread without keeping Tk busy
+            self._poll_job = Scheduler.of(self.text).call_later(
+                10, self._tag_results, pausable=False
+            )
+
+    def _add_matches(self, matches: List[Match]) -> None:
+        """
+        Tag matches with one call and add them to the index. They must come
+        after every match in the index.
+
+        :param matches: A list of (line, start column, end column) tuples.
+        :return: None.
+        """
+        indices = []
+        for line, start, end in matches:
+            indices.extend((f"{line}.{start}", f"{line}.{end}"))
+        self.text.tag_add(self.tag, *indices)
+        self._matches.extend(matches)
+
+    def _shift_matches(self, changes: List[TextChange]) -> List[List[int]]:
+        """
+        Drop the matches on the lines that changed and move the ones after
+        them, like Tk moves the tags.
+
+        :param changes: The changes of the text, in the order they were made.
+        :return: A list of [first line, last line] lists of the lines that
+         changed, as they are now. They can overlap.
+        """
+        matches = self._matches
+        regions: List[List[int]] = []
+        for change in changes:
+            start = int(change.start.split(".")[0])
+            end = int(change.end.split(".")[0])
+            new_end = int(change.new_end.split(".")[0])
+            moved = new_end - end
+            # Move the lines changed by the earlier changes
+            for region in regions:
+                for i in (0, 1):
+                    if region[i] > end:
+                        region[i] += moved
+                    elif region[i] > start:
+                        region[i] = min(region[i], new_end)
+            regions.append([start, new_end])
+            first = bisect_left(matches, (start,))
+            after = bisect_left(matches, (end + 1,), first)
+            if moved:
+                matches[first:] = [
+                    (line + moved, match_start, match_end)
+                    for line, match_start, match_end in matches[after:]
+                ]
+            else:
+                del matches[first:after]
+        return regions
+
+    def _clear_tags(self, start: str, end: str) -> None:
+        """
+        Remove the match tags from a range.
+
+        :param start: The index the range starts at.
+        :param end: The index the range ends at.
+        :return: None.
+        """
+        self.text.tag_remove(self.tag, start, end)
+        self.text.tag_remove(self.current_tag, start, end)
+
+    def _on_modified(self, event) -> None:
+        """
+        Search the lines that changed again. Edits during a search start it
+        over, because the thread is searching a copy of the old text.
+
+        :param event: An event that Tkinter passes in.
+        :return: None.
+        """
+        if self.regex is None:
+            return
+        regions = self._shift_matches(self.text.changes)
+        if not self.done:
+            # The thread may be searching a copy of the old text, so start
+            # over, but only once the edits stop instead of on every key
+            self._stop()
+            self._current = None
+            for start, end in regions:
+                self._clear_tags(f"{start}.0", f"{end}.end")
+            if self._restart_id is not None:
+                self.text.after_cancel(self._restart_id)
+            self._restart_id = self.text.after(self.restart_delay, self._restart)
+            return
+        for start, end in regions:
+            if end - start >= self.lines_per_block:
+                self.search(self.regex)
+                return
+        self._current = None
+        merged: List[List[int]] = []
+        for start, end in sorted(regions):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            self._clear_tags(f"{start}.0", f"{end}.end")
+            block = self.text.get(f"{start}.0", f"{end}.end")
+            matches = _find_matches(block, start, self.regex)
+            if matches:
+                indices = []
+                for line, match_start, match_end in matches:
+                    indices.extend((f"{line}.{match_start}", f"{line}.{match_end}"))
+                self.text.tag_add(self.tag, *indices)
+                index = bisect_left(self._matches, (start,))
+                self._matches[index:index] = matches
+
+    def _go_to(self, match: Match) -> Tuple[str, str]:
+        """
+        Make a match the current one, select it and scroll to it.
+
+        :param match: A (line, start column, end column) tuple.
+        :return: A tuple of the start and end index of the match.
+        """
+        line, start, end = match
+        start, end = f"{line}.{start}", f"{line}.{end}"
+        self._current = match
+        self.text.tag_remove(self.current_tag, "1.0", tk.END)
+        self.text.tag_add(self.current_tag, start, end)
+        self.text.tag_remove(tk.SEL, "1.0", tk.END)
+        self.text.tag_add(tk.SEL, start, end)
+        self.text.mark_set(tk.INSERT, end)
+        self.text.see(start)
+        return start, end
+
+    def _reference(self, use_end: bool) -> Tuple[int, int]:
+        """
+        Get where to look for the next or previous match from: the current
+        match or else the insertion cursor.
+
+        :param use_end: Whether to use the end of the current match instead of
+         the start.
+        :return: A tuple of the line and column.
+        """
+        if self._current is not None:
+            line, start, end = self._current
+            return line, end if use_end else start
+        line, column = map(int, self.text.index(tk.INSERT).split("."))
+        return line, column
+
+    def next(self) -> Union[Tuple[str, str], None]:
+        """
+        Go to the next match, going back to the first one after the last one.
+
+        :return: A tuple of the start and end index of the match or None if
+         there are no matches.
+        """
+        matches = self.matches
+        if not matches:
+            return None
+        index = bisect_left(matches, self._reference(use_end=True))
+        return self._go_to(matches[index % len(matches)])
+
+    def previous(self) -> Union[Tuple[str, str], None]:
+        """
+        Go to the previous match, going to the last one before the first one.
+
+        :return: A tuple of the start and end index of the match or None if
+         there are no matches.
+        """
+        matches = self.matches
+        if not matches:
+            return None
+        index = bisect_left(matches, self._reference(use_end=False)) - 1
+        return self._go_to(matches[index % len(matches)])
+
+    def _stop(self) -> None:
+        """
+        Stop the thread and tagging its results.
+
+        :return: None.
+        """
+        self._cancelled.set()
+        self._blocks.put(None)
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+        if self._poll_job is not None:
+            self._poll_job.cancel()
+            self._poll_job = None
+
+    def _restart(self) -> None:
+        """
+        Start the search over after edits made during it.
+
+        :return: None.
+        """
+        self._restart_id = None
+        self.search(self.regex)
+
+    def cancel(self) -> None:
+        """
+        Stop searching. The matches found so far stay.
+
+        :return: None.
+        """
+        self._stop()
+        if self._restart_id is not None:
+            self.text.after_cancel(self._restart_id)
+            self._restart_id = None
+        self.done = True
+
+    def clear(self) -> None:
+        """
+        Stop searching and remove all the matches.
+
+        :return: None.
+        """
+        self.cancel()
+        self.regex = None
+        self._matches = []
+        self._current = None
+        self._clear_tags("1.0", tk.END)
+
+    def close(self) -> None:
+        """
+        Clear the search and stop following the edits of the text.
+
+        :return: None.
+        """
+        self.clear()
+        self.text.unbind("<<TextModified>>", self._bind_id)
@@ -6,6 +6,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union
 
+from TkZero.Hover import track_hover
+
 
 class OrientModes:
     """
@@ -37,8 +39,7 @@ class Separator(ttk.Separator):
         self._enabled = True
         self._orientation = orientation
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def enabled(self) -> bool:
@@ -6,6 +6,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Union, Callable, Tuple, List
 
+from TkZero.ContextMenu import ContextMenu, ContextMenuKinds, context_menu_for
+from TkZero.Hover import track_hover
 from TkZero.Platform import on_aqua
 
 
@@ -58,10 +60,8 @@ class Spinbox(ttk.Spinbox):
             self.bind("<3>", lambda event: self._popup(event=event))
         if values is not None:
             self["values"] = tuple([str(thing) for thing in values])
-        self._make_context_menu()
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def value(self) -> str:
@@ -173,41 +173,15 @@ class Spinbox(ttk.Spinbox):
         """
         self._hovering_over = is_hovering
 
-    def _make_context_menu(self) -> None:
+    @property
+    def _context_menu(self) -> ContextMenu:
         """
-        Initiate the context menu.
+        Get the context menu of this spinbox. It is shared with the other
+        widgets in the same window and built the first time it is needed.
 
-        :return: None.
+        :return: A TkZero.ContextMenu.ContextMenu.
         """
-        self._context_menu = tk.Menu(self, tearoff=0)
-        self._context_menu.add_command(
-            label="Copy",
-            command=self.copy_contents,
-            underline=0,
-            accelerator="Command-C" if on_aqua(self) else "Control+C",
-        )
-        self._context_menu.add_command(
-            label="Cut",
-            command=self.cut_contents,
-            accelerator="Command-X" if on_aqua(self) else "Control+X",
-        )
-        self._context_menu.add_command(
-            label="Paste",
-            command=self.paste_contents,
-            underline=0,
-            accelerator="Command-V" if on_aqua(self) else "Control+V",
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Delete", command=self.delete_contents, accelerator="Delete"
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Select all",
-            command=self.select_all_contents,
-            underline=7,
-            accelerator="Command-A" if on_aqua(self) else "Control+A",
-        )
+        return context_menu_for(self, ContextMenuKinds.Entry)
 
     def _update_context_menu_states(self) -> None:
         """
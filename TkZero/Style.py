@@ -7,6 +7,8 @@ from pathlib import Path
 from tkinter import ttk
 from typing import Union
 
+from TkZero import Platform
+
 
 class WidgetStyleRoots:
     Button = "TButton"
@@ -32,6 +34,7 @@ def import_theme(root: tk.Tk, path: Union[str, Path]) -> None:
     """
     path = str(Path(path).resolve())
     root.tk.call("source", path)
+    Platform.info(root, refresh=True)
 
 
 def use_theme(root: tk.Tk, theme: str) -> None:
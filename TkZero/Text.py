@@ -3,9 +3,19 @@ Creates a "classic" Text.
 """
 
 import tkinter as tk
-from typing import Union
+from collections import namedtuple, deque
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Queue
+from threading import Thread, Semaphore
+from time import perf_counter
+from typing import Union, List, Callable, Iterable, Iterator, TextIO
 
+from TkZero import Diff
+from TkZero.ContextMenu import ContextMenu, ContextMenuKinds, context_menu_for
+from TkZero.Hover import track_hover
 from TkZero.Platform import on_aqua
+from TkZero.Scheduler import Job, Scheduler
 
 
 class TextWrap:
@@ -23,6 +33,121 @@ class TextWrap:
     WordWrapping = tk.WORD
 
 
+# Every Tcl command on a Text goes through this proc. Only edits call into
+# Python (to generate <<TextModified>>), with the range they changed, and edits
+# are dropped while the variable that holds the read only state is true.
+# Errors are ignored, like deleting the selection when nothing is selected.
+# While the text is saved in the background, edits (and undo and redo) first
+# call the command in ::tkzero::textBeforeEdit, so the rest can be copied.
+_TEXT_PROXY = """
+namespace eval ::tkzero {}
+proc ::tkzero::textRange {widget command arguments} {
+    set last [$widget index end-1c]
+    switch -- $command {
+        insert {
+            set start [$widget index [lindex $arguments 0]]
+            set end $start
+            set chars [lrange $arguments 1 end]
+        }
+        delete {
+            set start {}
+            set end {}
+            foreach index $arguments {
+                set index [$widget index $index]
+                if {$start eq {} || [$widget compare $index < $start]} {
+                    set start $index
+                }
+                if {$end eq {} || [$widget compare $index > $end]} {
+                    set end $index
+                }
+            }
+            if {[llength $arguments] == 1} {
+                set end [$widget index "$start + 1c"]
+            }
+            set chars {}
+        }
+        replace {
+            set start [$widget index [lindex $arguments 0]]
+            set end [$widget index [lindex $arguments 1]]
+            set chars [lrange $arguments 2 end]
+        }
+    }
+    if {[$widget compare $start > $last]} {
+        set start $last
+    }
+    if {[$widget compare $end > $last]} {
+        set end $last
+    }
+    set inserted 0
+    foreach {text tags} $chars {
+        incr inserted [string length $text]
+    }
+    return [list $start $end $inserted]
+}
+proc ::tkzero::textProxy {widget readonly modified command args} {
+    if {[info exists ::tkzero::textBeforeEdit($widget)] && (
+        $command in {insert delete replace}
+        || ($command eq "edit" && [lindex $args 0] in {undo redo})
+    )} {
+        $::tkzero::textBeforeEdit($widget)
+    }
+    if {$command in {insert delete replace}} {
+        upvar #0 $readonly is_readonly
+        if {$is_readonly} {
+            return
+        }
+        set range {}
+        if {[$widget cget -state] ne "disabled"} {
+            if {[catch {::tkzero::textRange $widget $command $args} range]} {
+                set range {}
+            }
+        }
+        if {[catch {$widget $command {*}$args} result]} {
+            return
+        }
+        if {[llength $range] == 3} {
+            lassign $range start end inserted
+            $modified $start $end $inserted \\
+                [$widget index "$start + $inserted chars"]
+        }
+        return $result
+    }
+    if {[catch {$widget $command {*}$args} result]} {
+        return
+    }
+    return $result
+}
+"""
+
+# A change to a Text. The range from start to end (as it was before the
+# change) was replaced by inserted characters, which now end at new_end.
+TextChange = namedtuple("TextChange", ["start", "end", "inserted", "new_end"])
+
+
+def _merge_change(changes: List[TextChange], change: TextChange) -> None:
+    """
+    Add a change to a list of changes, merging it with the last one if it
+    continues it, like typing or pressing backspace does.
+
+    :param changes: A list of TextChange.
+    :param change: The TextChange to add.
+    :return: None.
+    """
+    if changes:
+        last = changes[-1]
+        if change.start == change.end == last.new_end:
+            # Inserting right after the last change
+            changes[-1] = TextChange(
+                last.start, last.end, last.inserted + change.inserted, change.new_end
+            )
+            return
+        if change.inserted == last.inserted == 0 and change.end == last.start:
+            # Deleting right before the last deletion
+            changes[-1] = TextChange(change.start, last.end, 0, change.new_end)
+            return
+    changes.append(change)
+
+
 class Text(tk.Text):
     def __init__(
         self,
@@ -30,6 +155,8 @@ class Text(tk.Text):
         width: int = None,
         height: int = None,
         wrapping: str = TextWrap.WordWrapping,
+        coalesce_modifications: bool = False,
+        diff_on_assign: bool = False,
     ):
         """
         Initiate a tk.Text.
@@ -39,6 +166,14 @@ class Text(tk.Text):
         :param height: The width of the text. Defaults to None.
         :param wrapping: How to wrap words in the text. Defaults to
          TextWrap.WordWrapping
+        :param coalesce_modifications: Whether to generate <<TextModified>>
+         once when Tk is idle for all the changes made since, instead of right
+         after every change. Either way, the changes are in the changes
+         property. Defaults to False.
+        :param diff_on_assign: Whether setting the text property only changes
+         the lines that are different, instead of replacing everything. This
+         keeps the tags, marks and view of the lines that stay the same and
+         can be undone in one step. Defaults to False.
         """
         super().__init__(
             master=parent,
@@ -49,33 +184,143 @@ class Text(tk.Text):
             maxundo=50_000,
         )
         self._enabled = True
-        self._readonly = False
+        self._readonly_var = tk.BooleanVar(self, value=False)
         self.enable_automatically = True
+        self.coalesce_modifications = coalesce_modifications
+        self.diff_on_assign = diff_on_assign
+        self._changes: List[TextChange] = []
+        self._pending_changes: List[TextChange] = []
+        self._changes_after_id = None
+        self._loader: Union["TextLoader", None] = None
+        self._savers: List["_TextSaver"] = []
+        self._before_edit_command = None
         if on_aqua(self):
             self.bind("<2>", lambda event: self._popup(event=event))
             self.bind("<Control-1>", lambda event: self._popup(event=event))
         else:
             self.bind("<3>", lambda event: self._popup(event=event))
-        self._make_context_menu()
         # https://stackoverflow.com/a/40618152/10291933
         self._orig = self._w + "_orig"
         self.tk.call("rename", self._w, self._orig)
-        self.tk.createcommand(self._w, self._proxy)
+        if not self.tk.call("info", "commands", "::tkzero::textProxy"):
+            self.tk.eval(_TEXT_PROXY)
+        self.tk.call(
+            "interp",
+            "alias",
+            "",
+            self._w,
+            "",
+            "::tkzero::textProxy",
+            self._orig,
+            str(self._readonly_var),
+            self.register(self._on_modified),
+        )
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
+
+    def _on_modified(self, start: str, end: str, inserted: str, new_end: str) -> None:
+        """
+        Called from Tcl after the text was changed.
+
+        :param start: The index where the change starts.
+        :param end: The index where the replaced range ended before the
+         change.
+        :param inserted: How many characters were inserted.
+        :param new_end: The index where the inserted characters end.
+        :return: None.
+        """
+        change = TextChange(str(start), str(end), int(inserted), str(new_end))
+        if not self.coalesce_modifications:
+            self._changes = [change]
+            self.event_generate("<<TextModified>>")
+            return
+        _merge_change(self._pending_changes, change)
+        if self._changes_after_id is None:
+            self._changes_after_id = self.after_idle(self._flush_changes)
+
+    def _flush_changes(self) -> None:
+        """
+        Generate <<TextModified>> for the changes made since the last time.
 
-    def _proxy(self, command, *args):
-        cmd = (self._orig, command) + args
+        :return: None.
+        """
+        self._changes_after_id = None
+        self._changes = self._pending_changes
+        self._pending_changes = []
+        if self._changes:
+            self.event_generate("<<TextModified>>")
+
+    @property
+    def changes(self) -> List[TextChange]:
+        """
+        Get the changes that the last <<TextModified>> was generated for. Each
+        change uses the indices of the text as it was right before that
+        change was made. The range of a deletion of more than one range can
+        be bigger than what was deleted.
+
+        :return: A list of TextChange, which have the start, end, inserted
+         and new_end attributes.
+        """
+        return self._changes
+
+    @property
+    def _readonly(self) -> bool:
+        """
+        Get whether edits are dropped. This lives in a Tcl variable so that
+        the proxy can check it without calling into Python.
+
+        :return: A bool.
+        """
+        return self._readonly_var.get()
+
+    @_readonly.setter
+    def _readonly(self, new_state: bool) -> None:
+        """
+        Set whether edits are dropped.
+
+        :param new_state: A bool.
+        :return: None.
+        """
+        self._readonly_var.set(new_state)
+
+    def destroy(self) -> None:
+        """
+        Destroy this text and the command that proxies it.
+
+        :return: None.
+        """
+        if self._changes_after_id is not None:
+            self.after_cancel(self._changes_after_id)
+            self._changes_after_id = None
+        for saver in list(self._savers):
+            saver.stop(RuntimeError("The text was destroyed while saving!"))
+        super().destroy()
         try:
-            if command in ("insert", "delete", "replace") and self._readonly:
-                return
-            result = self.tk.call(cmd)
+            self.tk.call("interp", "alias", "", self._w, "")
         except tk.TclError:
+            pass
+
+    def unbind(self, sequence: str, funcid: str = None) -> None:
+        """
+        Unbind a sequence. With a funcid, only that callback is removed and
+        the other bindings of the sequence stay, unlike tk.Misc.unbind before
+        Python 3.13, which removes all of them.
+
+        :param sequence: The sequence, ex. "<<TextModified>>".
+        :param funcid: The id bind returned for the callback to remove.
+         Defaults to None, which removes every binding of the sequence.
+        :return: None.
+        """
+        if funcid is None:
+            super().unbind(sequence)
             return
-        if command in ("insert", "delete", "replace"):
-            self.event_generate("<<TextModified>>")
-        return result
+        prefix = f'if {{"[{funcid} '
+        lines = self.tk.call("bind", self._w, sequence).split("\n")
+        keep = "\n".join(line for line in lines if not line.startswith(prefix))
+        if not keep.strip():
+            keep = ""
+        self.tk.call("bind", self._w, sequence, keep)
+        self.deletecommand(funcid)
 
     @property
     def text(self) -> str:
@@ -89,22 +334,296 @@ class Text(tk.Text):
     @text.setter
     def text(self, new_text: str) -> None:
         """
-        Set the text on this entry.
+        Set the text on this entry. This cancels a load that is still
+        running.
+
+        :param new_text: The new text.
+        :return: None.
+        """
+        self._cancel_load()
+        if self.diff_on_assign:
+            self._edit_anyway(lambda: self._apply_line_diff(new_text))
+        else:
+            self._edit_anyway(
+                lambda: self.delete("1.0", tk.END),
+                lambda: self.insert("1.0", new_text),
+            )
+
+    def _apply_line_diff(self, new_text: str) -> None:
+        """
+        Change only the lines that are different from new_text, as one step
+        that can be undone.
 
         :param new_text: The new text.
         :return: None.
         """
+        old_lines = self.get("1.0", "end-1c").split("\n")
+        new_lines = new_text.split("\n")
+        edits = Diff.sequence_edits(old_lines, new_lines)
+        if not edits:
+            return
+        autoseparators = self.cget("autoseparators")
+        self.configure(autoseparators=False)
+        self.edit_separator()
+        for _, i1, i2, j1, j2 in reversed(edits):
+            if i2 < len(old_lines):
+                # Whole lines with their newlines
+                start, end = f"{i1 + 1}.0", f"{i2 + 1}.0"
+                chars = "".join(line + "\n" for line in new_lines[j1:j2])
+            elif i1 > 0:
+                # Up to the end, so take the newline before instead
+                start, end = f"{i1}.end", "end-1c"
+                chars = "".join("\n" + line for line in new_lines[j1:j2])
+            else:
+                start, end = "1.0", "end-1c"
+                chars = "\n".join(new_lines[j1:j2])
+            if not chars:
+                self.delete(start, end)
+            elif i2 > i1:
+                self.replace(start, end, chars)
+            else:
+                self.insert(start, chars)
+        self.edit_separator()
+        self.configure(autoseparators=autoseparators)
+
+    def _edit_anyway(self, *edits: Callable[[], None]) -> None:
+        """
+        Make edits even if this text is disabled or read only, if
+        enable_automatically is True.
+
+        :param edits: Functions that edit the text.
+        :return: None.
+        """
         last_state = "read_only" if self._readonly else self["state"]
         if self.enable_automatically:
             self.enabled = True
-        self.delete("1.0", tk.END)
-        self.insert("1.0", new_text)
+        for edit in edits:
+            edit()
         if self.enable_automatically:
             if last_state == "read_only":
                 self.read_only = True
             else:
                 self.configure(state=last_state)
 
+    def load_stream(
+        self,
+        source: Union[TextIO, Iterable[str]],
+        chunk_size: int = 65_536,
+        replace: bool = True,
+        budget: int = 10,
+        max_pending: int = 16,
+        on_progress: Callable[[int], None] = None,
+        on_done: Callable[[Union[BaseException, None]], None] = None,
+    ) -> "TextLoader":
+        """
+        Load text into this text without freezing the GUI. The source is read
+        in a thread and the text is inserted a bit at a time when Tk is idle.
+        Undo is turned off while loading. A load that is still running is
+        cancelled first.
+
+        :param source: A file opened in text mode or an iterable of str, like
+         a list of lines.
+        :param chunk_size: About how many characters to insert at once.
+         Defaults to 65,536.
+        :param replace: Whether to remove the text that is already here
+         first. Defaults to True.
+        :param budget: How many milliseconds to spend inserting before letting
+         Tk handle other events. Defaults to 10.
+        :param max_pending: How many chunks can be read ahead. Defaults to
+         16.
+        :param on_progress: A function that is called with the number of
+         characters loaded so far. Defaults to None.
+        :param on_done: A function that is called when everything is loaded,
+         with the exception if reading failed or None. It is not called if
+         the load is cancelled. Defaults to None.
+        :return: A TextLoader, which can cancel the load.
+        """
+        self._cancel_load()
+        if replace:
+            self.text = ""
+        self._loader = TextLoader(
+            self, source, chunk_size, budget, max_pending, on_progress, on_done
+        )
+        return self._loader
+
+    @property
+    def loading(self) -> bool:
+        """
+        Get whether a load started with load_stream is still running.
+
+        :return: A bool.
+        """
+        return self._loader is not None and not (
+            self._loader.done or self._loader.cancelled
+        )
+
+    def _cancel_load(self) -> None:
+        """
+        Cancel the load started with load_stream if it is still running.
+
+        :return: None.
+        """
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+
+    def iter_chunks(
+        self, chunk_size: int = 65_536, start: str = "1.0", end: str = "end-1c"
+    ) -> Iterator[str]:
+        """
+        Get the text a bit at a time, so a big text doesn't have to be copied
+        into one str. Don't change the text while iterating.
+
+        :param chunk_size: How many characters to get at once. Defaults to
+         65,536.
+        :param start: The index to start at. Defaults to "1.0".
+        :param end: The index to stop at. Defaults to "end-1c", which leaves
+         out the newline that Tk always adds at the end.
+        :return: An iterator of str.
+        """
+        index = self.index(start)
+        end = self.index(end)
+        while self.compare(index, "<", end):
+            next_index = self.index(f"{index} + {chunk_size} chars")
+            if self.compare(next_index, ">", end):
+                next_index = end
+            yield self.get(index, next_index)
+            index = next_index
+
+    def iter_lines(self, lines_per_chunk: int = 1000) -> Iterator[str]:
+        """
+        Get the text line by line. The lines are read from Tk a bunch at a
+        time. Don't change the text while iterating.
+
+        :param lines_per_chunk: How many lines to get from Tk at once.
+         Defaults to 1000.
+        :return: An iterator of str, which end with a newline except maybe the
+         last one.
+        """
+        last_line = int(self.index("end-1c").split(".")[0])
+        for first_line in range(1, last_line + 1, lines_per_chunk):
+            stop_line = first_line + lines_per_chunk
+            end = f"{stop_line}.0" if stop_line <= last_line else "end-1c"
+            *lines, rest = self.get(f"{first_line}.0", end).split("\n")
+            for line in lines:
+                yield line + "\n"
+            if rest:
+                yield rest
+
+    def save_to(
+        self,
+        path: Union[str, Path],
+        encoding: str = "utf-8",
+        chunk_size: int = 65_536,
+        in_background: bool = False,
+        on_done: Callable[[Union[BaseException, None]], None] = None,
+    ) -> Union[Future, None]:
+        """
+        Write the text to a file a bit at a time, without the newline that Tk
+        always adds at the end. Raises RuntimeError if a load started with
+        load_stream is still running, because only part of the text is there.
+
+        :param path: Where to save to. Should be a str or a pathlib.Path
+        :param encoding: The encoding to use. Defaults to "utf-8".
+        :param chunk_size: How many characters to write at once. Defaults to
+         65,536.
+        :param in_background: Whether to write in the background with
+         MainWindow.run_in_background. The chunks are read on the Tk thread a
+         few at a time, as the file is written. If the text is edited while
+         saving, the part that isn't read yet is copied right before the
+         edit, so the file still gets the text as it was when saving started.
+         The main window must be a TkZero.MainWindow.MainWindow, otherwise
+         RuntimeError is raised. Defaults to False.
+        :param on_done: A function that is called when the file is written,
+         with the exception if writing failed or None. The exception is then
+         not raised. Defaults to None, which raises it, or reports it like
+         any other Tk callback when saving in the background.
+        :return: A concurrent.futures.Future if saving in the background,
+         otherwise None.
+        """
+
+        def write(chunks: Iterable[str]) -> None:
+            with Path(path).open(mode="w", encoding=encoding) as file:
+                for chunk in chunks:
+                    file.write(chunk)
+
+        def write_in_background(saver: _TextSaver) -> None:
+            try:
+                write(saver)
+            finally:
+                saver.close()
+
+        if self.loading:
+            raise RuntimeError("The text is still loading!")
+        if not in_background:
+            try:
+                write(self.iter_chunks(chunk_size))
+            except Exception as error:
+                if on_done is None:
+                    raise
+                on_done(error)
+            else:
+                if on_done is not None:
+                    on_done(None)
+            return None
+        if not hasattr(self._root(), "run_in_background"):
+            raise RuntimeError(
+                "run_in_background needs the main window to be a "
+                "TkZero.MainWindow.MainWindow!"
+            )
+        saver = _TextSaver(self, chunk_size)
+        try:
+            return self._root().run_in_background(
+                write_in_background,
+                saver,
+                on_done=None if on_done is None else lambda _: on_done(None),
+                on_error=on_done,
+                owner=self.winfo_toplevel(),
+            )
+        except RuntimeError:
+            saver.stop()
+            raise
+
+    def _add_saver(self, saver: "_TextSaver") -> None:
+        """
+        Have a background save copy the rest of the text before it is edited.
+
+        :param saver: The _TextSaver.
+        :return: None.
+        """
+        if self._before_edit_command is None:
+            self._before_edit_command = self.register(self._before_edit)
+        if not self._savers:
+            self.tk.call(
+                "set",
+                f"::tkzero::textBeforeEdit({self._orig})",
+                self._before_edit_command,
+            )
+        self._savers.append(saver)
+
+    def _remove_saver(self, saver: "_TextSaver") -> None:
+        """
+        Forget a background save that has read everything it needs.
+
+        :param saver: The _TextSaver.
+        :return: None.
+        """
+        self._savers.remove(saver)
+        if not self._savers:
+            self.tk.call(
+                "unset", "-nocomplain", f"::tkzero::textBeforeEdit({self._orig})"
+            )
+
+    def _before_edit(self) -> None:
+        """
+        Called from Tcl right before the text is edited while saving in the
+        background.
+
+        :return: None.
+        """
+        for saver in list(self._savers):
+            saver.copy_rest()
+
     @property
     def cursor(self) -> str:
         """
@@ -189,54 +708,15 @@ class Text(tk.Text):
         """
         self._hovering_over = is_hovering
 
-    def _make_context_menu(self) -> None:
+    @property
+    def _context_menu(self) -> ContextMenu:
         """
-        Initiate the context menu.
+        Get the context menu of this text. It is shared with the other
+        widgets in the same window and built the first time it is needed.
 
-        :return: None.
+        :return: A TkZero.ContextMenu.ContextMenu.
         """
-        self._context_menu = tk.Menu(self, tearoff=0)
-        self._context_menu.add_command(
-            label="Undo",
-            command=self.undo_contents,
-            underline=0,
-            accelerator="Command-Z" if on_aqua(self) else "Control+Z",
-        )
-        self._context_menu.add_command(
-            label="Redo",
-            command=self.redo_contents,
-            underline=0,
-            accelerator="Command-Y" if on_aqua(self) else "Control+Y",
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Copy",
-            command=self.copy_contents,
-            underline=0,
-            accelerator="Command-C" if on_aqua(self) else "Control+C",
-        )
-        self._context_menu.add_command(
-            label="Cut",
-            command=self.cut_contents,
-            accelerator="Command-X" if on_aqua(self) else "Control+X",
-        )
-        self._context_menu.add_command(
-            label="Paste",
-            command=self.paste_contents,
-            underline=0,
-            accelerator="Command-V" if on_aqua(self) else "Control+V",
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Delete", command=self.delete_contents, accelerator="Delete"
-        )
-        self._context_menu.add_separator()
-        self._context_menu.add_command(
-            label="Select all",
-            command=self.select_all_contents,
-            underline=7,
-            accelerator="Command-A" if on_aqua(self) else "Control+A",
-        )
+        return context_menu_for(self, ContextMenuKinds.Text)
 
     def _update_context_menu_states(self) -> None:
         """
@@ -389,3 +869,254 @@ class Text(tk.Text):
         :return: None.
         """
         self.tk.call(self, "edit", "separator")
+
+
+class TextLoader:
+    """
+    A load started by Text.load_stream.
+    """
+
+    def __init__(
+        self,
+        text: Text,
+        source: Union[TextIO, Iterable[str]],
+        chunk_size: int,
+        budget: int,
+        max_pending: int,
+        on_progress: Union[Callable[[int], None], None],
+        on_done: Union[Callable[[Union[BaseException, None]], None], None],
+    ):
+        """
+        Start loading. Use Text.load_stream instead of this.
+
+        :param text: The TkZero.Text.Text to load into.
+        :param source: A file opened in text mode or an iterable of str.
+        :param chunk_size: About how many characters to insert at once.
+        :param budget: How many milliseconds to spend inserting at once.
+        :param max_pending: How many chunks can be read ahead.
+        :param on_progress: A function that is called with the number of
+         characters loaded so far or None.
+        :param on_done: A function that is called when everything is loaded
+         or None.
+        """
+        self.text = text
+        self.chunk_size = chunk_size
+        self.budget = budget
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.loaded = 0
+        self.done = False
+        self.cancelled = False
+        self._error = None
+        # Chunks read by the thread, ending with None when it is done
+        self._chunks = deque()
+        self._space = Semaphore(max_pending)
+        self._undo = self.text.cget("undo")
+        self.text.configure(undo=False)
+        Thread(target=self._read, args=(source,), daemon=True).start()
+        self._after_id = self.text.after_idle(self._insert)
+        # The job that waits for the thread when there is nothing to insert
+        self._poll_job: Union[Job, None] = None
+
+    def _read(self, source: Union[TextIO, Iterable[str]]) -> None:
+        """
+        Read the source. This runs in its own thread.
+
+        :param source: A file opened in text mode or an iterable of str.
+        :return: None.
+        """
+        try:
+            if hasattr(source, "read"):
+                chunks = iter(lambda: source.read(self.chunk_size), "")
+            else:
+                chunks = iter(source)
+            for chunk in chunks:
+                self._space.acquire()
+                if self.cancelled:
+                    return
+                self._chunks.append(chunk)
+        except Exception as error:
+            self._error = error
+        self._chunks.append(None)
+
+    def _insert(self) -> None:
+        """
+        Insert what has been read until the budget runs out.
+
+        :return: None.
+        """
+        self._after_id = None
+        self._poll_job = None
+        if self.cancelled:
+            return
+        if not self.text.winfo_exists():
+            self.cancel()
+            return
+        deadline = perf_counter() + self.budget / 1000
+        finished = False
+        loaded = self.loaded
+        while not finished and self._chunks and perf_counter() < deadline:
+            parts = []
+            size = 0
+            while self._chunks and size < self.chunk_size:
+                chunk = self._chunks.popleft()
+                if chunk is None:
+                    finished = True
+                    break
+                self._space.release()
+                parts.append(chunk)
+                size += len(chunk)
+            if parts:
+                self.text._edit_anyway(lambda: self.text.insert(tk.END, "".join(parts)))
+                self.loaded += size
+        if self.on_progress is not None and self.loaded != loaded:
+            self.on_progress(self.loaded)
+        if finished:
+            self.done = True
+            self._restore_undo()
+            if self.on_done is not None:
+                self.on_done(self._error)
+        elif self._chunks:
+            self._after_id = self.text.after_idle(self._insert)
+        else:
+            # Wait for the thread without keeping Tk busy
+            self._poll_job = Scheduler.of(self.text).call_later(
+                10, self._insert, pausable=False
+            )
+
+    def _restore_undo(self) -> None:
+        """
+        Turn undo back on.
+
+        :return: None.
+        """
+        if self.text.winfo_exists():
+            self.text.configure(undo=self._undo)
+            self.text.edit_reset()
+
+    def cancel(self) -> None:
+        """
+        Stop loading. What was already inserted stays.
+
+        :return: None.
+        """
+        if self.done or self.cancelled:
+            return
+        self.cancelled = True
+        if self._after_id is not None:
+            self.text.after_cancel(self._after_id)
+            self._after_id = None
+        if self._poll_job is not None:
+            self._poll_job.cancel()
+            self._poll_job = None
+        # Wake the thread up if it is waiting for space
+        self._space.release()
+        self._restore_undo()
+
+
+class _TextSaver:
+    """
+    Hands the text of a Text to a worker thread a chunk at a time. The chunks
+    are read on the Tk thread with MainWindow.post, so the text is never
+    copied all at once. Iterate over it on the worker thread.
+    """
+
+    def __init__(self, text: Text, chunk_size: int, read_ahead: int = 16):
+        """
+        Start reading. Use Text.save_to instead of this.
+
+        :param text: The TkZero.Text.Text to save.
+        :param chunk_size: How many characters to read at once.
+        :param read_ahead: How many chunks can be read ahead. Defaults to 16.
+        """
+        self.text = text
+        self.chunk_size = chunk_size
+        self.read_ahead = read_ahead
+        self.done = False
+        self._index = text.index("1.0")
+        self._end = text.index("end-1c")
+        self._post = text._root().post
+        # Chunks for the worker, ending with None or an exception
+        self._chunks = Queue()
+        text._add_saver(self)
+        self._read()
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Get the chunks. This runs in the worker thread.
+
+        :return: An iterator of str.
+        """
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, BaseException):
+                raise chunk
+            self._post(self._read, key=self)
+            yield chunk
+
+    def _read(self) -> None:
+        """
+        Read chunks until read_ahead of them are waiting.
+
+        :return: None.
+        """
+        if self.done:
+            return
+        text = self.text
+        while self._chunks.qsize() < self.read_ahead:
+            if text.compare(self._index, ">=", self._end):
+                self._finish(None)
+                return
+            next_index = text.index(f"{self._index} + {self.chunk_size} chars")
+            if text.compare(next_index, ">", self._end):
+                next_index = self._end
+            self._chunks.put(text.get(self._index, next_index))
+            self._index = next_index
+
+    def copy_rest(self) -> None:
+        """
+        Copy everything that isn't read yet, because the text is about to be
+        edited.
+
+        :return: None.
+        """
+        if not self.done:
+            self._chunks.put(self.text.get(self._index, self._end))
+            self._finish(None)
+
+    def stop(self, error: BaseException = None) -> None:
+        """
+        Stop reading.
+
+        :param error: An exception for the worker to raise instead of getting
+         more chunks. Defaults to None.
+        :return: None.
+        """
+        if not self.done:
+            self._finish(error)
+
+    def close(self) -> None:
+        """
+        Stop reading once the worker is done with the chunks, even if it
+        stopped early. This runs in the worker thread.
+
+        :return: None.
+        """
+        try:
+            self._post(self.stop)
+        except RuntimeError:
+            # The main window is gone, and so is the text
+            pass
+
+    def _finish(self, last: Union[BaseException, None]) -> None:
+        """
+        Stop reading.
+
+        :param last: What the worker gets last, None or an exception.
+        :return: None.
+        """
+        self.done = True
+        self._chunks.put(last)
+        self.text._remove_saver(self)
@@ -4,6 +4,8 @@ Attach a tool tip to widgets.
 
 import tkinter as tk
 
+from TkZero.Scheduler import Scheduler
+
 
 # The following classes were copied directly from idlelib.tooltip.py
 # You can usually find the implementation if you installed it at:
@@ -105,7 +107,7 @@ class _OnHoverTooltipBase(_TooltipBase):
         super(_OnHoverTooltipBase, self).__init__(anchor_widget)
         self.hover_delay = hover_delay
 
-        self._after_id = None
+        self._job = None
         self._id1 = self.anchor_widget.bind("<Enter>", self._show_event)
         self._id2 = self.anchor_widget.bind("<Leave>", self._hide_event)
         self._id3 = self.anchor_widget.bind("<Button>", self._hide_event)
@@ -133,14 +135,17 @@ class _OnHoverTooltipBase(_TooltipBase):
     def schedule(self):
         """schedule the future display of the tooltip"""
         self.unschedule()
-        self._after_id = self.anchor_widget.after(self.hover_delay, self.showtip)
+        # Not pausable, the tooltip may be in a window other than the main one
+        self._job = Scheduler.of(self.anchor_widget).call_later(
+            self.hover_delay, self.showtip, pausable=False
+        )
 
     def unschedule(self):
         """cancel the future display of the tooltip"""
-        after_id = self._after_id
-        self._after_id = None
-        if after_id:
-            self.anchor_widget.after_cancel(after_id)
+        job = self._job
+        self._job = None
+        if job is not None:
+            job.cancel()
 
     def hidetip(self):
         """hide the tooltip"""
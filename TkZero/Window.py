@@ -3,12 +3,15 @@ Create an additional window. Note that you will first need to initiate a main
 window to pass in!
 """
 
+import asyncio
 import tkinter as tk
-from threading import Thread
-from typing import Union, Callable, List, Tuple
+from concurrent.futures import Future
+from typing import Union, Callable, List, Tuple, Any
 
 from TkZero import Platform
 from TkZero import Vector
+from TkZero.Enable import enable_children
+from TkZero.Hover import track_hover
 
 
 class Window(tk.Toplevel):
@@ -29,9 +32,19 @@ class Window(tk.Toplevel):
         self.protocol("WM_DELETE_WINDOW", self.close)
         self._on_close = None
         self._enabled = True
+        # The size and position from the last <Configure> event as
+        # (width, height, x, y). The bindtag goes before the instance tag so
+        # that it is up to date in the handlers bound to the window.
+        self._geometry = None
+        if not self.bind_class("TkZeroGeometry", "<Configure>"):
+            self.bind_class(
+                "TkZeroGeometry",
+                "<Configure>",
+                lambda event: event.widget._remember_geometry(),
+            )
+        self.bindtags(("TkZeroGeometry",) + self.bindtags())
         self._hovering_over = False
-        self.bind("<Enter>", lambda _: self._set_hover_state(True))
-        self.bind("<Leave>", lambda _: self._set_hover_state(False))
+        track_hover(self)
 
     @property
     def title(self) -> str:
@@ -52,15 +65,43 @@ class Window(tk.Toplevel):
         """
         self.wm_title(new_title)
 
+    def _remember_geometry(self) -> None:
+        """
+        Read the size and position of the window from Tk.
+
+        :return: None.
+        """
+        self._geometry = (
+            self.winfo_width(),
+            self.winfo_height(),
+            self.winfo_x(),
+            self.winfo_y(),
+        )
+
+    def get_size(self, refresh: bool = False) -> Vector.Size:
+        """
+        Return the size of the window. This is remembered from the last time
+        the window was configured, so reading it doesn't process any events.
+
+        :param refresh: Whether to let Tk finish pending geometry changes
+         (with update_idletasks, which doesn't run event handlers) and read
+         the size again. Defaults to False.
+        :return: A TkZero.Vector.Size with the width and height attributes.
+        """
+        if refresh or self._geometry is None:
+            self.update_idletasks()
+            self._remember_geometry()
+        return Vector.Size(width=self._geometry[0], height=self._geometry[1])
+
     @property
     def size(self) -> Vector.Size:
         """
-        Return the size of the window.
+        Return the size of the window. Use get_size(refresh=True) if you need
+        to read it from Tk again.
 
         :return: A TkZero.Vector.Size with the width and height attributes.
         """
-        self.update()
-        return Vector.Size(width=self.winfo_width(), height=self.winfo_height())
+        return self.get_size()
 
     @size.setter
     def size(self, new_size: Union[Vector.Size, Tuple[int, int]]) -> None:
@@ -71,21 +112,37 @@ class Window(tk.Toplevel):
         height attributes set to the size you want.
         :return: None.
         """
-        if isinstance(new_size, tuple):
-            self.geometry(f"{new_size[0]}x{new_size[1]}")
-        else:
-            self.geometry(f"{new_size.width}x{new_size.height}")
-        self.update()
+        width, height = new_size
+        self.geometry(f"{width}x{height}")
+        if self._geometry is None:
+            self._remember_geometry()
+        self._geometry = (width, height) + self._geometry[2:]
+
+    def get_position(self, refresh: bool = False) -> Vector.Position:
+        """
+        Return the position of the window. This is remembered from the last
+        time the window was configured, so reading it doesn't process any
+        events.
+
+        :param refresh: Whether to let Tk finish pending geometry changes
+         (with update_idletasks, which doesn't run event handlers) and read
+         the position again. Defaults to False.
+        :return: A TkZero.Vector.Position with the x and y attributes.
+        """
+        if refresh or self._geometry is None:
+            self.update_idletasks()
+            self._remember_geometry()
+        return Vector.Position(x=self._geometry[2], y=self._geometry[3])
 
     @property
     def position(self) -> Vector.Position:
         """
-        Return the position of the window.
+        Return the position of the window. Use get_position(refresh=True) if
+        you need to read it from Tk again.
 
         :return: A TkZero.Vector.Position with the x and y attributes.
         """
-        self.update()
-        return Vector.Position(x=self.winfo_x(), y=self.winfo_y())
+        return self.get_position()
 
     @position.setter
     def position(self, new_position: Union[Vector.Position, Tuple[int, int]]) -> None:
@@ -96,16 +153,11 @@ class Window(tk.Toplevel):
          x and y attributes.
         :return: None.
         """
-        if isinstance(new_position, tuple):
-            self.geometry(
-                f"{self.size.width}x{self.size.height}+"
-                f"{new_position[0]}+{new_position[1]}"
-            )
-        else:
-            self.geometry(
-                f"{self.size.width}x{self.size.height}+"
-                f"{new_position.x}+{new_position.y}"
-            )
+        x, y = new_position
+        self.geometry(f"+{x}+{y}")
+        if self._geometry is None:
+            self._remember_geometry()
+        self._geometry = self._geometry[:2] + (x, y)
 
     @property
     def minimized(self) -> bool:
@@ -210,10 +262,12 @@ class Window(tk.Toplevel):
 
         :param event: A str of the event.
         :param func: A function to call when the even happens. If none is
-         passed in then a list of binds will be returned.
-        :param run_in_thread: Whether to run the function in a thread when
-         called. No arguments will be passed in. It will also be made as a
-         daemon thread. (will be terminated if main thread terminates)
+         passed in then a list of binds will be returned. This can also be an
+         async function, which will be run as a task on the loop started by
+         MainWindow.run_async.
+        :param run_in_thread: Whether to run the function in the background
+         with run_in_background when called. No arguments will be passed in.
+         This needs the main window to be a TkZero.MainWindow.MainWindow.
         :param add: Whether to add the function to a list of functions to be
          called or replace the function that was previously bound to this
          sequence if any.
@@ -221,12 +275,46 @@ class Window(tk.Toplevel):
          when this event is triggered or None when binding one.
         """
         if run_in_thread:
-            func = Thread(target=func, args=(), daemon=True).start
+            target = func
+            func = lambda _: self.run_in_background(target)
+        elif asyncio.iscoroutinefunction(func):
+            target = func
+            func = lambda event: self._root().create_task(target(event))
         binds = self.bind(event, func, add)
         if binds is not None and type(binds) is not list:
             binds = [binds]
         return binds
 
+    def run_in_background(
+        self,
+        func: Callable,
+        *args: Any,
+        on_done: Callable[[Any], None] = None,
+        on_error: Callable[[BaseException], None] = None,
+    ) -> Future:
+        """
+        Run a function in the pool of the main window and call back on the Tk
+        thread when it finishes. The task is owned by this window, so it is
+        cancelled when this window is closed. The main window must be a
+        TkZero.MainWindow.MainWindow, otherwise RuntimeError is raised.
+
+        :param func: The function to run in the background.
+        :param args: The arguments to pass to the function.
+        :param on_done: A function that will be called on the Tk thread with
+         the result of func. Defaults to None.
+        :param on_error: A function that will be called on the Tk thread with
+         the exception if func raised one. Defaults to None.
+        :return: A concurrent.futures.Future.
+        """
+        if not hasattr(self._root(), "run_in_background"):
+            raise RuntimeError(
+                "run_in_background needs the main window to be a "
+                "TkZero.MainWindow.MainWindow!"
+            )
+        return self._root().run_in_background(
+            func, *args, on_done=on_done, on_error=on_error, owner=self
+        )
+
     def generate_event(self, event: str) -> None:
         """
         Generate an event.
@@ -236,33 +324,6 @@ class Window(tk.Toplevel):
         """
         self.event_generate(event)
 
-    def _enable_children(
-        self,
-        parent: Union[tk.Widget, Union[tk.Toplevel, None]] = None,
-        enable: bool = True,
-    ) -> None:
-        """
-        Enable or disable the children.
-
-        :param parent: A tk.Widget that is our parent. If None then default to
-         self.
-        :param enable: Whether to enable or disable the children.
-        :return: None.
-        """
-        if parent is None:
-            parent = self
-        for child in parent.winfo_children():
-            if child.winfo_class() not in ("TFrame", "TLabelFrame"):
-                try:
-                    child.state(["!disabled" if enable else "disabled"])
-                except AttributeError:
-                    child.configure(state=tk.NORMAL if enable else tk.DISABLED)
-            else:
-                if hasattr(child, "enabled"):
-                    child.enabled = enable
-                else:
-                    self._enable_children(child, enable)
-
     @property
     def enabled(self) -> bool:
         """
@@ -284,7 +345,7 @@ class Window(tk.Toplevel):
         :return: None.
         """
         self._enabled = new_state
-        self._enable_children(enable=self._enabled)
+        enable_children(self, self._enabled)
 
     @property
     def hovering_over(self) -> bool:
@@ -325,6 +386,18 @@ class Window(tk.Toplevel):
         """
         self._on_close = new_func
 
+    def destroy(self) -> None:
+        """
+        Destroy the window and all of its children. This also cancels the
+        background tasks of this window.
+
+        :return: None.
+        """
+        cancel_background_tasks = getattr(self._root(), "cancel_background_tasks", None)
+        if cancel_background_tasks is not None:
+            cancel_background_tasks(self)
+        super().destroy()
+
     def close(self) -> None:
         """
         Close the window - this usually stops the whole program.